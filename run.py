@@ -4,48 +4,81 @@ import os
 # Custom module path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PySide6.QtWidgets import QApplication
+# 시작 시간 측정 (--profile-startup[=경로] 또는 SCHEDULE_MAKER_PROFILE, 무거운 import보다 먼저 설정)
+from schedule_maker.core.profiling import profiler
+
+
+def _app_paths():
+    """(리소스 경로, 데이터 경로)"""
+    # PyInstaller Path Handling
+    if getattr(sys, 'frozen', False):
+        # EXE location for data storage
+        return sys._MEIPASS, os.path.dirname(sys.executable)
+    # Script location
+    resource_path = os.path.dirname(os.path.abspath(__file__))
+    return resource_path, resource_path
+
+
+RESOURCE_PATH, DATA_PATH = _app_paths()
+profiler.configure(sys.argv, default_dir=os.path.join(DATA_PATH, 'data'))
+
+with profiler.phase('import.qt'):
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt, QCoreApplication, QTimer
 
 def main():
+    # QtWebEngine은 결과 화면에서 필요할 때 가져오므로 QApplication 생성 전에 설정해야 함
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
     # Initialize PySide6 App (Must be first)
-    app = QApplication(sys.argv)
+    with profiler.phase('qt.application'):
+        app = QApplication(sys.argv)
 
     # Defer imports to avoid early QWidget creation
-    from schedule_maker.controllers.app_controller import AppController
-    from schedule_maker.ui.main_window import MainWindow
-    # ConfigInterface imported inside MainWindow typically, but if needed here for check:
-    # from schedule_maker.ui.interfaces.config_interface import ConfigInterface 
-    
-    from qfluentwidgets import setTheme, Theme, qconfig
-    
+    with profiler.phase('import.app'):
+        from schedule_maker.controllers.app_controller import AppController
+        from schedule_maker.ui.main_window import MainWindow
+        # ConfigInterface imported inside MainWindow typically, but if needed here for check:
+        # from schedule_maker.ui.interfaces.config_interface import ConfigInterface
+
+        from qfluentwidgets import setTheme, Theme, qconfig
+
     # Force Light Theme
-    qconfig.theme = Theme.LIGHT
-    qconfig.save() 
-    setTheme(Theme.LIGHT)
+    with profiler.phase('theme'):
+        qconfig.theme = Theme.LIGHT
+        qconfig.save()
+        setTheme(Theme.LIGHT)
+
+    resource_path, data_path = RESOURCE_PATH, DATA_PATH
 
-    # PyInstaller Path Handling
-    if getattr(sys, 'frozen', False):
-        resource_path = sys._MEIPASS
-        # EXE location for data storage
-        data_path = os.path.dirname(sys.executable)
-    else:
-        # Script location
-        resource_path = os.path.dirname(os.path.abspath(__file__))
-        data_path = resource_path
-        
     # Ensure data directory exists
     os.makedirs(os.path.join(data_path, 'data'), exist_ok=True)
-    
-    # Initialize Controller
-    controller = AppController(resource_path=resource_path, data_path=data_path)
-    if not controller.initialize():
+
+    # Initialize Controller (설정만 로드, 강의 CSV는 창을 띄운 뒤 백그라운드에서)
+    with profiler.phase('controller.initialize'):
+        controller = AppController(resource_path=resource_path, data_path=data_path)
+        initialized = controller.initialize(load_catalog=False)
+    if not initialized:
         print("Failed to initialize application.")
         return
 
     # Create Main Window
-    window = MainWindow(controller)
-    window.show()
-    
+    with profiler.phase('main_window'):
+        window = MainWindow(controller)
+    with profiler.phase('main_window.show'):
+        window.show()
+    profiler.mark('window_shown')
+
+    # 강의 데이터까지 준비되면 시작 시간 보고서 저장 (측정을 켠 경우)
+    def on_catalog_loaded(ok):
+        profiler.mark('catalog_ready')
+        profiler.write_report()
+    window.catalogLoaded.connect(on_catalog_loaded)
+
+    # 첫 화면을 그린 뒤 강의 데이터 로드 시작
+    QTimer.singleShot(0, lambda: profiler.mark('first_paint'))
+    QTimer.singleShot(0, window.start_catalog_load)
+
     sys.exit(app.exec())
 
 if __name__ == "__main__":
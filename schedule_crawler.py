@@ -2,47 +2,60 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+import os
 import time
-from io import StringIO 
 
-# 브라우저 열기
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-driver.get("https://msi.mju.ac.kr/") 
+from schedule_maker.services.ingest import create_run_dir, ingest_pages
 
-print("🛑 [중요] 로그인하고 '시간표 조회' 화면까지 이동하세요!")
-print("🛑 준비되면 엔터(Enter)를 누르세요.")
-input() 
+# 페이지 원본만 빠르게 저장하고, 표 파싱은 ingest 단계에서 병렬로 처리
+# 실행마다 PAGE_DIR 아래 새 디렉토리에 저장 (이전 실행의 페이지는 섞이지 않음)
+PAGE_DIR = "pages"
 
-all_data = []
 
-# 1페이지부터 130페이지까지 한 땀 한 땀
-for page in range(1, 131):
-    print(f"📄 {page} / 130 페이지 수집 중...")
+def main():
+    # 브라우저 열기
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver.get("https://msi.mju.ac.kr/") 
+
+    print("🛑 [중요] 로그인하고 '시간표 조회' 화면까지 이동하세요!")
+    print("🛑 준비되면 엔터(Enter)를 누르세요.")
+    input() 
+
+    run_dir = create_run_dir(PAGE_DIR)
+
+    saved = 0
+
+    # 1페이지부터 130페이지까지 한 땀 한 땀
+    for page in range(1, 131):
+        print(f"📄 {page} / 130 페이지 저장 중...")
     
-    try:
-        # 1. 데이터 수집
-        dfs = pd.read_html(StringIO(driver.page_source))
-        real_table = max(dfs, key=len) 
-        all_data.append(real_table)
+        try:
+            # 1. 페이지 원본 저장
+            with open(os.path.join(run_dir, f"page_{page:03d}.html"), "w", encoding="utf-8") as f:
+                f.write(driver.page_source)
+            saved += 1
         
-        # 2. [핵심 수정] 버튼 클릭 대신 '페이지 이동 함수'를 강제 실행
-        # go_page(2), go_page(3)... 이렇게 직접 명령을 내립니다.
-        driver.execute_script(f"go_page({page + 1})") 
+            # 2. [핵심 수정] 버튼 클릭 대신 '페이지 이동 함수'를 강제 실행
+            # go_page(2), go_page(3)... 이렇게 직접 명령을 내립니다.
+            driver.execute_script(f"go_page({page + 1})") 
         
-        time.sleep(1) # 페이지 로딩 대기 (너무 빠르면 서버가 싫어함)
+            time.sleep(1) # 페이지 로딩 대기 (너무 빠르면 서버가 싫어함)
             
-    except Exception as e:
-        print(f"⚠️ {page}페이지에서 문제 발생 (아마 마지막 페이지?): {e}")
-        break
-
-# 저장
-if all_data:
-    final_df = pd.concat(all_data, ignore_index=True)
-    # 중복 제거 (혹시 모르니)
-    final_df = final_df.drop_duplicates()
-    
-    final_df.to_csv("명지대_전체시간표_완성본.csv", index=False, encoding="utf-8-sig")
-    print(f"🎉 성공! 총 {len(final_df)}개 강의를 꽉 채워 담았습니다.")
-else:
-    print("❌ 데이터를 못 가져왔습니다.")
\ No newline at end of file
+        except Exception as e:
+            print(f"⚠️ {page}페이지에서 문제 발생 (아마 마지막 페이지?): {e}")
+            break
+
+    # 저장 (병렬 파싱 + 중복 제거)
+    # 이번 실행의 페이지만 있으면 브라우저 없이 다시 실행 가능:
+    #   python -m schedule_maker.services.ingest pages/<실행 디렉토리> 명지대_전체시간표_완성본.csv
+    if saved:
+        print(f"📁 페이지 저장 위치: {run_dir}")
+        result = ingest_pages(run_dir, "명지대_전체시간표_완성본.csv")
+        print(f"🎉 성공! {result.summary()}")
+    else:
+        print("❌ 데이터를 못 가져왔습니다.")
+
+
+# 병렬 파싱 워커가 이 스크립트를 다시 import 해도 브라우저가 열리지 않도록 보호
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,14 @@ try:
     from ..services.course_service import CourseService
     from ..services.config_service import ConfigService
     from ..services.schedule_service import ScheduleService
+    from ..services.result_cache import ResultCache
+    from ..core.profiling import profiler
 except ImportError:
     from services.course_service import CourseService
     from services.config_service import ConfigService
     from services.schedule_service import ScheduleService
+    from services.result_cache import ResultCache
+    from core.profiling import profiler
 
 
 class AppController:
@@ -40,6 +44,7 @@ class AppController:
         """
         self.resource_path = resource_path
         self.data_path = data_path
+        self.csv_path = os.path.join(resource_path, 'mju_2026_1.csv')
         
         # 서비스 초기화 (의존성 주입 또는 기본 생성)
         # 하위 호환성: None이면 기존 방식대로 자동 생성
@@ -54,7 +59,11 @@ class AppController:
             self.config_service = config_service
             
         if schedule_service is None:
-            self.schedule_service = ScheduleService()
+            # 같은 설정으로 다시 생성하면 디스크에 저장된 결과를 사용 (재시작 후에도 유지)
+            self.schedule_service = ScheduleService(
+                course_service=self.course_service,
+                result_cache=ResultCache(os.path.join(data_path, 'data', 'cache'))
+            )
         else:
             self.schedule_service = schedule_service
         
@@ -65,26 +74,32 @@ class AppController:
         
         # 상태
         self.is_initialized = False
+        self.is_catalog_loaded = False
+        self.catalog_error = None  # 마지막 강의 CSV 로드 실패 메시지
     
-    def initialize(self):
-        """애플리케이션 초기화"""
+    def initialize(self, load_catalog: bool = True):
+        """
+        애플리케이션 초기화
+        
+        Args:
+            load_catalog: False면 설정만 로드 (강의 CSV는 창을 띄운 뒤 load_catalog()로 로드)
+        """
         if self.is_initialized:
-            return
+            return True
         
         # CSV 파일 로드 (리소스 경로에서)
-        csv_path = os.path.join(self.resource_path, 'mju_2026_1.csv')
-        if os.path.exists(csv_path):
-            try:
-                self.course_service.load_courses(csv_path)
-                print(f"✅ {self.course_service.get_course_count()}개 강의 로드 완료")
-            except Exception as e:
-                self._show_error('오류', f'CSV 파일 로드 실패:\n{e}')
-                return False
-        else:
-            self._show_error('오류', f'CSV 파일을 찾을 수 없습니다:\n{csv_path}')
+        if load_catalog and not self.load_catalog():
             return False
         
         # 설정 파일 로드 (데이터 경로에서)
+        with profiler.phase('controller.load_config'):
+            self._load_config()
+        
+        self.is_initialized = True
+        return True
+    
+    def _load_config(self):
+        """설정 파일 로드 (없으면 기본 설정 생성)"""
         config_path = os.path.join(self.data_path, 'data', 'config.json')
         try:
             if os.path.exists(config_path):
@@ -110,10 +125,87 @@ class AppController:
             self.config_service.create_default_config()
             # 오류 시에도 경로 설정
             self.config_service.save_config(path=config_path)
+    
+    def load_catalog(self, show_errors: bool = True) -> bool:
+        """
+        강의 CSV 로드 (pandas 파싱 포함, 백그라운드 스레드에서 호출 가능)
         
-        self.is_initialized = True
+        Args:
+            show_errors: 실패 시 바로 알림 (백그라운드 스레드에서는 False로 두고
+                         UI 스레드에서 catalog_error를 표시)
+        
+        Returns:
+            성공 여부
+        """
+        csv_path = self.csv_path
+        self.catalog_error = None
+        if not os.path.exists(csv_path):
+            self.catalog_error = f'CSV 파일을 찾을 수 없습니다:\n{csv_path}'
+        else:
+            try:
+                with profiler.phase('catalog.load'):
+                    self.course_service.load_courses(csv_path)
+            except Exception as e:
+                self.catalog_error = f'CSV 파일 로드 실패:\n{e}'
+        if self.catalog_error:
+            if show_errors:
+                self._show_error('오류', self.catalog_error)
+            return False
+        print(f"✅ {self.course_service.get_course_count()}개 강의 로드 완료")
+        self.is_catalog_loaded = True
         return True
     
+    def reload_catalog(self):
+        """
+        강의 CSV가 다시 내보내졌을 때 바뀐 분반만 반영 (읽기와 반영을 한 번에, 동기)
+        
+        Returns:
+            CatalogDiff (실패 시 None)
+        """
+        diff = self.read_catalog_changes()
+        if diff is None:
+            self._show_error('오류', self.catalog_error)
+            return None
+        return self.apply_catalog_changes(diff)
+    
+    def read_catalog_changes(self):
+        """
+        강의 CSV를 다시 읽어 현재 카탈로그와 비교 (백그라운드 스레드에서 호출, 카탈로그는 그대로)
+        
+        Returns:
+            CatalogDiff (실패 시 None, 메시지는 catalog_error)
+        """
+        try:
+            return self.course_service.read_changes(self.csv_path)
+        except Exception as e:
+            self.catalog_error = f'CSV 파일 재로드 실패:\n{e}'
+            return None
+    
+    def apply_catalog_changes(self, diff):
+        """
+        read_catalog_changes 결과 반영 (UI 스레드, 시간표 생성 중이 아닐 때)
+        
+        Returns:
+            CatalogDiff
+        """
+        if not diff.has_changes:
+            return diff
+        
+        self.course_service.apply_changes(diff)
+        print(f"🔄 강의 데이터 갱신: {diff.summary()}")
+        
+        # 변경된 분반을 포함하는 생성 결과만 무효화
+        if self.schedule_service.invalidate_courses(diff.changed_ids):
+            msg = f'강의 데이터가 갱신되었습니다.\n{diff.summary()}\n\n기존 결과에 변경된 강의가 포함되어 있어 다시 생성이 필요합니다.'
+            if self.main_window and hasattr(self.main_window, 'set_dirty'):
+                self.main_window.set_dirty(True)
+        else:
+            msg = f'강의 데이터가 갱신되었습니다.\n{diff.summary()}'
+        self._show_info('알림', msg)
+        
+        self.refresh_tabs()
+        return diff
+    
     def set_main_window(self, window):
         """메인 윈도우 참조 설정"""
         self.main_window = window
@@ -192,9 +284,6 @@ class AppController:
                 else:
                     msg = f'시간표 생성 완료!\n\n총 {len(schedules)}개 조합이 생성되었습니다.'
                 
-                if len(schedules) > 10000:
-                    msg += '\n\n(결과 파일에는 무작위 10,000개만 저장됩니다)'
-                
                 self._show_info('성공', msg)
                 
             except Exception as e:
@@ -3,7 +3,9 @@
 이수학점 범위, 필수/희망 강의 필터 관리
 """
 from dataclasses import dataclass
+from enum import Enum
 from typing import List, Optional, Tuple
+import hashlib
 import json
 import os
 try:
@@ -52,6 +54,10 @@ class CourseFilter:
         return (normalize(self.name) == normalize(other.name) and 
                 normalize(self.professor) == normalize(other.professor) and 
                 normalize(self.course_id) == normalize(other.course_id))
+
+    def key(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """캐시 키 (강좌번호, 강의명, 교수명 - 빈 문자열은 None으로 취급, __eq__와 같은 기준)"""
+        return (self.course_id or None, self.name or None, self.professor or None)
     
     def __str__(self):
         parts = []
@@ -96,6 +102,50 @@ class ScheduleConfig:
         import copy
         return copy.deepcopy(self)
 
+    def fingerprint(self) -> str:
+        """
+        설정 지문 (정규화한 JSON의 해시, 프로세스가 달라도 같은 설정이면 같은 값)
+        __eq__와 같은 기준: 필터는 순서 유지, 제외 요일/시간대는 순서 무관
+        """
+        canonical = json.dumps({
+            'credits': [self.min_credits, self.max_credits],
+            'required': [list(f.key()) for f in self.required_filters],
+            'desired': [list(f.key()) for f in self.desired_filters],
+            'excluded_days': sorted(set(self.excluded_days)),
+            'excluded_time_slots': sorted(list(slot) for slot in self.excluded_time_slots),
+        }, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ConfigChange(Enum):
+    """이전 설정 대비 변경 종류 (증분 재생성 판단용)"""
+    SAME = 'same'              # 변경 없음
+    TIGHTENING = 'tightening'  # 조건만 좁아짐 (이전 결과 중 일부가 그대로 유효)
+    OTHER = 'other'            # 그 외 (필터 변경, 조건 완화 등 → 새로 탐색)
+
+
+def classify_change(previous: ScheduleConfig, current: ScheduleConfig) -> ConfigChange:
+    """
+    설정 변경 분류
+
+    필수/희망 필터가 같고 제외 요일/시간대 추가, 최대 학점 축소만 있으면 TIGHTENING
+    (이전 결과 중 새 조건을 만족하는 조합은 모두 새 설정에서도 유효한 결과)
+    최소 학점을 올리면 생성기가 '전학년' 강의를 더 채워 이전 결과에 없던 조합이
+    생기므로 OTHER (이전 결과로 Warm Start 탐색)
+    """
+    if previous == current:
+        return ConfigChange.SAME
+    if (previous.required_filters != current.required_filters
+            or previous.desired_filters != current.desired_filters):
+        return ConfigChange.OTHER
+    if current.min_credits != previous.min_credits or current.max_credits > previous.max_credits:
+        return ConfigChange.OTHER
+    if not set(previous.excluded_days) <= set(current.excluded_days):
+        return ConfigChange.OTHER
+    if not {tuple(slot) for slot in previous.excluded_time_slots} <= {tuple(slot) for slot in current.excluded_time_slots}:
+        return ConfigChange.OTHER
+    return ConfigChange.TIGHTENING
+
 
 def load_config_from_json(filepath: str = "config.json") -> ScheduleConfig:
     """JSON 파일에서 설정 로드"""
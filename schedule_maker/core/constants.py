@@ -22,6 +22,10 @@ class UIConstants:
     CREDIT_SPIN_WIDTH = 60
     TIME_TABLE_DAY_COLUMN_WIDTH = 50
     
+    # 결과 탭: 네이티브 시간표 화면 사용 (False면 QWebEngineView 결과 화면)
+    # 내보낸 HTML 파일은 공유용으로 계속 생성
+    NATIVE_RESULT_VIEW = True
+    
     # 메시지 표시 시간 (ms)
     INFO_BAR_DURATION = 2000
     TIMER_DELAY = 100
@@ -77,6 +81,17 @@ class SchedulerConfig:
     # === Phase 전환 설정 ===
     MAX_PURE_FAILURES = 50           # Pure 모드에서 연속 실패 허용 횟수
     
+    # === 증분 재생성 설정 ===
+    # 조건만 좁힌 재생성에서 이전 결과 중 살아남은 조합이 이 개수 미만이면
+    # 이전 결과로 Warm Start해 추가 탐색
+    INCREMENTAL_MIN_RESULTS = 200
+    # Warm Start에서 DFS 시작점으로 쓸 이전 조합 최대 개수
+    WARM_START_MAX_SEEDS = 500
+    
+    # === 결과 점진 전달 (생성 중 결과 화면 갱신) ===
+    RESULT_STREAM_INTERVAL = 0.2     # 새 결과를 모아 전달하는 최소 간격 (초)
+    RESULT_STREAM_BATCH = 500        # 간격 전이라도 이 개수가 쌓이면 전달
+    
     # === 진행 상황 출력 주기 ===
     PROGRESS_REPORT_INTERVAL = 10    # N회 Restart마다 진행 상황 출력
 
@@ -128,6 +143,13 @@ class Weekday(Enum):
         return [day.value for day in cls]
 
 
+class SearchMode(Enum):
+    """강의 검색 방식"""
+    EXACT = 'exact'          # 부분 문자열 일치 (기본)
+    CHOSEONG = 'choseong'    # 초성 검색 (ㅇㅇㅎㅎ → 영어회화)
+    FUZZY = 'fuzzy'          # 오타 허용 (자모 단위 편집 거리)
+
+
 class SortState(Enum):
     """정렬 상태"""
     DEFAULT = 0     # 기본 (정렬 안 됨)
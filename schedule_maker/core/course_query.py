@@ -0,0 +1,265 @@
+"""
+강의 조건 검색 엔진
+학점/요일/시간대/대상 학년/이수구분/N/P 조건을 미리 계산한 비트맵(NumPy bool 배열)의
+AND/OR 연산으로 처리하고, 조건별 결과 개수(패싯)를 함께 계산
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+from .course_table import CourseTable
+from .models import DAYS_MAP, minutes_to_index, range_mask, time_to_minutes
+
+WEEKDAYS = ('월', '화', '수', '목', '금', '토', '일')
+
+
+@dataclass
+class CourseQuery:
+    """
+    강의 조건 (지정하지 않은 조건은 제한 없음)
+
+    같은 조건 안의 여러 값은 OR, 서로 다른 조건끼리는 AND
+    """
+    rows: Optional[np.ndarray] = None          # 대상 행 (예: 검색 결과, None이면 전체), 순서 유지
+    credits: Optional[Set[int]] = None         # 학점 값 중 하나
+    min_credits: Optional[int] = None
+    max_credits: Optional[int] = None
+    days: Optional[Set[str]] = None            # 해당 요일 중 하루라도 수업이 있음
+    only_days: Optional[Set[str]] = None       # 모든 수업이 해당 요일 안에 있음 (예: 화/목만)
+    time_window: Optional[Tuple[str, str]] = None  # 모든 수업이 이 시간대 안 ("09:00", "18:00")
+    grades: Optional[Set[str]] = None          # 대상 학년 값 (예: "1학년")
+    all_grade: Optional[bool] = None           # 전학년 대상 여부
+    categories: Optional[Set[str]] = None      # 이수구분 값
+    pass_fail: Optional[bool] = None           # N/P 과목 여부
+    professor: Optional[str] = None            # 교수명 부분 문자열 (대소문자 무시)
+
+
+@dataclass
+class QueryResult:
+    """조건 검색 결과"""
+    rows: np.ndarray
+    # 패싯: 조건 이름 → {값: 개수}
+    # 각 패싯 개수는 자기 조건만 뺀 나머지 조건을 적용한 기준 (다른 값을 골랐을 때의 결과 수)
+    facets: Dict[str, Dict] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class CourseQueryEngine:
+    """
+    CourseTable 위의 비트맵 인덱스
+
+    - 학점 값/요일/대상 학년/이수구분별 bool 배열을 카탈로그 버전마다 한 번만 생성
+    - 시간대 조건은 시간 패턴 단위로 판정 후 행으로 펼침 (패턴 수 ≪ 행 수)
+    """
+
+    def __init__(self, table: CourseTable, search_index=None):
+        """
+        Args:
+            table: 강의 카탈로그
+            search_index: CourseSearchIndex (교수명 조건용, None이면 교수명 조건 무시)
+        """
+        self.table = table
+        self._search_index = search_index
+        self._version = -1
+        self._credit_bitmaps: Dict[int, np.ndarray] = {}
+        self._day_bitmaps: Dict[str, np.ndarray] = {}
+        self._grade_bitmaps: Dict[int, np.ndarray] = {}
+        self._category_bitmaps: Dict[int, np.ndarray] = {}
+        self._window_patterns: Dict[Tuple[str, str], np.ndarray] = {}
+
+    # --- 비트맵 ---
+
+    def _sync(self):
+        """카탈로그가 바뀌었으면 비트맵 재생성"""
+        table = self.table
+        if self._version == table.version:
+            return
+        self._credit_bitmaps = {
+            int(value): table.credits == value for value in np.unique(table.credits)
+        }
+        self._day_bitmaps = {
+            day: (table.day_masks & (1 << DAYS_MAP[day])) != 0 for day in WEEKDAYS
+        }
+        self._grade_bitmaps = {}
+        self._category_bitmaps = {}
+        self._window_patterns = {}
+        self._version = table.version
+
+    def _code_bitmap(self, cache: Dict[int, np.ndarray], column: np.ndarray, code: int) -> np.ndarray:
+        bitmap = cache.get(code)
+        if bitmap is None:
+            bitmap = column == code
+            cache[code] = bitmap
+        return bitmap
+
+    def _any_of(self, bitmaps: Iterable[np.ndarray]) -> np.ndarray:
+        result = np.zeros(len(self.table.course_ids), dtype=bool)
+        for bitmap in bitmaps:
+            result |= bitmap
+        return result
+
+    def _credits_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        if query.credits is None and query.min_credits is None and query.max_credits is None:
+            return None
+        values = [
+            value for value in self._credit_bitmaps
+            if (query.credits is None or value in query.credits)
+            and (query.min_credits is None or value >= query.min_credits)
+            and (query.max_credits is None or value <= query.max_credits)
+        ]
+        return self._any_of(self._credit_bitmaps[value] for value in values)
+
+    def _days_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        mask = None
+        if query.days:
+            mask = self._any_of(self._day_bitmaps[day] for day in query.days if day in self._day_bitmaps)
+        if query.only_days:
+            outside = self._any_of(
+                self._day_bitmaps[day] for day in WEEKDAYS if day not in query.only_days
+            )
+            mask = ~outside if mask is None else (mask & ~outside)
+        return mask
+
+    def _time_window_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        if not query.time_window:
+            return None
+        start, end = query.time_window
+        table = self.table
+        fits = self._window_patterns.get(query.time_window)
+        if fits is None or len(fits) != len(table.patterns):
+            start_min, end_min = time_to_minutes(start), time_to_minutes(end)
+            window = 0
+            for day in WEEKDAYS:
+                window |= range_mask(minutes_to_index(day, start_min), minutes_to_index(day, end_min))
+            fits = np.array([(mask & ~window) == 0 for mask in table.pattern_masks], dtype=bool)
+            self._window_patterns[query.time_window] = fits
+        return fits[table.pattern_codes]
+
+    def _grades_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        mask = None
+        if query.grades:
+            table = self.table
+            codes = [table.grades.code_of(grade) for grade in query.grades]
+            mask = self._any_of(
+                self._code_bitmap(self._grade_bitmaps, table.grade_codes, code)
+                for code in codes if code is not None
+            )
+        if query.all_grade is not None:
+            all_grade = self.table.all_grade if query.all_grade else ~self.table.all_grade
+            mask = all_grade if mask is None else (mask & all_grade)
+        return mask
+
+    def _categories_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        if not query.categories:
+            return None
+        table = self.table
+        codes = [table.categories.code_of(category) for category in query.categories]
+        return self._any_of(
+            self._code_bitmap(self._category_bitmaps, table.category_codes, code)
+            for code in codes if code is not None
+        )
+
+    def _pass_fail_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        if query.pass_fail is None:
+            return None
+        return self.table.pass_fail if query.pass_fail else ~self.table.pass_fail
+
+    def _professor_mask(self, query: CourseQuery) -> Optional[np.ndarray]:
+        if not query.professor or self._search_index is None:
+            return None
+        mask = np.zeros(len(self.table.course_ids), dtype=bool)
+        mask[self._search_index.search_rows(query.professor.strip().lower(), False, True)] = True
+        return mask
+
+    # --- 질의 ---
+
+    def query(self, query: CourseQuery, with_facets: bool = False) -> QueryResult:
+        """
+        조건 검색
+
+        Args:
+            query: 검색 조건
+            with_facets: 학점/요일/대상 학년/이수구분/N/P 패싯 개수 계산 여부
+
+        Returns:
+            결과 행 번호 (query.rows가 있으면 그 순서, 없으면 카탈로그 순서) + 패싯
+        """
+        self._sync()
+        table = self.table
+
+        base = table.active.copy()
+        if query.rows is not None:
+            in_rows = np.zeros(len(table.course_ids), dtype=bool)
+            in_rows[query.rows] = True
+            base &= in_rows
+
+        masks = {
+            'credits': self._credits_mask(query),
+            'days': self._days_mask(query),
+            'time': self._time_window_mask(query),
+            'grade': self._grades_mask(query),
+            'category': self._categories_mask(query),
+            'pass_fail': self._pass_fail_mask(query),
+            'professor': self._professor_mask(query),
+        }
+
+        hit = base.copy()
+        for mask in masks.values():
+            if mask is not None:
+                hit &= mask
+
+        if query.rows is not None:
+            rows = query.rows[hit[query.rows]]
+        else:
+            rows = np.flatnonzero(hit)
+
+        result = QueryResult(rows=rows)
+        if with_facets:
+            result.facets = self._facets(base, masks, query)
+        return result
+
+    def _facets(self, base: np.ndarray, masks: Dict[str, Optional[np.ndarray]],
+                query: CourseQuery) -> Dict[str, Dict]:
+        """각 패싯은 자기 조건을 제외한 나머지 조건으로 개수를 셈 (요일은 그 요일을 추가 선택했을 때의 결과 수)"""
+        table = self.table
+
+        def without(name: str) -> np.ndarray:
+            hit = base.copy()
+            for key, mask in masks.items():
+                if key != name and mask is not None:
+                    hit &= mask
+            return hit
+
+        facets = {}
+
+        hit = without('credits')
+        values, counts = np.unique(table.credits[hit], return_counts=True)
+        facets['credits'] = {int(v): int(c) for v, c in zip(values, counts)}
+
+        hit = without('days')
+        if query.days:
+            hit &= self._any_of(self._day_bitmaps[day] for day in query.days if day in self._day_bitmaps)
+        # only_days와 같은 규칙: 현재 선택 + 그 요일 밖에 수업이 없는 강의 수
+        selected = sum(1 << DAYS_MAP[day] for day in (query.only_days or ()) if day in DAYS_MAP)
+        facets['days'] = {
+            day: int(np.count_nonzero(hit & ((table.day_masks & (0xFF ^ (selected | (1 << DAYS_MAP[day])))) == 0)))
+            for day in WEEKDAYS
+        }
+
+        hit = without('grade')
+        counts = np.bincount(table.grade_codes[hit], minlength=len(table.grades))
+        facets['grade'] = {table.grades[code]: int(c) for code, c in enumerate(counts) if c}
+        facets['all_grade'] = int(np.count_nonzero(hit & table.all_grade))
+
+        hit = without('category')
+        counts = np.bincount(table.category_codes[hit], minlength=len(table.categories))
+        facets['category'] = {table.categories[code]: int(c) for code, c in enumerate(counts) if c}
+
+        hit = without('pass_fail')
+        pass_fail = int(np.count_nonzero(hit & table.pass_fail))
+        facets['pass_fail'] = {True: pass_fail, False: int(np.count_nonzero(hit)) - pass_fail}
+
+        return facets
@@ -0,0 +1,522 @@
+"""
+컬럼 기반 강의 카탈로그 저장소
+강의 데이터를 NumPy 배열과 문자열 테이블에 컬럼 단위로 보관하고,
+Course와 같은 읽기 API를 가진 경량 뷰(CourseView)로 노출
+"""
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .models import Course, TimeSlot, DAYS_MAP
+
+# Random Fill 대상 판별 키워드 (ScheduleGenerator와 동일한 기준)
+ALL_GRADE_KEYWORD = '전학년'
+
+
+def course_content_hash(course) -> int:
+    """
+    강의 내용 해시 (강좌번호 제외, 프로세스가 달라도 동일한 값)
+    카탈로그 재로드 시 변경된 분반을 찾는 데 사용
+    """
+    rooms = ','.join(slot.room for slot in course.time_slots)
+    key = '\x1f'.join((
+        course.name, str(course.credits), course.professor,
+        course.category, course.target_grade, course.time_summary, rooms,
+        'P' if course.pass_fail else ''
+    ))
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+@dataclass
+class CatalogDiff:
+    """카탈로그 재로드 결과 (강좌번호 + 내용 해시 기준 비교)"""
+    added: List[Course] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)  # 삭제(폐강)된 강좌번호
+    modified: List[Course] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    @property
+    def changed_ids(self) -> Set[str]:
+        """기존 결과에 영향을 주는 강좌번호 (삭제 + 변경)"""
+        return set(self.removed) | {c.course_id for c in self.modified}
+
+    def summary(self) -> str:
+        """변경 요약 문자열"""
+        return (f"추가 {len(self.added)}개, 삭제 {len(self.removed)}개, "
+                f"변경 {len(self.modified)}개 (유지 {self.unchanged}개)")
+
+
+class StringTable:
+    """
+    문자열 테이블
+    중복 문자열을 한 번만 저장하고 정수 코드로 참조
+    """
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """문자열을 코드로 변환 (처음 보는 문자열이면 추가)"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code_of(self, value: str) -> Optional[int]:
+        """문자열의 코드 조회 (없으면 None)"""
+        return self._codes.get(value)
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class CourseView:
+    """
+    CourseTable의 한 행을 가리키는 경량 뷰 (Flyweight)
+    테이블 참조와 행 번호만 보관하며, 속성은 컬럼에서 읽어옴 (읽기 전용)
+    """
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'CourseTable', row: int):
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_row', row)
+
+    @property
+    def row(self) -> int:
+        """테이블 내 행 번호"""
+        return self._row
+
+    @property
+    def course_id(self) -> str:
+        return self._table.course_ids[self._row]
+
+    @property
+    def name(self) -> str:
+        table = self._table
+        return table.names.values[table.name_codes[self._row]]
+
+    @property
+    def credits(self) -> int:
+        return int(self._table.credits[self._row])
+
+    @property
+    def professor(self) -> str:
+        table = self._table
+        return table.professors.values[table.professor_codes[self._row]]
+
+    @property
+    def category(self) -> str:
+        table = self._table
+        return table.categories.values[table.category_codes[self._row]]
+
+    @property
+    def target_grade(self) -> str:
+        table = self._table
+        return table.grades.values[table.grade_codes[self._row]]
+
+    @property
+    def pass_fail(self) -> bool:
+        return bool(self._table.pass_fail[self._row])
+
+    @property
+    def time_slots(self) -> Tuple[TimeSlot, ...]:
+        table = self._table
+        return table.patterns[table.pattern_codes[self._row]]
+
+    @property
+    def time_mask(self) -> int:
+        table = self._table
+        return table.pattern_masks[table.pattern_codes[self._row]]
+
+    @property
+    def time_summary(self) -> str:
+        table = self._table
+        return table.pattern_summaries[table.pattern_codes[self._row]]
+
+    def has_conflict(self, other) -> bool:
+        """다른 강의와 시간 충돌이 있는지 확인 (비트마스크 사용)"""
+        return (self.time_mask & other.time_mask) > 0
+
+    def to_course(self) -> Course:
+        """독립적인 Course 레코드로 변환"""
+        return self._table.to_course(self._row)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CourseView는 읽기 전용입니다: {name}")
+
+    def __hash__(self):
+        return hash(self.course_id)
+
+    def __eq__(self, other):
+        if not isinstance(other, (CourseView, Course)):
+            return NotImplemented
+        return self.course_id == other.course_id
+
+    def __str__(self):
+        return f"{self.name} ({self.professor}) - {self.time_summary}"
+
+    def __repr__(self):
+        return f"CourseView(course_id={self.course_id!r}, name={self.name!r})"
+
+
+def _dense_ranks(values: List[str]) -> np.ndarray:
+    """문자열 목록의 사전순 순위 (같은 문자열은 같은 순위)"""
+    if not values:
+        return np.zeros(0, dtype=np.int64)
+    _, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return inverse.astype(np.int64)
+
+
+class CourseTable(Sequence):
+    """
+    컬럼 기반 강의 카탈로그
+
+    - 숫자 컬럼 (NumPy): 학점, 전학년 여부, N/P 여부, 요일 비트, 각 문자열 컬럼의 코드
+    - 문자열 테이블: 강의명, 교수명, 이수구분, 대상 학년
+    - 시간 패턴 테이블: 동일한 강의시간 조합은 TimeSlot 튜플/비트마스크/요약 문자열을 한 번만 저장
+
+    시간 비트마스크(요일 × 288 슬롯)는 NumPy 정수 폭을 넘으므로 패턴 단위 Python int로 보관함
+    인덱싱/순회 시 CourseView를 반환하며, 목록 복사 없이 여러 서비스가 공유함 (읽기 전용)
+
+    재로드 시에는 diff()/patch()로 바뀐 행만 갱신함
+    - 삭제된 분반은 행을 지우지 않고 비활성(active=False) 처리 (행 번호 유지)
+    - 변경된 분반은 같은 행의 컬럼 값을 덮어씀
+    - version은 내용이 바뀔 때마다 증가 (인덱스/캐시 무효화 기준)
+    """
+
+    # 정렬 기준 (sort_ranks 키)
+    SORT_KEYS = ('course_id', 'name', 'credits', 'professor', 'time')
+
+    def __init__(self):
+        self.course_ids: List[str] = []
+        self.names = StringTable()
+        self.professors = StringTable()
+        self.categories = StringTable()
+        self.grades = StringTable()
+
+        self.patterns: List[Tuple[TimeSlot, ...]] = []
+        self.pattern_masks: List[int] = []
+        self.pattern_summaries: List[str] = []
+        self._pattern_codes: Dict[Tuple[TimeSlot, ...], int] = {}
+
+        self.credits = np.zeros(0, dtype=np.int16)
+        self.all_grade = np.zeros(0, dtype=bool)
+        self.pass_fail = np.zeros(0, dtype=bool)
+        self.day_masks = np.zeros(0, dtype=np.uint8)
+        self.name_codes = np.zeros(0, dtype=np.int32)
+        self.professor_codes = np.zeros(0, dtype=np.int32)
+        self.category_codes = np.zeros(0, dtype=np.int32)
+        self.grade_codes = np.zeros(0, dtype=np.int32)
+        self.pattern_codes = np.zeros(0, dtype=np.int32)
+        self.content_hashes = np.zeros(0, dtype=np.uint64)
+        self.active = np.zeros(0, dtype=bool)
+
+        self._row_by_id: Dict[str, int] = {}
+        self._rows: List[int] = []  # 활성 행 번호 (순회 순서)
+        self._active_rows = np.zeros(0, dtype=np.int64)
+        self._sort_ranks: Dict[str, np.ndarray] = {}
+        self._sections: Optional[Dict[int, np.ndarray]] = None  # 강의명 코드 → 분반 행 번호
+        self._fingerprint: Optional[str] = None
+        self.version = 0
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[Course]) -> 'CourseTable':
+        """Course 레코드 목록으로 테이블 생성"""
+        table = cls()
+        table._append(courses)
+        return table
+
+    # --- 구성 ---
+
+    def _encode_pattern(self, course: Course) -> int:
+        """시간 패턴 코드 조회 (처음 보는 패턴이면 마스크/요약과 함께 등록)"""
+        slots = course.time_slots
+        code = self._pattern_codes.get(slots)
+        if code is None:
+            code = len(self.patterns)
+            self._pattern_codes[slots] = code
+            self.patterns.append(slots)
+            self.pattern_masks.append(course.time_mask)
+            self.pattern_summaries.append(course.time_summary)
+        return code
+
+    def _append(self, courses: Iterable[Course]):
+        """행 추가 (컬럼별로 모은 뒤 한 번에 NumPy 배열로 변환)"""
+        credits, all_grade, pass_fail, day_masks, hashes = [], [], [], [], []
+        name_codes, professor_codes, category_codes, grade_codes, pattern_codes = [], [], [], [], []
+
+        for course in courses:
+            self._row_by_id[course.course_id] = len(self.course_ids)
+            self.course_ids.append(course.course_id)
+
+            credits.append(course.credits)
+            all_grade.append(self._is_all_grade(course))
+            pass_fail.append(course.pass_fail)
+            day_masks.append(self._day_bits(course))
+            hashes.append(course_content_hash(course))
+
+            name_codes.append(self.names.encode(course.name))
+            professor_codes.append(self.professors.encode(course.professor))
+            category_codes.append(self.categories.encode(course.category))
+            grade_codes.append(self.grades.encode(course.target_grade))
+            pattern_codes.append(self._encode_pattern(course))
+
+        self.credits = np.concatenate([self.credits, np.asarray(credits, dtype=np.int16)])
+        self.all_grade = np.concatenate([self.all_grade, np.asarray(all_grade, dtype=bool)])
+        self.pass_fail = np.concatenate([self.pass_fail, np.asarray(pass_fail, dtype=bool)])
+        self.day_masks = np.concatenate([self.day_masks, np.asarray(day_masks, dtype=np.uint8)])
+        self.name_codes = np.concatenate([self.name_codes, np.asarray(name_codes, dtype=np.int32)])
+        self.professor_codes = np.concatenate([self.professor_codes, np.asarray(professor_codes, dtype=np.int32)])
+        self.category_codes = np.concatenate([self.category_codes, np.asarray(category_codes, dtype=np.int32)])
+        self.grade_codes = np.concatenate([self.grade_codes, np.asarray(grade_codes, dtype=np.int32)])
+        self.pattern_codes = np.concatenate([self.pattern_codes, np.asarray(pattern_codes, dtype=np.int32)])
+        self.content_hashes = np.concatenate([self.content_hashes, np.asarray(hashes, dtype=np.uint64)])
+        self.active = np.concatenate([self.active, np.ones(len(credits), dtype=bool)])
+        self._refresh_rows()
+
+    def _set_row(self, row: int, course: Course):
+        """기존 행의 컬럼 값을 덮어씀 (변경/재개설 분반)"""
+        self.credits[row] = course.credits
+        self.all_grade[row] = self._is_all_grade(course)
+        self.pass_fail[row] = course.pass_fail
+        self.day_masks[row] = self._day_bits(course)
+        self.content_hashes[row] = course_content_hash(course)
+        self.name_codes[row] = self.names.encode(course.name)
+        self.professor_codes[row] = self.professors.encode(course.professor)
+        self.category_codes[row] = self.categories.encode(course.category)
+        self.grade_codes[row] = self.grades.encode(course.target_grade)
+        self.pattern_codes[row] = self._encode_pattern(course)
+        self.active[row] = True
+
+    def _refresh_rows(self):
+        """활성 행 목록 재계산 및 버전 증가"""
+        self._active_rows = np.flatnonzero(self.active)
+        self._rows = self._active_rows.tolist()
+        self._sort_ranks = {}
+        self._sections = None
+        self._fingerprint = None
+        self.version += 1
+
+    @staticmethod
+    def _is_all_grade(course: Course) -> bool:
+        return ALL_GRADE_KEYWORD in course.target_grade or ALL_GRADE_KEYWORD in course.category
+
+    @staticmethod
+    def _day_bits(course: Course) -> int:
+        day_bits = 0
+        for slot in course.time_slots:
+            day_bits |= 1 << DAYS_MAP.get(slot.day, 0)
+        return day_bits
+
+    def fingerprint(self) -> str:
+        """
+        카탈로그 지문 (활성 분반의 강좌번호 + 내용 해시, 재시작해도 같은 카탈로그면 같은 값)
+        디스크 결과 캐시 키에 사용 (버전 번호는 프로세스마다 새로 시작하므로 대신 사용)
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for row in sorted(self._rows, key=self.course_ids.__getitem__):
+                digest.update(self.course_ids[row].encode('utf-8'))
+                digest.update(b'\x1f')
+                digest.update(int(self.content_hashes[row]).to_bytes(8, 'little'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    # --- 재로드 (Diff & Patch) ---
+
+    def diff(self, courses: Iterable[Course]) -> CatalogDiff:
+        """
+        새 강의 목록과 현재 카탈로그 비교 (강좌번호 + 내용 해시)
+        
+        Args:
+            courses: 새로 파싱한 Course 레코드 목록
+            
+        Returns:
+            추가/삭제/변경 내역
+        """
+        new_by_id = {course.course_id: course for course in courses}
+        result = CatalogDiff()
+
+        for course_id, course in new_by_id.items():
+            row = self.row_of(course_id)
+            if row is None:
+                result.added.append(course)
+            elif int(self.content_hashes[row]) != course_content_hash(course):
+                result.modified.append(course)
+            else:
+                result.unchanged += 1
+
+        result.removed = [
+            self.course_ids[row] for row in self._rows
+            if self.course_ids[row] not in new_by_id
+        ]
+        return result
+
+    def patch(self, diff: CatalogDiff):
+        """diff 결과를 적용하여 바뀐 행만 갱신"""
+        if not diff.has_changes:
+            return
+
+        for course_id in diff.removed:
+            row = self._row_by_id.get(course_id)
+            if row is not None:
+                self.active[row] = False
+
+        for course in diff.modified:
+            self._set_row(self._row_by_id[course.course_id], course)
+
+        appended = []
+        for course in diff.added:
+            row = self._row_by_id.get(course.course_id)
+            if row is not None:
+                # 폐강되었다가 다시 개설된 분반은 기존 행을 재사용
+                self._set_row(row, course)
+            else:
+                appended.append(course)
+
+        if appended:
+            self._append(appended)
+        else:
+            self._refresh_rows()
+
+    # --- 조회 ---
+
+    def row_of(self, course_id: str) -> Optional[int]:
+        """강좌번호의 행 번호 (없거나 삭제된 분반이면 None)"""
+        row = self._row_by_id.get(course_id)
+        if row is None or not self.active[row]:
+            return None
+        return row
+
+    def get(self, course_id: str) -> Optional[CourseView]:
+        """강좌번호로 뷰 조회 (없으면 None)"""
+        row = self.row_of(course_id)
+        return CourseView(self, row) if row is not None else None
+
+    @property
+    def active_rows(self) -> np.ndarray:
+        """활성 행 번호 배열 (순회 순서, 읽기 전용으로 사용)"""
+        return self._active_rows
+
+    def sections_of(self, name: str) -> np.ndarray:
+        """
+        강의명이 정확히 같은 활성 분반의 행 번호 (카탈로그 순서)
+        강의명 → 분반 색인은 버전마다 한 번만 생성
+        """
+        if self._sections is None:
+            rows = self._active_rows
+            order = np.argsort(self.name_codes[rows], kind='stable')
+            grouped = rows[order]
+            codes = self.name_codes[grouped]
+            starts = np.flatnonzero(np.diff(codes)) + 1
+            starts = np.concatenate([[0], starts]) if len(codes) else starts
+            ends = np.append(starts[1:], len(codes))
+            self._sections = {
+                int(codes[start]): grouped[start:end] for start, end in zip(starts, ends)
+            }
+
+        code = self.names.code_of(name)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        return self._sections.get(code, np.zeros(0, dtype=np.int64))
+
+    def time_mask_of(self, row: int) -> int:
+        """행의 시간 비트마스크 (뷰를 만들지 않음)"""
+        return self.pattern_masks[self.pattern_codes[row]]
+
+    def view(self, row: int) -> CourseView:
+        """행 번호의 뷰 반환"""
+        return CourseView(self, row)
+
+    def views(self, rows: Iterable[int]) -> List[CourseView]:
+        """여러 행의 뷰 목록 반환"""
+        if isinstance(rows, np.ndarray):
+            rows = rows.tolist()
+        return [CourseView(self, row) for row in rows]
+
+    def to_course(self, row: int) -> Course:
+        """행을 독립적인 Course 레코드로 변환"""
+        view = CourseView(self, row)
+        return Course(
+            course_id=view.course_id,
+            name=view.name,
+            credits=view.credits,
+            professor=view.professor,
+            time_slots=view.time_slots,
+            category=view.category,
+            target_grade=view.target_grade,
+            time_mask=view.time_mask,
+            pass_fail=view.pass_fail
+        )
+
+    # --- 정렬 ---
+
+    def sort_ranks(self, key: str) -> np.ndarray:
+        """
+        행 번호 → 정렬 순위 (같은 값은 같은 순위)
+        버전마다 한 번만 계산하며, 결과 정렬은 순위 배열 인덱싱 + 정수 정렬로 처리
+        
+        Args:
+            key: SORT_KEYS 중 하나
+        """
+        ranks = self._sort_ranks.get(key)
+        if ranks is not None:
+            return ranks
+
+        if key == 'course_id':
+            ranks = _dense_ranks(self.course_ids)
+        elif key == 'name':
+            ranks = _dense_ranks(self.names.values)[self.name_codes]
+        elif key == 'professor':
+            ranks = _dense_ranks(self.professors.values)[self.professor_codes]
+        elif key == 'credits':
+            ranks = self.credits.astype(np.int64)
+        elif key == 'time':
+            # 첫 강의시간 문자열 기준 (시간 정보가 없으면 빈 문자열)
+            first_slots = [str(slots[0]) if slots else "" for slots in self.patterns]
+            ranks = _dense_ranks(first_slots)[self.pattern_codes]
+        else:
+            raise ValueError(f"알 수 없는 정렬 기준: {key}")
+
+        self._sort_ranks[key] = ranks
+        return ranks
+
+    def sort_rows(self, rows: np.ndarray, key: str, reverse: bool = False) -> np.ndarray:
+        """행 번호 배열 정렬 (안정 정렬, 같은 값은 기존 순서 유지)"""
+        ranks = self.sort_ranks(key)[rows]
+        if reverse:
+            ranks = -ranks
+        return rows[np.argsort(ranks, kind='stable')]
+
+    # --- Sequence 프로토콜 ---
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [CourseView(self, row) for row in self._rows[index]]
+        return CourseView(self, self._rows[index])
+
+    def __iter__(self) -> Iterator[CourseView]:
+        for row in self._rows:
+            yield CourseView(self, row)
+
+    def __contains__(self, course) -> bool:
+        course_id = getattr(course, 'course_id', None)
+        return course_id is not None and self.row_of(course_id) is not None
@@ -2,3 +2,8 @@
 class ScheduleMakerError(Exception):
     """Base exception for Schedule Maker application"""
     pass
+
+
+class SearchCancelled(ScheduleMakerError):
+    """더 새로운 검색 요청이 들어와 진행 중인 검색이 취소됨"""
+    pass
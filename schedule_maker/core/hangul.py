@@ -0,0 +1,55 @@
+"""
+한글 자모 분해 유틸리티
+초성 검색/오타 허용 검색 인덱스를 만들 때 사용 (호환용 자모 기준)
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+             'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def is_syllable(char: str) -> bool:
+    """완성형 한글 음절 여부"""
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def is_choseong(char: str) -> bool:
+    """초성으로 쓰일 수 있는 자음(호환용 자모) 여부"""
+    return char in _CHOSEONG_SET
+
+
+def choseong_of(char: str) -> str:
+    """음절의 초성 (음절이 아니면 그대로)"""
+    if not is_syllable(char):
+        return char
+    return CHOSEONG[(ord(char) - HANGUL_BASE) // (21 * 28)]
+
+
+def to_choseong(text: str) -> str:
+    """문자열을 초성 문자열로 변환 (영어회화 → ㅇㅇㅎㅎ, 한글 외 문자는 유지)"""
+    return ''.join(choseong_of(char) for char in text)
+
+
+def decompose(text: str) -> str:
+    """문자열을 자모 단위로 분해 (회화 → ㅎㅚㅎㅘ, 한글 외 문자는 유지)"""
+    jamo = []
+    for char in text:
+        if not is_syllable(char):
+            jamo.append(char)
+            continue
+        offset = ord(char) - HANGUL_BASE
+        jamo.append(CHOSEONG[offset // (21 * 28)])
+        jamo.append(JUNGSEONG[(offset // 28) % 21])
+        jamo.append(JONGSEONG[offset % 28])
+    return ''.join(jamo)
+
+
+def has_choseong(text: str) -> bool:
+    """초성(자음만 입력된 글자)이 포함된 검색어인지 여부"""
+    return any(char in _CHOSEONG_SET for char in text)
@@ -3,9 +3,15 @@
 의존성 역전 원칙(DIP)을 위한 추상 클래스들
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Sequence, Set
+
+import numpy as np
+
 from .models import Course, Schedule
+from .course_table import CatalogDiff, CourseTable
+from .course_query import CourseQuery, QueryResult
 from .config import ScheduleConfig, CourseFilter
+from .constants import SearchMode
 
 
 class IServiceBase(ABC):
@@ -21,13 +27,33 @@ class ICourseService(ABC):
     """강의 데이터 관리 서비스 인터페이스"""
     
     @abstractmethod
-    def load_courses(self, csv_path: str) -> List[Course]:
+    def load_courses(self, csv_path: str) -> Sequence[Course]:
         """CSV 파일에서 강의 데이터 로드"""
         pass
     
     @abstractmethod
-    def get_all_courses(self) -> List[Course]:
-        """모든 강의 반환"""
+    def reload_courses(self, csv_path: str) -> CatalogDiff:
+        """CSV를 다시 읽어 바뀐 분반만 갱신하고 변경 내역 반환"""
+        pass
+    
+    @abstractmethod
+    def read_changes(self, csv_path: str) -> CatalogDiff:
+        """CSV를 다시 읽어 현재 카탈로그와 비교만 수행 (카탈로그는 그대로)"""
+        pass
+    
+    @abstractmethod
+    def apply_changes(self, diff: CatalogDiff):
+        """read_changes 결과를 카탈로그에 반영"""
+        pass
+    
+    @abstractmethod
+    def get_all_courses(self) -> Sequence[Course]:
+        """모든 강의 반환 (읽기 전용, 복사 없음)"""
+        pass
+    
+    @abstractmethod
+    def get_course_table(self) -> CourseTable:
+        """컬럼 기반 카탈로그 반환 (행 번호 기반 조회/정렬용)"""
         pass
     
     @abstractmethod
@@ -40,11 +66,45 @@ class ICourseService(ABC):
         self, 
         query: str = '', 
         search_by_name: bool = True,
-        search_by_professor: bool = True
+        search_by_professor: bool = True,
+        mode: SearchMode = SearchMode.EXACT,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> List[Course]:
         """강의 검색"""
         pass
     
+    @abstractmethod
+    def search_rows(
+        self,
+        query: str = '',
+        search_by_name: bool = True,
+        search_by_professor: bool = True,
+        mode: SearchMode = SearchMode.EXACT,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> np.ndarray:
+        """강의 검색 (카탈로그 행 번호 배열)"""
+        pass
+    
+    @abstractmethod
+    def resolve_filter(self, course_filter: CourseFilter) -> List[Course]:
+        """필터에 매칭되는 강의 목록 (인덱스 기반, 카탈로그 버전별 캐시)"""
+        pass
+    
+    @abstractmethod
+    def query_courses(self, query: CourseQuery, with_facets: bool = False) -> QueryResult:
+        """조건 검색 (비트맵 인덱스, 패싯 개수 포함)"""
+        pass
+    
+    @abstractmethod
+    def find_alternative_sections(
+        self,
+        name: str,
+        config: ScheduleConfig,
+        ignore: Optional[CourseFilter] = None
+    ) -> List[Course]:
+        """강의명이 같은 분반 중 현재 설정(제외 시간, 다른 필수 강의)과 함께 들을 수 있는 분반"""
+        pass
+    
     @abstractmethod
     def is_loaded(self) -> bool:
         """데이터 로드 여부"""
@@ -118,10 +178,15 @@ class IScheduleService(ABC):
         """진행률 콜백 설정"""
         pass
     
+    @abstractmethod
+    def set_result_callback(self, callback: Optional[Callable[[int], None]]):
+        """생성 중 새 결과 알림 콜백 설정 (지금까지 찾은 개수)"""
+        pass
+    
     @abstractmethod
     def generate_schedules(
         self,
-        all_courses: List[Course],
+        all_courses: Sequence[Course],
         config: ScheduleConfig
     ) -> List[Schedule]:
         """시간표 조합 생성"""
@@ -143,6 +208,16 @@ class IScheduleService(ABC):
         """시간표를 HTML로 내보내기"""
         pass
     
+    @abstractmethod
+    def get_result_pages(self):
+        """결과 화면 데이터 원본 (ResultPages: 페이지 단위 조회 + 핀 질의)"""
+        pass
+    
+    @abstractmethod
+    def invalidate_courses(self, course_ids: Set[str]) -> bool:
+        """변경된 분반을 포함하는 생성 결과 무효화 (무효화 여부 반환)"""
+        pass
+    
     @abstractmethod
     def get_schedule_count(self) -> int:
         """생성된 시간표 개수"""
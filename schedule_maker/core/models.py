@@ -1,80 +1,141 @@
 """
 시간표 조합 생성 프로그램 - 데이터 모델
 """
-from dataclasses import dataclass
-from typing import List
+import sys
+from dataclasses import dataclass, field
+from typing import List, Tuple, Sequence
 from copy import deepcopy
 
 # bitmask constants
 DAYS_MAP = {'월': 0, '화': 1, '수': 2, '목': 3, '금': 4, '토': 5, '일': 6}
 
+
+def intern_str(value: str) -> str:
+    """반복되는 문자열(요일, 강의실, 교수명 등)을 하나의 객체로 공유"""
+    return sys.intern(value) if value else ''
+
+
+def time_to_minutes(time_str: str) -> int:
+    """"HH:MM" 문자열을 자정 기준 분(minute)으로 변환"""
+    hours, minutes = map(int, time_str.split(':'))
+    return hours * 60 + minutes
+
+
 def time_str_to_index(day: str, time_str: str) -> int:
     """요일과 시간을 비트 인덱스로 변환 (5분 단위)"""
+    return minutes_to_index(day, time_to_minutes(time_str))
+
+
+def minutes_to_index(day: str, minutes: int) -> int:
+    """요일과 분(minute)을 비트 인덱스로 변환 (5분 단위)"""
     # 24시간 * 12슬롯(5분) = 288 slots per day
     day_idx = DAYS_MAP.get(day, 0)
-    hours, minutes = map(int, time_str.split(':'))
     # 5분 단위 인덱스 (0~287)
-    slot_idx = hours * 12 + (minutes // 5)
-    return day_idx * 288 + slot_idx
+    return day_idx * 288 + minutes // 5
+
 
-def calculate_time_mask(time_slots: List['TimeSlot']) -> int:
+def range_mask(start_idx: int, end_idx: int) -> int:
+    """[start_idx, end_idx) 구간의 비트가 모두 켜진 마스크 (비트 단위 루프 없이 계산)"""
+    if end_idx <= start_idx:
+        return 0
+    return ((1 << (end_idx - start_idx)) - 1) << start_idx
+
+
+def calculate_time_mask(time_slots: Sequence['TimeSlot']) -> int:
     """시간 목록을 비트마스크로 변환"""
     mask = 0
     for slot in time_slots:
-        start_idx = time_str_to_index(slot.day, slot.start_time)
-        end_idx = time_str_to_index(slot.day, slot.end_time)
-        # end_time은 포함되지 않으므로 range(start, end)
-        for i in range(start_idx, end_idx):
-            mask |= (1 << i)
+        # end_time은 포함되지 않으므로 [start, end)
+        mask |= range_mask(
+            minutes_to_index(slot.day, slot.start_minutes),
+            minutes_to_index(slot.day, slot.end_minutes)
+        )
+    return mask
+
+
+def build_excluded_mask(excluded_days: Sequence[str], excluded_time_slots: Sequence[Tuple[str, str, str]]) -> int:
+    """제외 요일/시간대 설정을 비트마스크로 변환 (ScheduleConfig.excluded_* 형식)"""
+    mask = 0
+    # 1. 특정 시간대 제외
+    for (day, start, end) in excluded_time_slots or ():
+        mask |= range_mask(time_str_to_index(day, start), time_str_to_index(day, end))
+
+    # 2. 요일 전체 제외 (하루 = 288 slots, 5분 단위)
+    for day in excluded_days or ():
+        day_idx = DAYS_MAP.get(day, 0)
+        mask |= range_mask(day_idx * 288, (day_idx + 1) * 288)
+
     return mask
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
-    """요일과 시간을 표현하는 클래스"""
+    """
+    요일과 시간을 표현하는 클래스 (불변)
+    __slots__로 인스턴스 딕셔너리를 없애고, 분 단위 시각은 생성 시 한 번만 파싱함
+    """
     day: str  # 월, 화, 수, 목, 금
     start_time: str  # HH:MM 형식
     end_time: str  # HH:MM 형식
     room: str = ""  # 강의실 (선택)
-    
+    start_minutes: int = field(init=False, repr=False, compare=False)  # 자정 기준 시작 분
+    end_minutes: int = field(init=False, repr=False, compare=False)  # 자정 기준 종료 분
+
+    def __post_init__(self):
+        # frozen 데이터클래스이므로 object.__setattr__로 초기화
+        object.__setattr__(self, 'day', intern_str(self.day))
+        object.__setattr__(self, 'start_time', intern_str(self.start_time))
+        object.__setattr__(self, 'end_time', intern_str(self.end_time))
+        object.__setattr__(self, 'room', intern_str(self.room))
+        object.__setattr__(self, 'start_minutes', time_to_minutes(self.start_time))
+        object.__setattr__(self, 'end_minutes', time_to_minutes(self.end_time))
+
     def overlaps(self, other: 'TimeSlot') -> bool:
         """다른 TimeSlot과 시간이 겹치는지 확인"""
         if self.day != other.day:
             return False
         
-        # 시간 문자열을 분으로 변환
-        def time_to_minutes(time_str: str) -> int:
-            hours, minutes = map(int, time_str.split(':'))
-            return hours * 60 + minutes
-        
-        self_start = time_to_minutes(self.start_time)
-        self_end = time_to_minutes(self.end_time)
-        other_start = time_to_minutes(other.start_time)
-        other_end = time_to_minutes(other.end_time)
-        
         # 겹침 조건: 한 쪽의 시작이 다른 쪽의 범위 안에 있음
-        return not (self_end <= other_start or other_end <= self_start)
+        return not (self.end_minutes <= other.start_minutes or other.end_minutes <= self.start_minutes)
     
     def __str__(self):
         return f"{self.day} {self.start_time}~{self.end_time}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Course:
-    """강의 정보를 저장하는 클래스"""
+    """
+    강의 정보를 저장하는 클래스 (불변)
+    반복되는 문자열은 intern으로 공유하고, 시간 요약 문자열은 생성 시 캐싱함
+    """
     course_id: str  # 강좌번호
     name: str  # 교과목명
     credits: int  # 학점
     professor: str  # 담당교수
-    time_slots: List[TimeSlot]  # 강의 시간 목록
+    time_slots: Tuple[TimeSlot, ...]  # 강의 시간 목록 (리스트로 넘겨도 튜플로 고정됨)
     category: str = ""  # 이수구분 (예: 전필, 교양 등)
     target_grade: str = ""  # 대상 학년 (예: 1학년, 전학년)
     time_mask: int = 0  # 비트마스크 (충돌 검사용)
+    pass_fail: bool = False  # N/P(Pass/Fail) 과목 여부
+    _time_summary: str = field(init=False, repr=False, compare=False)  # time_summary 캐시
     
     def __post_init__(self):
+        time_slots = tuple(self.time_slots)
+        object.__setattr__(self, 'time_slots', time_slots)
+        object.__setattr__(self, 'name', intern_str(self.name))
+        object.__setattr__(self, 'professor', intern_str(self.professor))
+        object.__setattr__(self, 'category', intern_str(self.category))
+        object.__setattr__(self, 'target_grade', intern_str(self.target_grade))
+        
         # 객체 생성 후 비트마스크 계산
-        if self.time_mask == 0 and self.time_slots:
-            self.time_mask = calculate_time_mask(self.time_slots)
+        if self.time_mask == 0 and time_slots:
+            object.__setattr__(self, 'time_mask', calculate_time_mask(time_slots))
+        
+        if time_slots:
+            summary = ", ".join(str(slot) for slot in time_slots)
+        else:
+            summary = "시간 정보 없음"
+        object.__setattr__(self, '_time_summary', summary)
 
     def has_conflict(self, other: 'Course') -> bool:
         """다른 강의와 시간 충돌이 있는지 확인 (비트마스크 사용)"""
@@ -91,10 +152,8 @@ class Course:
     
     @property
     def time_summary(self) -> str:
-        """시간 정보를 문자열로 반환"""
-        if not self.time_slots:
-            return "시간 정보 없음"
-        return ", ".join(str(slot) for slot in self.time_slots)
+        """시간 정보를 문자열로 반환 (생성 시 캐싱된 값)"""
+        return self._time_summary
 
     def __hash__(self):
         return hash(self.course_id)
@@ -0,0 +1,237 @@
+"""
+시작 시간 측정 (단계별 타이머 + 모듈 import 시간)
+앱 시작이 느려졌을 때 어느 단계(QApplication 생성, qfluentwidgets/pandas import,
+CSV 파싱, 화면 생성 등)에서 시간이 늘었는지 JSON 보고서로 확인
+
+- 켜는 방법: 환경 변수 SCHEDULE_MAKER_PROFILE=<보고서 경로> (1이면 기본 경로)
+  또는 실행 인자 --profile-startup[=<보고서 경로>]
+- 꺼져 있으면 phase()는 아무것도 기록하지 않음 (측정 비용 없음)
+- import 시간은 -X importtime과 같은 방식 (누적/자체 시간), 앱 모듈과 주요 외부 패키지만 기록
+"""
+import importlib.abc
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+ENV_VAR = 'SCHEDULE_MAKER_PROFILE'
+CLI_FLAG = '--profile-startup'
+DEFAULT_REPORT = 'startup_profile.json'
+
+# import 시간을 기록할 최상위 패키지 (외부 패키지는 하위 모듈 한 단계까지만)
+IMPORT_PACKAGES = ('schedule_maker', 'PySide6', 'qfluentwidgets', 'pandas', 'numpy')
+APP_PACKAGE = 'schedule_maker'
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """
+    원래 로더의 create_module + exec_module 시간을 한 항목으로 ImportTimer에 기록
+    (확장 모듈은 대부분의 비용이 create_module의 dlopen/초기화에 있음)
+    """
+
+    def __init__(self, loader, timer: 'ImportTimer'):
+        self._loader = loader
+        self._timer = timer
+        self._start: Optional[float] = None
+
+    def _begin(self):
+        if self._start is None:
+            self._timer._enter()
+            self._start = time.perf_counter()
+
+    def _end(self, name: str):
+        if self._start is not None:
+            self._timer._leave(name, time.perf_counter() - self._start)
+            self._start = None
+
+    def create_module(self, spec):
+        self._begin()
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._end(spec.name)
+            raise
+
+    def exec_module(self, module):
+        self._begin()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._end(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    모듈 import 시간 측정 (sys.meta_path 맨 앞에 설치)
+    누적 시간은 하위 import 포함, 자체 시간은 하위 import 제외
+    """
+
+    def __init__(self, packages: Sequence[str] = IMPORT_PACKAGES):
+        self.packages = tuple(packages)
+        self.records: List[dict] = []
+        self._local = threading.local()
+
+    def _tracked(self, name: str) -> bool:
+        top = name.partition('.')[0]
+        if top not in self.packages:
+            return False
+        return top == APP_PACKAGE or name.count('.') <= 1
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not self._tracked(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def _enter(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+
+    def _leave(self, name: str, elapsed: float):
+        stack = self._local.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        self.records.append({
+            'module': name,
+            'cumulative_ms': round(elapsed * 1000, 3),
+            'self_ms': round((elapsed - children) * 1000, 3),
+            'thread': threading.current_thread().name,
+        })
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class StartupProfiler:
+    """단계별 시작 시간 기록기"""
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path: Optional[str] = None
+        self.import_timer: Optional[ImportTimer] = None
+        self._origin = time.perf_counter()
+        self._phases: List[dict] = []
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, report_path: Optional[str] = None, capture_imports: bool = True):
+        """측정 시작 (import 측정은 이 시점 이후 처음 가져오는 모듈만 기록)"""
+        self.enabled = True
+        self.report_path = report_path
+        self._origin = time.perf_counter()
+        if capture_imports and self.import_timer is None:
+            self.import_timer = ImportTimer()
+            self.import_timer.install()
+
+    def configure(self, argv: List[str], environ=os.environ, default_dir: str = '.') -> bool:
+        """
+        실행 인자/환경 변수로 켜기 (argv에서 --profile-startup은 제거)
+
+        Returns:
+            측정을 켰으면 True
+        """
+        path = None
+        for arg in list(argv):
+            if arg == CLI_FLAG or arg.startswith(CLI_FLAG + '='):
+                argv.remove(arg)
+                path = arg.partition('=')[2] or os.path.join(default_dir, DEFAULT_REPORT)
+        if path is None and environ.get(ENV_VAR):
+            value = environ[ENV_VAR]
+            path = os.path.join(default_dir, DEFAULT_REPORT) if value == '1' else value
+        if path is None:
+            return False
+        self.enable(path)
+        return True
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def phase(self, name: str):
+        """단계 하나의 시간 기록 (중첩 가능, 스레드별 깊이)"""
+        if not self.enabled:
+            yield
+            return
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            end = self._now()
+            with self._lock:
+                self._phases.append({
+                    'name': name,
+                    'start_ms': round(start * 1000, 3),
+                    'duration_ms': round((end - start) * 1000, 3),
+                    'depth': depth,
+                    'thread': threading.current_thread().name,
+                })
+
+    def mark(self, name: str):
+        """시점 기록 (예: 첫 화면 표시, 강의 데이터 준비 완료)"""
+        if self.enabled:
+            with self._lock:
+                self._marks.setdefault(name, round(self._now() * 1000, 3))
+
+    def report(self) -> dict:
+        """JSON 보고서 (단계는 시작 순, import는 누적 시간 큰 순)"""
+        with self._lock:
+            phases = sorted(self._phases, key=lambda p: p['start_ms'])
+            marks = dict(self._marks)
+        imports = sorted(self.import_timer.records if self.import_timer else [],
+                         key=lambda r: -r['cumulative_ms'])
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'elapsed_ms': round(self._now() * 1000, 3),
+            'marks': marks,
+            'phases': phases,
+            'imports': imports,
+        }
+
+    def write_report(self, path: Optional[str] = None) -> Optional[str]:
+        """보고서 저장 (꺼져 있으면 None, '-'이면 표준 출력)"""
+        if not self.enabled:
+            return None
+        path = path or self.report_path or DEFAULT_REPORT
+        data = json.dumps(self.report(), ensure_ascii=False, indent=2)
+        if path == '-':
+            print(data)
+            return path
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except OSError as e:
+            print(f"⚠️ 시작 시간 보고서 저장 실패: {e}")
+            return None
+        print(f"⏱️ 시작 시간 보고서: {os.path.abspath(path)}")
+        return path
+
+
+# 앱 전역 기록기 (run.py에서 configure)
+profiler = StartupProfiler()
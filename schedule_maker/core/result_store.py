@@ -0,0 +1,131 @@
+"""
+시간표 결과 저장소
+생성된 시간표 조합을 카탈로그 행 번호 배열과 조합별 학점/시간 비트맵으로 압축 보관
+
+- 조합 목록은 평탄화한 행 번호 배열 + 오프셋 배열 (Schedule/Course 객체를 만들지 않음)
+- 시간 마스크는 64비트 워드 배열로 펼쳐 두어 여러 조합을 한 번에 비교 가능
+- 디스크에는 강좌번호로 저장 (재시작 후 행 번호가 달라져도 복원 가능)
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .course_table import CourseTable
+from .models import Course, Schedule
+
+# 시간 마스크 워드 수 (7일 × 288칸, 64비트 단위)
+MASK_WORDS = (7 * 288 + 63) // 64
+
+
+def mask_to_words(mask: int) -> np.ndarray:
+    """비트마스크(int) → uint64 워드 배열"""
+    return np.frombuffer(mask.to_bytes(MASK_WORDS * 8, 'little'), dtype='<u8').astype(np.uint64)
+
+
+@dataclass
+class ResultStore:
+    """압축된 시간표 조합 목록 (생성 순서 유지)"""
+    offsets: np.ndarray   # int64 [n + 1], 조합 i의 행 번호는 rows[offsets[i]:offsets[i + 1]]
+    rows: np.ndarray      # int32, 카탈로그 행 번호
+    credits: np.ndarray   # int16 [n], 총 학점
+    masks: np.ndarray     # uint64 [n, MASK_WORDS], 전체 시간 마스크
+    filled: np.ndarray    # bool [n], 랜덤 채우기 적용 여부
+
+    @classmethod
+    def from_rows(cls, schedule_rows: Sequence[Sequence[int]], filled: Sequence[bool], table: CourseTable) -> 'ResultStore':
+        """조합별 행 번호 목록으로 생성 (학점/시간 마스크는 카탈로그에서 계산)"""
+        lengths = [len(rows) for rows in schedule_rows]
+        offsets = np.zeros(len(schedule_rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = np.fromiter((row for rows in schedule_rows for row in rows), dtype=np.int32, count=int(offsets[-1]))
+
+        masks = np.zeros((len(schedule_rows), MASK_WORDS), dtype=np.uint64)
+        credits = np.zeros(len(schedule_rows), dtype=np.int16)
+        for i, rows in enumerate(schedule_rows):
+            mask = 0
+            for row in rows:
+                mask |= table.time_mask_of(row)
+            masks[i] = mask_to_words(mask)
+            credits[i] = int(table.credits[list(rows)].sum()) if len(rows) else 0
+
+        return cls(offsets, flat, credits, masks, np.asarray(filled, dtype=bool))
+
+    @classmethod
+    def from_schedules(cls, schedules: Sequence[Schedule], table: CourseTable) -> 'ResultStore':
+        """Schedule 목록을 압축 (카탈로그에 없는 강의가 있으면 ValueError)"""
+        schedule_rows = []
+        for schedule in schedules:
+            rows = []
+            for course in schedule.courses:
+                row = table.row_of(course.course_id)
+                if row is None:
+                    raise ValueError(f"카탈로그에 없는 강의입니다: {course.course_id}")
+                rows.append(row)
+            schedule_rows.append(rows)
+        return cls.from_rows(schedule_rows, [s.has_random_filled for s in schedules], table)
+
+    def __len__(self) -> int:
+        return len(self.credits)
+
+    def schedule_rows(self, index: int) -> np.ndarray:
+        """조합 하나의 행 번호"""
+        return self.rows[self.offsets[index]:self.offsets[index + 1]]
+
+    def to_schedules(self, table: CourseTable) -> List[Schedule]:
+        """Schedule 목록으로 복원 (같은 분반은 같은 Course 객체 공유)"""
+        records: Dict[int, Course] = {}
+        schedules = []
+        for index in range(len(self)):
+            schedule = Schedule()
+            for row in self.schedule_rows(index).tolist():
+                course = records.get(row)
+                if course is None:
+                    course = records[row] = table.to_course(row)
+                schedule.add_course(course)
+            schedule.has_random_filled = bool(self.filled[index])
+            schedules.append(schedule)
+        return schedules
+
+    def filter(self, excluded_mask: int, min_credits: int, max_credits: int) -> np.ndarray:
+        """
+        제외 시간과 겹치지 않고 학점 범위 안에 있는 조합 번호 (생성 순서 유지)
+        조합 전체를 워드 단위 AND 한 번으로 검사
+        """
+        overlaps = (self.masks & mask_to_words(excluded_mask)).any(axis=1)
+        keep = ~overlaps & (self.credits >= min_credits) & (self.credits <= max_credits)
+        return np.flatnonzero(keep)
+
+    def take(self, indices: Sequence[int]) -> 'ResultStore':
+        """일부 조합만 담은 저장소 (indices 순서)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices]
+        lengths = self.offsets[indices + 1] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        rows = np.concatenate([self.rows[s:s + n] for s, n in zip(starts.tolist(), lengths.tolist())]) \
+            if len(indices) else np.zeros(0, dtype=np.int32)
+        return ResultStore(offsets, rows.astype(np.int32), self.credits[indices],
+                           self.masks[indices], self.filled[indices])
+
+    # --- 직렬화 (강좌번호 기준) ---
+
+    def to_dict(self, table: CourseTable) -> dict:
+        """JSON 저장용 (조합별 강좌번호 목록)"""
+        ids = table.course_ids
+        return {
+            'schedules': [[ids[row] for row in self.schedule_rows(i).tolist()] for i in range(len(self))],
+            'filled': self.filled.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, table: CourseTable) -> Optional['ResultStore']:
+        """to_dict() 결과 복원 (없어진 분반이 있으면 None)"""
+        schedule_rows = []
+        for course_ids in data.get('schedules', []):
+            rows = [table.row_of(course_id) for course_id in course_ids]
+            if any(row is None for row in rows):
+                return None
+            schedule_rows.append(rows)
+        filled = data.get('filled') or [False] * len(schedule_rows)
+        return cls.from_rows(schedule_rows, filled, table)
@@ -2,21 +2,37 @@
 강의 데이터 관리 서비스
 CSV 로딩, 검색, 필터링 등 강의 관련 모든 작업 처리
 """
-from typing import List, Optional
-from ..core.models import Course
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.models import Course, build_excluded_mask
+from ..core.config import CourseFilter, ScheduleConfig
+from ..core.course_table import CourseTable, CatalogDiff
+from ..core.course_query import CourseQuery, CourseQueryEngine, QueryResult
 from ..core.interfaces import ICourseService
+from ..core.constants import SearchMode
+from ..core.profiling import profiler
 from .parser import parse_csv
+from .search_index import CourseSearchIndex
 
 
 class CourseService(ICourseService):
     """강의 데이터 관리 서비스"""
     
     def __init__(self):
-        self._all_courses: List[Course] = []
-        self._courses_by_id: dict = {}
+        # 컬럼 기반 카탈로그 (강좌번호 인덱스 포함)
+        self._table: CourseTable = CourseTable()
+        self._search_index = CourseSearchIndex(self._table)
+        self._query_engine = CourseQueryEngine(self._table, self._search_index)
         self._loaded = False
+        
+        # 필터 해석 결과 캐시 (카탈로그가 교체되거나 버전이 바뀌면 비움)
+        self._filter_cache: Dict[Tuple, np.ndarray] = {}
+        self._filter_cache_table: Optional[CourseTable] = None
+        self._filter_cache_version = -1
     
-    def load_courses(self, csv_path: str) -> List[Course]:
+    def load_courses(self, csv_path: str) -> Sequence[Course]:
         """
         CSV 파일에서 강의 데이터 로드
         
@@ -24,22 +40,67 @@ class CourseService(ICourseService):
             csv_path: CSV 파일 경로
             
         Returns:
-            로드된 강의 리스트
+            로드된 강의 카탈로그 (읽기 전용 시퀀스)
         """
-        self._all_courses = parse_csv(csv_path)
+        with profiler.phase('catalog.parse_csv'):
+            courses = parse_csv(csv_path)
+        with profiler.phase('catalog.build_table'):
+            self._table = CourseTable.from_courses(courses)
+        with profiler.phase('catalog.search_index'):
+            self._search_index = CourseSearchIndex(self._table)
+            self._query_engine = CourseQueryEngine(self._table, self._search_index)
+        self._loaded = True
+        return self._table
+    
+    def reload_courses(self, csv_path: str) -> CatalogDiff:
+        """
+        새로 내보낸 CSV와 현재 카탈로그를 비교하여 바뀐 분반만 갱신
+        (검색 인덱스는 새로 생긴 강의명/교수명만 이어서 색인)
+        (로드 전이면 전체 로드 후 모든 강의를 추가로 보고)
         
-        # ID로 빠른 검색을 위한 딕셔너리 생성
-        self._courses_by_id = {
-            course.course_id: course 
-            for course in self._all_courses
-        }
+        Args:
+            csv_path: CSV 파일 경로
+            
+        Returns:
+            추가/삭제/변경 내역
+        """
+        diff = self.read_changes(csv_path)
+        self.apply_changes(diff)
+        return diff
+    
+    def read_changes(self, csv_path: str) -> CatalogDiff:
+        """
+        새로 내보낸 CSV와 현재 카탈로그 비교만 수행 (카탈로그는 그대로, 백그라운드 스레드에서 호출 가능)
+        
+        Args:
+            csv_path: CSV 파일 경로
+            
+        Returns:
+            추가/삭제/변경 내역 (apply_changes로 반영)
+        """
+        return self._table.diff(parse_csv(csv_path))
+    
+    def apply_changes(self, diff: CatalogDiff):
+        """
+        read_changes 결과를 카탈로그에 반영 (열을 제자리에서 바꾸므로 카탈로그를 읽는 작업이 없을 때 호출)
         
+        Args:
+            diff: 같은 카탈로그에 대해 read_changes가 반환한 변경 내역
+        """
+        self._table.patch(diff)
+        self._search_index.refresh()
         self._loaded = True
-        return self._all_courses
     
-    def get_all_courses(self) -> List[Course]:
-        """모든 강의 반환"""
-        return self._all_courses.copy()
+    def get_all_courses(self) -> Sequence[Course]:
+        """
+        모든 강의 반환 (복사 없음, 읽기 전용)
+        스케줄러/검색/시각화가 같은 카탈로그를 공유함
+        """
+        return self._table
+    
+    def get_course_table(self) -> CourseTable:
+        """컬럼 기반 카탈로그 반환 (벡터 연산용)"""
+        return self._table
     
     def get_course_by_id(self, course_id: str) -> Optional[Course]:
         """
@@ -51,13 +112,15 @@ class CourseService(ICourseService):
         Returns:
             해당 강의 또는 None
         """
-        return self._courses_by_id.get(course_id)
+        return self._table.get(course_id)
     
     def search_courses(
         self, 
         query: str = '', 
         search_by_name: bool = True,
-        search_by_professor: bool = True
+        search_by_professor: bool = True,
+        mode: SearchMode = SearchMode.EXACT,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> List[Course]:
         """
         강의 검색
@@ -66,30 +129,153 @@ class CourseService(ICourseService):
             query: 검색어
             search_by_name: 강의명으로 검색 여부
             search_by_professor: 교수명으로 검색 여부
+            mode: 검색 방식 (EXACT: 부분 문자열, CHOSEONG: 초성, FUZZY: 오타 허용)
+            cancel_check: 더 새로운 검색이 있는지 확인하는 함수 (True면 SearchCancelled 발생)
             
         Returns:
-            검색 결과 강의 리스트
+            검색 결과 강의 리스트 (EXACT는 카탈로그 순서, 나머지는 일치 품질 순)
+        """
+        return self._table.views(self.search_rows(
+            query, search_by_name, search_by_professor, mode, cancel_check
+        ))
+    
+    def search_rows(
+        self,
+        query: str = '',
+        search_by_name: bool = True,
+        search_by_professor: bool = True,
+        mode: SearchMode = SearchMode.EXACT,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> np.ndarray:
+        """
+        강의 검색 (카탈로그 행 번호 배열 반환, 뷰 객체를 만들지 않음)
+        인자는 search_courses()와 동일
         """
         if not query or not query.strip():
-            return self._all_courses.copy()
+            return self._table.active_rows
         
         query = query.strip().lower()
-        results = []
+        return self._search_index.search_rows(
+            query, search_by_name, search_by_professor, mode, cancel_check
+        )
+    
+    def resolve_filter_rows(self, course_filter: CourseFilter) -> np.ndarray:
+        """
+        필터에 매칭되는 강의의 행 번호 (CourseFilter.matches와 같은 결과, 카탈로그 순서)
+        강좌번호/강의명/교수명 인덱스로 찾으며, (필터, 카탈로그, 버전) 단위로 결과를 재사용
+        (load_courses는 새 카탈로그를 버전 1부터 만들므로 버전만으로는 구분 불가)
         
-        for course in self._all_courses:
-            # 검색 조건 확인
-            match = False
-            
-            if search_by_name and query in course.name.lower():
-                match = True
-            
-            if search_by_professor and query in course.professor.lower():
-                match = True
+        Args:
+            course_filter: 필수/희망 강의 필터
             
-            if match:
-                results.append(course)
+        Returns:
+            행 번호 배열 (읽기 전용)
+        """
+        table = self._table
+        if self._filter_cache_table is not table or self._filter_cache_version != table.version:
+            self._filter_cache = {}
+            self._filter_cache_table = table
+            self._filter_cache_version = table.version
+        
+        key = course_filter.key()
+        rows = self._filter_cache.get(key)
+        if rows is not None:
+            return rows
         
-        return results
+        if course_filter.course_id:
+            # 강좌번호가 지정되면 강좌번호만 비교 (CourseFilter.matches와 동일)
+            row = table.row_of(course_filter.course_id)
+            rows = np.array([] if row is None else [row], dtype=np.int64)
+        else:
+            rows = self._search_index.keyword_rows(
+                course_filter.name.split() if course_filter.name else [],
+                course_filter.professor.split() if course_filter.professor else []
+            )
+        
+        rows.flags.writeable = False
+        self._filter_cache[key] = rows
+        return rows
+    
+    def resolve_filter(self, course_filter: CourseFilter) -> List[Course]:
+        """필터에 매칭되는 강의 목록 (resolve_filter_rows의 뷰 버전)"""
+        return self._table.views(self.resolve_filter_rows(course_filter))
+    
+    def find_alternative_section_rows(
+        self,
+        name: str,
+        config: ScheduleConfig,
+        ignore: Optional[CourseFilter] = None
+    ) -> np.ndarray:
+        """
+        강의명이 같은 분반 중 현재 설정과 함께 들을 수 있는 분반의 행 번호 (카탈로그 순서)
+        
+        - 제외 요일/시간대와 겹치지 않음
+        - 후보가 하나뿐인 필수 강의(고정 분반)와 겹치지 않음
+        - 후보가 여럿인 필수 강의는 겹치지 않는 후보가 하나 이상 남아 있음
+        
+        판정은 분반이 아닌 시간 패턴 단위 비트 연산으로 처리 (분반 수만큼만 조회)
+        
+        Args:
+            name: 정확한 강의명
+            config: 현재 시간표 설정
+            ignore: 판정에서 뺄 필터 (분반을 바꾸려는 필터 자신)
+        """
+        table = self._table
+        sections = table.sections_of(name)
+        if len(sections) == 0:
+            return sections
+        
+        excluded = build_excluded_mask(config.excluded_days, config.excluded_time_slots)
+        
+        # 다른 필수 강의들: 고정 분반은 마스크 합집합, 나머지는 가능한 시간 패턴 집합
+        fixed = 0
+        groups = []
+        for course_filter in config.required_filters:
+            if course_filter is ignore:
+                continue
+            rows = self.resolve_filter_rows(course_filter)
+            masks = {table.time_mask_of(row) for row in rows.tolist()}
+            masks = {mask for mask in masks if not mask & excluded}
+            if not masks:
+                continue  # 이미 불가능한 필터는 분반 선택과 무관
+            if len(masks) == 1:
+                fixed |= next(iter(masks))
+            else:
+                groups.append(masks)
+        
+        blocked = excluded | fixed
+        codes = np.unique(table.pattern_codes[sections])
+        pattern_fits = {}
+        for code in codes.tolist():
+            mask = table.pattern_masks[code]
+            pattern_fits[code] = (
+                not mask & blocked
+                and all(any(not mask & other for other in group) for group in groups)
+            )
+        fits = np.array([pattern_fits[code] for code in table.pattern_codes[sections].tolist()], dtype=bool)
+        return sections[fits]
+    
+    def find_alternative_sections(
+        self,
+        name: str,
+        config: ScheduleConfig,
+        ignore: Optional[CourseFilter] = None
+    ) -> List[Course]:
+        """함께 들을 수 있는 분반 목록 (find_alternative_section_rows의 뷰 버전)"""
+        return self._table.views(self.find_alternative_section_rows(name, config, ignore))
+    
+    def query_courses(self, query: CourseQuery, with_facets: bool = False) -> QueryResult:
+        """
+        조건 검색 (학점/요일/시간대/학년/이수구분/N/P, 비트맵 인덱스 기반)
+        
+        Args:
+            query: 검색 조건 (query.rows로 검색 결과 안에서만 거를 수 있음)
+            with_facets: 조건별 결과 개수 계산 여부
+            
+        Returns:
+            결과 행 번호 + 패싯
+        """
+        return self._query_engine.query(query, with_facets)
     
     def filter_courses(
         self,
@@ -112,34 +298,19 @@ class CourseService(ICourseService):
         Returns:
             필터링된 강의 리스트
         """
-        if courses is None:
-            courses = self._all_courses
-        
-        filtered = courses.copy()
-        
-        # 학점 필터
-        if min_credits is not None:
-            filtered = [c for c in filtered if c.credits >= min_credits]
-        
-        if max_credits is not None:
-            filtered = [c for c in filtered if c.credits <= max_credits]
-        
-        # 요일 필터
-        if days:
-            filtered = [
-                c for c in filtered 
-                if any(slot.day in days for slot in c.time_slots)
-            ]
-        
-        # 교수 필터
-        if professor:
-            professor_lower = professor.lower()
-            filtered = [
-                c for c in filtered 
-                if professor_lower in c.professor.lower()
-            ]
+        rows = None
+        if courses is not None:
+            rows = [self._table.row_of(c.course_id) for c in courses]
+            rows = np.array([row for row in rows if row is not None], dtype=np.int64)
         
-        return filtered
+        result = self._query_engine.query(CourseQuery(
+            rows=rows,
+            min_credits=min_credits,
+            max_credits=max_credits,
+            days=set(days) if days else None,
+            professor=professor,
+        ))
+        return self._table.views(result.rows)
     
     def is_loaded(self) -> bool:
         """데이터 로드 여부 반환"""
@@ -147,4 +318,4 @@ class CourseService(ICourseService):
     
     def get_course_count(self) -> int:
         """총 강의 수 반환"""
-        return len(self._all_courses)
+        return len(self._table)
@@ -0,0 +1,281 @@
+"""
+필수 강의 실현 가능성 검사기
+설정을 편집하는 동안 필수 강의끼리, 또는 제외 시간대와의 충돌을 시간표 생성 없이 판정
+
+- 필터마다 후보 강의를 (강의명 코드, 시간 마스크) 선택지로 압축 (같은 시간의 분반은 하나로 취급)
+- 선택지는 (필터, 카탈로그 버전) 단위로 캐시하므로 편집 후에는 바뀐 필터만 다시 해석
+- 판정은 선택지가 적은 필터부터 고르는 백트래킹 + 전방 검사 (직전 해를 먼저 시도)
+- 시간표 생성기(_generate_required_combinations)와 같은 기준:
+  제외 시간과 겹치지 않는 분반이 하나도 없는 필터는 제외 조건 없이 전체 분반을 사용
+- 불가능하면 최소 충돌 집합(필수 강의 + 제외 조건 중 하나라도 빼면 가능해지는 부분집합)을 찾아 설명
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import ScheduleConfig, CourseFilter
+from ..core.models import build_excluded_mask
+
+# 선택지: (강의명 코드 또는 강의명, 시간 마스크) - 같은 강의명은 한 시간표에 하나만 들어갈 수 있음
+Option = Tuple[object, int]
+
+# 판정 결과 캐시 최대 크기 (넘으면 비움)
+VERDICT_CACHE_SIZE = 256
+
+# 필수 강의 조합이 불가능할 때의 기본 메시지 (ScheduleGenerator와 공용)
+CONFLICT_MESSAGE = "필수 강의들 간 시간 충돌 또는 제외된 시간대와 겹쳐서\n가능한 조합을 만들 수 없습니다."
+
+
+def _compatible(a: Option, b: Option) -> bool:
+    return a[0] != b[0] and not (a[1] & b[1])
+
+
+def find_assignment(
+    domains: Sequence[Sequence[Option]],
+    preferred: Optional[Sequence[Optional[Option]]] = None
+) -> Optional[List[Option]]:
+    """
+    그룹마다 선택지 하나씩, 서로 겹치지 않게 고르기
+
+    Args:
+        domains: 그룹별 선택지 목록
+        preferred: 그룹별로 먼저 시도할 선택지 (직전 해, 없으면 None)
+
+    Returns:
+        그룹 순서대로 고른 선택지 (불가능하면 None)
+    """
+    if any(not domain for domain in domains):
+        return None
+
+    count = len(domains)
+    chosen: List[Optional[Option]] = [None] * count
+
+    def backtrack(remaining: List[int], live: Dict[int, List[Option]]) -> bool:
+        if not remaining:
+            return True
+        # 남은 선택지가 가장 적은 그룹부터
+        index = min(remaining, key=lambda i: len(live[i]))
+        rest = [i for i in remaining if i != index]
+
+        options = live[index]
+        first = preferred[index] if preferred else None
+        if first in options:
+            options = [first] + [option for option in options if option != first]
+
+        for option in options:
+            # 전방 검사: 남은 그룹마다 호환되는 선택지가 하나 이상 있어야 함
+            pruned = {}
+            for other in rest:
+                compatible = [o for o in live[other] if _compatible(option, o)]
+                if not compatible:
+                    break
+                pruned[other] = compatible
+            else:
+                chosen[index] = option
+                if backtrack(rest, pruned):
+                    return True
+        return False
+
+    if not backtrack(list(range(count)), {i: list(domain) for i, domain in enumerate(domains)}):
+        return None
+    return chosen
+
+
+def _available(options: Sequence[Option], excluded: int) -> List[Option]:
+    """제외 시간과 겹치지 않는 선택지 (하나도 없으면 생성기처럼 전체 사용)"""
+    return [option for option in options if not option[1] & excluded] or list(options)
+
+
+def minimal_conflict(
+    domains: Sequence[Sequence[Option]],
+    constraint_masks: Sequence[int]
+) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    최소 충돌 집합 (삭제 기반 탐색)
+
+    전체 집합에서 원소를 하나씩 빼 보며, 빼도 여전히 불가능하면 그 원소를 버림
+    남은 집합은 어느 원소 하나만 빼도 조합이 가능해짐 (원소 수 n이면 판정 n회)
+    제외 조건을 먼저 줄이므로 설명은 가능한 한 강의끼리의 충돌로 좁혀짐
+
+    Args:
+        domains: 그룹별 선택지 (제외 조건 적용 전)
+        constraint_masks: 제외 조건(요일/시간대)별 마스크
+
+    Returns:
+        (그룹 번호 목록, 제외 조건 번호 목록), 전체가 가능하면 None
+    """
+    def feasible(groups: List[int], constraints: List[int]) -> bool:
+        excluded = 0
+        for index in constraints:
+            excluded |= constraint_masks[index]
+        return find_assignment([_available(domains[g], excluded) for g in groups]) is not None
+
+    groups = list(range(len(domains)))
+    constraints = list(range(len(constraint_masks)))
+    if feasible(groups, constraints):
+        return None
+
+    for index in list(constraints):
+        trial = [c for c in constraints if c != index]
+        if not feasible(groups, trial):
+            constraints = trial
+    for index in list(groups):
+        trial = [g for g in groups if g != index]
+        if not feasible(trial, constraints):
+            groups = trial
+    return groups, constraints
+
+
+@dataclass
+class ConflictExplanation:
+    """필수 강의 조합이 불가능한 이유 (최소 충돌 집합)"""
+    filters: List[CourseFilter] = field(default_factory=list)
+    excluded_days: List[str] = field(default_factory=list)
+    excluded_time_slots: List[Tuple[str, str, str]] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """예: '자료구조, 운영체제 + 제외 요일: 월'"""
+        parts = [", ".join(filter_label(f) for f in self.filters)] if self.filters else []
+        if self.excluded_days:
+            parts.append("제외 요일: " + ", ".join(self.excluded_days))
+        if self.excluded_time_slots:
+            parts.append("제외 시간: " + ", ".join(f"{d} {s}~{e}" for d, s, e in self.excluded_time_slots))
+        return " + ".join(parts)
+
+    def message(self) -> str:
+        """사용자에게 보여줄 오류 메시지"""
+        return f"{CONFLICT_MESSAGE}\n\n충돌 원인: {self.describe()}"
+
+
+def filter_label(course_filter: CourseFilter) -> str:
+    """필터 표시 이름"""
+    return course_filter.name or course_filter.professor or course_filter.course_id or "알 수 없는 필터"
+
+
+def explain_conflict(
+    filters: Sequence[CourseFilter],
+    domains: Sequence[Sequence[Option]],
+    config: ScheduleConfig
+) -> Optional[ConflictExplanation]:
+    """
+    필수 필터와 제외 조건 중 최소 충돌 집합 찾기
+
+    Args:
+        filters: 필수 강의 필터 (domains와 같은 순서)
+        domains: 필터별 선택지 (제외 조건 적용 전)
+        config: 제외 요일/시간대를 가진 설정
+
+    Returns:
+        충돌 설명 (조합이 가능하면 None)
+    """
+    constraints = [('day', day, build_excluded_mask([day], [])) for day in config.excluded_days]
+    constraints += [('time', slot, build_excluded_mask([], [slot])) for slot in config.excluded_time_slots]
+
+    found = minimal_conflict(domains, [mask for _, _, mask in constraints])
+    if found is None:
+        return None
+    groups, constraint_indices = found
+
+    explanation = ConflictExplanation(filters=[filters[g] for g in groups])
+    for index in constraint_indices:
+        kind, value, _ = constraints[index]
+        if kind == 'day':
+            explanation.excluded_days.append(value)
+        else:
+            explanation.excluded_time_slots.append(tuple(value))
+    return explanation
+
+
+@dataclass
+class FeasibilityResult:
+    """실현 가능성 판정 결과"""
+    feasible: bool
+    message: str = ""
+    conflict: Optional[ConflictExplanation] = None  # 불가능한 경우 최소 충돌 집합
+
+    def as_status(self) -> Tuple[bool, str]:
+        """ConfigViewModel 'validation_status' 형식"""
+        return (self.feasible, self.message)
+
+
+class FeasibilityChecker:
+    """
+    필수 강의 조합 가능 여부 검사 (CourseService의 필터 캐시/시간 마스크 사용)
+    ConfigViewModel이 백그라운드 스레드에서 호출하므로 검사는 한 번에 하나씩 수행
+    """
+
+    def __init__(self, course_service):
+        self.course_service = course_service
+        self._lock = threading.Lock()
+        self._version = -1
+        self._options: Dict[Tuple, Tuple[Option, ...]] = {}
+        self._verdicts: Dict[Tuple, FeasibilityResult] = {}
+        self._last_choice: Dict[Tuple, Option] = {}
+
+    def _sync(self):
+        """카탈로그가 바뀌었으면 캐시 비움"""
+        table = self.course_service.get_course_table()
+        if self._version != table.version:
+            self._options = {}
+            self._verdicts = {}
+            self._last_choice = {}
+            self._version = table.version
+
+    def options_of(self, course_filter: CourseFilter) -> Tuple[Option, ...]:
+        """필터 후보의 서로 다른 (강의명 코드, 시간 마스크) 선택지 (카탈로그 순서)"""
+        key = course_filter.key()
+        options = self._options.get(key)
+        if options is None:
+            table = self.course_service.get_course_table()
+            rows = self.course_service.resolve_filter_rows(course_filter).tolist()
+            options = tuple(dict.fromkeys(
+                (int(table.name_codes[row]), table.time_mask_of(row)) for row in rows
+            ))
+            self._options[key] = options
+        return options
+
+    def check(self, config: ScheduleConfig) -> FeasibilityResult:
+        """
+        필수 강의를 모두 함께 들을 수 있는지 판정
+
+        Args:
+            config: 현재 시간표 설정
+
+        Returns:
+            판정 결과 (불가능하면 사용자에게 보여줄 메시지 포함)
+        """
+        with self._lock:
+            self._sync()
+            excluded = build_excluded_mask(config.excluded_days, config.excluded_time_slots)
+            filters = config.required_filters
+            cache_key = (tuple(f.key() for f in filters), excluded)
+            cached = self._verdicts.get(cache_key)
+            if cached is not None:
+                return cached
+
+            all_options = []
+            domains = []
+            for course_filter in filters:
+                options = self.options_of(course_filter)
+                if not options:
+                    return self._remember(cache_key, FeasibilityResult(
+                        False, f"필수 강의를 찾을 수 없습니다: {filter_label(course_filter)}"
+                    ))
+                all_options.append(options)
+                domains.append(_available(options, excluded))
+
+            keys = [f.key() for f in filters]
+            assignment = find_assignment(domains, [self._last_choice.get(key) for key in keys])
+            if assignment is None:
+                conflict = explain_conflict(filters, all_options, config)
+                message = conflict.message() if conflict else CONFLICT_MESSAGE
+                return self._remember(cache_key, FeasibilityResult(False, message, conflict))
+
+            self._last_choice.update(zip(keys, assignment))
+            return self._remember(cache_key, FeasibilityResult(True))
+
+    def _remember(self, cache_key: Tuple, result: FeasibilityResult) -> FeasibilityResult:
+        if len(self._verdicts) >= VERDICT_CACHE_SIZE:
+            self._verdicts = {}
+        self._verdicts[cache_key] = result
+        return result
@@ -0,0 +1,184 @@
+"""
+저장된 수강편람 HTML 페이지 수집기
+크롤러가 저장한 페이지 파일들을 프로세스 풀에서 병렬로 파싱하고,
+중복을 제거하며 하나의 CSV로 순차 기록
+"""
+import csv
+import glob
+import math
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+# 크롤러가 저장하는 페이지 파일 이름 (page_001.html, page_002.html, ...)
+PAGE_FILE_PATTERN = 'page_*.html'
+
+
+@dataclass
+class IngestResult:
+    """수집 결과 요약"""
+    output_path: str
+    pages: int = 0
+    rows: int = 0
+    duplicates: int = 0
+    failed_pages: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (f"{self.pages}개 페이지, {self.rows}개 강의 "
+                f"(중복 {self.duplicates}개 제거, 실패 {len(self.failed_pages)}개)")
+
+
+def _normalize_cell(value) -> str:
+    """셀 값을 CSV 문자열로 정규화 (결측 → '', 3.0 → '3')"""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def _column_name(column) -> str:
+    # 다단 헤더는 마지막 줄을 컬럼명으로 사용
+    if isinstance(column, tuple):
+        column = column[-1]
+    return _normalize_cell(column)
+
+
+def parse_page(path: str) -> Tuple[List[str], List[Tuple[str, ...]]]:
+    """
+    저장된 페이지 하나에서 강의 표 추출 (가장 행이 많은 표)
+
+    Args:
+        path: HTML 파일 경로
+
+    Returns:
+        (컬럼명 목록, 정규화된 행 목록)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    tables = pd.read_html(StringIO(html))
+    table = max(tables, key=len)
+
+    columns = [_column_name(c) for c in table.columns]
+    rows = [
+        tuple(_normalize_cell(value) for value in row)
+        for row in table.itertuples(index=False, name=None)
+    ]
+    return columns, rows
+
+
+def create_run_dir(root: str) -> str:
+    """
+    크롤링 한 번의 페이지를 저장할 새 디렉토리 생성 (root/20250101-120000-xxxx)
+    이전 실행의 페이지가 섞이지 않도록 항상 비어 있는 디렉토리를 돌려줌
+
+    Args:
+        root: 실행별 디렉토리를 모아두는 상위 디렉토리
+
+    Returns:
+        생성된 디렉토리 경로
+    """
+    os.makedirs(root, exist_ok=True)
+    return tempfile.mkdtemp(prefix=time.strftime('%Y%m%d-%H%M%S-'), dir=root)
+
+
+def _page_sort_key(path: str):
+    # page_2.html이 page_10.html보다 앞에 오도록 숫자 기준 정렬
+    numbers = re.findall(r'\d+', os.path.basename(path))
+    return (int(numbers[-1]) if numbers else -1, path)
+
+
+def _parse_page_safe(path: str):
+    """워커 프로세스용: 예외를 결과로 돌려줘서 한 페이지 실패가 전체를 멈추지 않게 함"""
+    try:
+        return path, parse_page(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def ingest_pages(
+    page_dir: str,
+    output_path: str,
+    pattern: str = PAGE_FILE_PATTERN,
+    max_workers: Optional[int] = None
+) -> IngestResult:
+    """
+    저장된 페이지들을 병렬 파싱하여 하나의 CSV로 기록
+
+    Args:
+        page_dir: 페이지 HTML 파일이 있는 디렉토리
+        output_path: 출력 CSV 경로 (utf-8-sig)
+        pattern: 페이지 파일 glob 패턴
+        max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 처리)
+
+    Returns:
+        수집 결과 요약
+    """
+    paths = sorted(glob.glob(os.path.join(page_dir, pattern)), key=_page_sort_key)
+    result = IngestResult(output_path=output_path, pages=len(paths))
+    if not paths:
+        raise FileNotFoundError(f"페이지 파일이 없습니다: {os.path.join(page_dir, pattern)}")
+
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers != 1 else None
+    try:
+        # map은 페이지 순서를 유지하므로 결과를 받는 대로 바로 기록 가능
+        if executor:
+            parsed = executor.map(_parse_page_safe, paths, chunksize=4)
+        else:
+            parsed = map(_parse_page_safe, paths)
+
+        header = None
+        seen = set()
+        with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            for path, page, error in parsed:
+                if error is not None:
+                    print(f"⚠️ 페이지 파싱 실패: {path} ({error})")
+                    result.failed_pages.append(path)
+                    continue
+
+                columns, rows = page
+                if header is None:
+                    header = columns
+                    writer.writerow(header)
+                elif columns != header:
+                    print(f"⚠️ 컬럼 구성이 다른 페이지 건너뜀: {path}")
+                    result.failed_pages.append(path)
+                    continue
+
+                for row in rows:
+                    if row in seen:
+                        result.duplicates += 1
+                        continue
+                    seen.add(row)
+                    writer.writerow(row)
+                    result.rows += 1
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return result
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='저장된 수강편람 페이지를 CSV로 변환')
+    parser.add_argument('page_dir', help='페이지 HTML 디렉토리')
+    parser.add_argument('output', help='출력 CSV 경로')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수')
+    args = parser.parse_args()
+
+    ingest_result = ingest_pages(args.page_dir, args.output, max_workers=args.workers)
+    print(f"🎉 {ingest_result.summary()} → {ingest_result.output_path}")
@@ -1,11 +1,22 @@
 """
 CSV 파일 파서
 명지대 시간표 CSV를 파싱하여 Course 객체 리스트로 변환
+
+pandas는 실제로 파싱할 때 가져옴 (앱 시작 시 import 비용을 카탈로그 로드 스레드로 미룸)
 """
-import pandas as pd
+from __future__ import annotations
+
 import re
-from typing import List
-from ..core.models import Course, TimeSlot
+from typing import TYPE_CHECKING, List, Tuple
+from ..core.models import Course, TimeSlot, calculate_time_mask
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 정규식 패턴: (요일) (시작시간)~(종료시간) (강의실)
+# 예: "월 09:00~10:50 (S1221)"
+TIME_PATTERN = r'([월화수목금])\s+(\d{2}:\d{2})~(\d{2}:\d{2})\s*(?:\(([^)]*)\))?'
+_TIME_REGEX = re.compile(TIME_PATTERN)
 
 
 def parse_time_string(time_str: str) -> List[TimeSlot]:
@@ -16,16 +27,13 @@ def parse_time_string(time_str: str) -> List[TimeSlot]:
     - "월 09:00~10:50 (S1221)" → [TimeSlot(day="월", start="09:00", end="10:50", room="S1221")]
     - "화 13:30~14:45 (S1919)  목 13:30~14:45 (S1919)" → 2개의 TimeSlot
     """
+    import pandas as pd
     if not time_str or pd.isna(time_str):
         return []
     
     time_slots = []
     
-    # 정규식 패턴: (요일) (시작시간)~(종료시간) (강의실)
-    # 예: "월 09:00~10:50 (S1221)"
-    pattern = r'([월화수목금])\s+(\d{2}:\d{2})~(\d{2}:\d{2})\s*(?:\(([^)]*)\))?'
-    
-    matches = re.findall(pattern, time_str)
+    matches = _TIME_REGEX.findall(time_str)
     
     for match in matches:
         day, start_time, end_time, room = match
@@ -39,6 +47,64 @@ def parse_time_string(time_str: str) -> List[TimeSlot]:
     return time_slots
 
 
+def parse_time_column(time_strings: pd.Series) -> Tuple[List[int], List[Tuple[TimeSlot, ...]], List[int]]:
+    """
+    강의시간 컬럼 전체를 한 번에 파싱 (대량 임포트용)
+    
+    대부분의 강좌는 수십 개의 시간 패턴을 공유하므로, 서로 다른 문자열만 골라
+    한 번의 정규식 추출(str.extractall)로 파싱하고 패턴별 비트마스크를 한 번씩만 계산한 뒤
+    각 행에 패턴 코드로 되돌려 줌
+    
+    Args:
+        time_strings: 강의시간 문자열 Series (결측값 허용)
+        
+    Returns:
+        (행별 패턴 코드, 패턴별 TimeSlot 튜플, 패턴별 비트마스크)
+        결측/파싱 불가 행의 패턴 코드는 -1
+    """
+    import pandas as pd
+    codes, uniques = pd.factorize(time_strings.astype(object), use_na_sentinel=True)
+    unique_strings = pd.Series(uniques, dtype=object).astype(str)
+    
+    # 1. 서로 다른 시간 문자열 전체에서 (요일, 시작, 종료, 강의실)을 한 번에 추출
+    slots_by_unique: List[List[TimeSlot]] = [[] for _ in range(len(unique_strings))]
+    if len(unique_strings):
+        extracted = unique_strings.str.extractall(TIME_PATTERN)
+        unique_idx = extracted.index.get_level_values(0)
+        for idx, day, start, end, room in zip(
+            unique_idx, extracted[0], extracted[1], extracted[2], extracted[3].fillna('')
+        ):
+            slots_by_unique[idx].append(TimeSlot(day=day, start_time=start, end_time=end, room=room))
+    
+    # 2. 패턴별 TimeSlot 튜플과 비트마스크는 한 번씩만 계산
+    patterns = [tuple(slots) for slots in slots_by_unique]
+    masks = [calculate_time_mask(slots) for slots in patterns]
+    
+    # 3. 슬롯이 없는 패턴(형식 오류 등)은 결측과 동일하게 -1로 표시
+    row_codes = [
+        code if code >= 0 and patterns[code] else -1
+        for code in codes.tolist()
+    ]
+    return row_codes, patterns, masks
+
+
+def _text_column(df: pd.DataFrame, column: str) -> List[str]:
+    """텍스트 컬럼을 공백 제거된 문자열 리스트로 변환 (결측/없는 컬럼은 빈 문자열)"""
+    if not column or column not in df.columns:
+        return [''] * len(df)
+    series = df[column].astype(object)
+    return series.where(series.notna(), '').astype(str).str.strip().tolist()
+
+
+def _credits_column(df: pd.DataFrame, column: str) -> List[int]:
+    """학점 컬럼을 정수 리스트로 변환 (숫자가 아닌 값은 0)"""
+    if not column or column not in df.columns:
+        return [0] * len(df)
+    import pandas as pd
+    numeric = pd.to_numeric(df[column], errors='coerce').fillna(0)
+    return numeric.astype(float).astype(int).tolist()
+
+
 class CsvParser:
     """CSV 파싱을 담당하는 클래스"""
     
@@ -47,10 +113,12 @@ class CsvParser:
         """
         명지대 시간표 CSV 파일을 파싱하여 Course 리스트 반환
         
-        사용 컬럼: 교과목명, 학점, 담당교수, 강좌번호, 강의시간
+        사용 컬럼: 교과목명, 학점, 담당교수, 강좌번호, 강의시간 (+ 선택: 이수구분, 학년, N/P과목)
         """
         print(f"CSV 파일 로딩 중: {filepath}")
         
+        import pandas as pd
+        
         # CSV 읽기 (인코딩 자동 감지)
         try:
             df = pd.read_csv(filepath, encoding='utf-8-sig')
@@ -65,7 +133,8 @@ class CsvParser:
             'professor': ['담당교수', '교수명', '교수'],
             'time': ['강의시간', '시간', '요일/교시', '강의시간표'],
             'category': ['이수구분', '이수', '구분', 'category'],
-            'grade': ['학년', '대상학년']
+            'grade': ['학년', '대상학년'],
+            'pass_fail': ['N/P과목', 'N/P', 'P/F']
         }
         
         # 실제 CSV 컬럼과 매핑 찾기
@@ -76,8 +145,8 @@ class CsvParser:
                     actual_cols[key] = candidate
                     break
             if key not in actual_cols:
-                # category, grade는 선택 사항이므로 경고 없이 넘어감
-                if key in ['category', 'grade']:
+                # category, grade, pass_fail은 선택 사항이므로 경고 없이 넘어감
+                if key in ['category', 'grade', 'pass_fail']:
                     continue
                     
                 print(f"⚠️  필수 컬럼을 찾을 수 없습니다: {key} (후보: {candidates})")
@@ -85,55 +154,37 @@ class CsvParser:
                 if key == 'time' or key == 'name':
                     return []
 
+        # 컬럼 단위로 한 번에 추출 (행 단위 iterrows 제거)
+        row_codes, patterns, masks = parse_time_column(df[actual_cols['time']])
+        course_ids = _text_column(df, actual_cols.get('id'))
+        names = _text_column(df, actual_cols['name'])
+        credits = _credits_column(df, actual_cols.get('credits'))
+        professors = _text_column(df, actual_cols.get('professor'))
+        categories = _text_column(df, actual_cols.get('category'))
+        target_grades = _text_column(df, actual_cols.get('grade'))
+        pass_fail = [value.upper() == 'Y' for value in _text_column(df, actual_cols.get('pass_fail'))]
+
         courses = []
         skipped = 0
         
-        for idx, row in df.iterrows():
-            # 데이터 추출 (안전하게)
-            time_str = str(row.get(actual_cols['time'], '')).strip()
-            
-            # 강의시간이 없는 강좌는 스킵
-            if not time_str or time_str == 'nan':
+        for idx, code in enumerate(row_codes):
+            # 강의시간이 없거나 파싱되지 않는 강좌는 스킵
+            if code < 0:
                 skipped += 1
                 continue
             
-            # 시간 파싱
-            time_slots = parse_time_string(time_str)
-            
-            if not time_slots:
-                skipped += 1
-                continue
-            
-            # 나머지 데이터 추출
             try:
-                course_id = str(row.get(actual_cols.get('id', ''), '')).strip()
-                name = str(row.get(actual_cols['name'], '')).strip()
-                
-                # 학점 처리 (숫자가 아닌 경우 대비)
-                credits_val = row.get(actual_cols.get('credits', 0), 0)
-                try:
-                    credits = int(float(credits_val))
-                except (ValueError, TypeError):
-                    credits = 0
-                    
-                professor = str(row.get(actual_cols.get('professor', ''), '')).strip()
-                if professor == 'nan': professor = ''
-                
-                category = str(row.get(actual_cols.get('category', ''), '')).strip()
-                if category == 'nan': category = ''
-
-                target_grade = str(row.get(actual_cols.get('grade', ''), ''),).strip()
-                if target_grade == 'nan': target_grade = ''
-
-                # Course 객체 생성
+                # Course 객체 생성 (같은 시간 패턴은 TimeSlot 튜플과 비트마스크를 공유)
                 course = Course(
-                    course_id=course_id,
-                    name=name,
-                    credits=credits,
-                    professor=professor,
-                    time_slots=time_slots,
-                    category=category,
-                    target_grade=target_grade
+                    course_id=course_ids[idx],
+                    name=names[idx],
+                    credits=credits[idx],
+                    professor=professors[idx],
+                    time_slots=patterns[code],
+                    category=categories[idx],
+                    target_grade=target_grades[idx],
+                    time_mask=masks[code],
+                    pass_fail=pass_fail[idx]
                 )
                 
                 courses.append(course)
@@ -0,0 +1,139 @@
+"""
+시간표 생성 결과 디스크 캐시
+(설정 지문 + 카탈로그 지문) 단위로 압축 결과(JSON)와 렌더링된 HTML을 저장하여
+같은 설정으로 다시 생성하면 탐색 없이 바로 결과를 돌려줌 (앱을 다시 시작해도 유지)
+
+- 항목: <key>.json (조합별 강좌번호), <key>-<결과 화면 버전>.html (결과 화면)
+  (결과 화면 템플릿이 바뀐 뒤에는 이전 빌드가 렌더링한 HTML을 쓰지 않음)
+- 용량 기준 LRU: 읽을 때 수정 시각을 갱신하고, 전체 크기가 한도를 넘으면 오래된 항목부터 삭제
+"""
+import hashlib
+import json
+import os
+import shutil
+from typing import Optional
+
+from ..core.config import ScheduleConfig
+from ..core.course_table import CourseTable
+from ..core.result_store import ResultStore
+from .visualizer import HtmlVisualizer
+
+# 캐시 전체 크기 한도 (bytes)
+DEFAULT_CACHE_BYTES = 50 * 1024 * 1024
+
+# 저장 형식 버전 (형식이 바뀌면 올려서 이전 항목을 무시)
+CACHE_FORMAT = 1
+
+
+class ResultCache:
+    """생성 결과 디스크 캐시"""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Args:
+            directory: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 전체 크기 한도
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(config: ScheduleConfig, table: CourseTable) -> str:
+        """설정 지문 + 카탈로그 지문"""
+        key = f"{CACHE_FORMAT}:{config.fingerprint()}:{table.fingerprint()}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    def _touch(self, path: str):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def load(self, key: str, table: CourseTable) -> Optional[ResultStore]:
+        """저장된 결과 (없거나 읽을 수 없으면 None)"""
+        path = self._path(key, 'json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        store = ResultStore.from_dict(data, table)
+        if store is None or len(store) == 0:
+            return None
+        self._touch(path)
+        return store
+
+    def _html_path(self, key: str) -> str:
+        return self._path(f"{key}-{HtmlVisualizer.VIEWER_VERSION}", 'html')
+
+    def html_path(self, key: str) -> Optional[str]:
+        """저장된 결과 화면 HTML 경로 (현재 결과 화면 버전으로 렌더링한 것만, 없으면 None)"""
+        path = self._html_path(key)
+        if not os.path.exists(path):
+            return None
+        self._touch(path)
+        return path
+
+    def store(self, key: str, results: ResultStore, table: CourseTable):
+        """결과 저장 (임시 파일에 쓴 뒤 교체)"""
+        self._write(self._path(key, 'json'), lambda f: json.dump(results.to_dict(table), f, ensure_ascii=False))
+
+    def store_html(self, key: str, html_path: str):
+        """렌더링된 결과 화면 저장 (파일 복사)"""
+        def copy(f):
+            with open(html_path, 'r', encoding='utf-8') as src:
+                shutil.copyfileobj(src, f)
+        self._write(self._html_path(key), copy)
+
+    def _write(self, path: str, write):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 결과 캐시 저장 실패: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        """전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        # 항목(key) 단위로 크기/최근 사용 시각/파일 집계 (이전 버전 결과 화면 HTML 포함)
+        entries = {}
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext not in ('.json', '.html'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            key = stem.partition('-')[0]
+            size, used, files = entries.get(key, (0, 0.0, []))
+            files.append(name)
+            entries[key] = (size + stat.st_size, max(used, stat.st_mtime), files)
+
+        total = sum(size for size, _, _ in entries.values())
+        for size, _, files in sorted(entries.values(), key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            for name in files:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            total -= size
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,243 @@
+"""
+결과 화면 데이터 원본 (페이지 단위 조회 + 핀 질의)
+앱 안의 결과 화면(QWebChannel)은 필요한 조합만 페이지 단위로 가져가고,
+핀/분반 순환 질의는 여기서 색인 교집합으로 처리 (결과 개수 제한 없음)
+
+- 분반 테이블은 추가만 됨: 페이지 응답에는 화면이 아직 모르는 분반만 포함
+- 핀 색인: 강의명 → 첫 시간대('요일 시작') → 조합 번호 (오름차순, 결과가 추가되면 뒤에 이어 붙임)
+- 내보낸 HTML의 내장 데이터(pack())도 같은 색인에서 만들므로 두 모드의 질의 결과가 같음
+- 생성 스레드가 extend()하는 동안 UI 스레드가 질의할 수 있으므로 잠금으로 보호
+"""
+import threading
+from array import array
+from dataclasses import dataclass
+from functools import wraps
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ..core.models import Course, Schedule
+
+# 결과 화면이 한 번에 요청하는 조합 수
+PAGE_SIZE = 200
+
+
+def pin_key(course: Course) -> Optional[str]:
+    """핀 기준 시간대 '요일 시작' (첫 시간대, 시간 정보가 없으면 None)"""
+    if not course.time_slots:
+        return None
+    first = course.time_slots[0]
+    return f"{first.day} {first.start_time}"
+
+
+def _locked(method):
+    """ResultPages 메서드를 인스턴스 잠금 안에서 실행"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+@dataclass
+class PackedSchedules:
+    """결과 화면용 정규화 데이터 (JSON/base64 인코딩 전 단계, 타입 배열로 압축 보관)"""
+    sections: List[list]                    # [강의명, 학점, 교수명, [[요일, 시작, 종료], ...]]
+    rows: np.ndarray                        # 조합별 분반 번호 (평탄화)
+    offsets: np.ndarray                     # <u4, 조합 i의 분반 번호는 rows[offsets[i]:offsets[i + 1]]
+    credits: np.ndarray                     # uint8, 총 학점
+    filled: np.ndarray                      # uint8, 랜덤 채우기 여부
+    pins: Dict[str, Dict[str, np.ndarray]]  # 강의명 → 첫 시간대('요일 시작') → 조합 번호 (오름차순)
+    course_info: Dict[str, int]             # 강의명 → 대표 분반 번호 (결과에 처음 나온 분반)
+
+    @property
+    def index_type(self) -> str:
+        return 'u16' if self.rows.dtype == np.dtype('<u2') else 'u32'
+
+    @property
+    def id_type(self) -> str:
+        return 'u16' if len(self.credits) <= 0xFFFF else 'u32'
+
+
+class ResultPages:
+    """
+    생성 결과의 분반 테이블 + 조합별 분반 번호 + 핀 색인
+    (결과가 늘어나면 extend()로 뒤에 이어 붙임)
+    """
+
+    def __init__(self, schedules: Iterable[Schedule] = (),
+                 required_names: Iterable[str] = (), desired_names: Iterable[str] = ()):
+        """
+        Args:
+            schedules: 생성된 시간표 (표시 순서)
+            required_names: 필수 강의명 (화면 강조용)
+            desired_names: 희망 강의명 (결과에 없어도 목록에 표시)
+        """
+        self.required_names = set(required_names)
+        self.desired_names = set(desired_names)
+        self._section_index: Dict[str, int] = {}
+        self._sections: List[list] = []
+        self._rows = array('I')
+        self._offsets = array('I', [0])
+        self._credits = array('B')
+        self._filled = array('B')
+        self._pins: Dict[str, Dict[str, array]] = {}
+        self._course_info: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.extend(schedules)
+
+    def __len__(self) -> int:
+        return len(self._credits)
+
+    @_locked
+    def extend(self, schedules: Iterable[Schedule]) -> int:
+        """결과 추가 (추가 후 전체 개수 반환)"""
+        for schedule in schedules:
+            schedule_id = len(self._credits)
+            for course in schedule.courses:
+                index = self._section_index.get(course.course_id)
+                if index is None:
+                    index = self._section_index[course.course_id] = len(self._sections)
+                    self._sections.append([
+                        course.name, course.credits, course.professor,
+                        [[t.day, t.start_time, t.end_time] for t in course.time_slots]
+                    ])
+                    self._course_info.setdefault(course.name, index)
+                self._rows.append(index)
+                key = pin_key(course)
+                if key is not None:
+                    self._pins.setdefault(course.name, {}).setdefault(key, array('I')).append(schedule_id)
+            self._offsets.append(len(self._rows))
+            self._credits.append(min(schedule.total_credits, 0xFF))
+            self._filled.append(1 if getattr(schedule, 'has_random_filled', False) else 0)
+        return len(self)
+
+    # --- 결과 화면 질의 (QWebChannel 브리지가 JSON으로 전달) ---
+
+    @_locked
+    def summary(self) -> dict:
+        """결과 개수, 강의 목록(사이드바), 강의명별 대표 분반"""
+        names = self.desired_names | self.required_names | set(self._course_info)
+        return {
+            'count': len(self),
+            'all_names': sorted(names),
+            'required_names': sorted(self.required_names),
+            'course_info': {name: self._sections[index] for name, index in self._course_info.items()},
+        }
+
+    @_locked
+    def page(self, start: int, limit: int = PAGE_SIZE, known_sections: int = 0) -> dict:
+        """
+        조합 일부
+
+        Args:
+            start: 첫 조합 번호
+            limit: 최대 개수
+            known_sections: 화면이 이미 가진 분반 수 (그 이후 분반만 응답에 포함)
+
+        Returns:
+            {'start', 'section_base', 'sections': 새 분반, 'schedules': [[분반 번호 목록, 학점, 채우기 여부], ...]}
+        """
+        start = max(0, start)
+        end = min(len(self), start + max(0, limit))
+        known_sections = max(0, min(known_sections, len(self._sections)))
+        schedules = [
+            [self._rows[self._offsets[i]:self._offsets[i + 1]].tolist(), self._credits[i], self._filled[i] == 1]
+            for i in range(start, end)
+        ]
+        return {
+            'start': start,
+            'section_base': known_sections,
+            'sections': self._sections[known_sections:],
+            'schedules': schedules,
+        }
+
+    @_locked
+    def schedule(self, index: int) -> Tuple[List[list], int, bool]:
+        """조합 하나 (분반 목록, 총 학점, 랜덤 채우기 여부)"""
+        rows = self._rows[self._offsets[index]:self._offsets[index + 1]]
+        return [self._sections[row] for row in rows], self._credits[index], self._filled[index] == 1
+
+    @_locked
+    def course_info(self, name: str) -> Optional[list]:
+        """강의명의 대표 분반 (결과에 없으면 None)"""
+        index = self._course_info.get(name)
+        return self._sections[index] if index is not None else None
+
+    def _ids(self, name: str, key: str) -> np.ndarray:
+        ids = self._pins.get(name, {}).get(key)
+        return np.frombuffer(ids, dtype=np.uint32) if ids else np.zeros(0, dtype=np.uint32)
+
+    @_locked
+    def match(self, pins: Mapping[str, str]) -> List[int]:
+        """고정(핀) 조건을 모두 만족하는 조합 번호 (오름차순, 조건이 없으면 전체)"""
+        if not pins:
+            return list(range(len(self)))
+        lists = sorted((self._ids(name, key) for name, key in pins.items()), key=len)
+        result = lists[0]
+        for ids in lists[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result.tolist()
+
+    @_locked
+    def first_slot(self, name: str, pins: Mapping[str, str]) -> Optional[str]:
+        """고정 조건 안에서 가장 앞 조합에 나오는 강의의 시간대 (없으면 None)"""
+        within = np.asarray(self.match(pins), dtype=np.uint32) if pins else None
+        best_key, best_id = None, None
+        for key, ids in self._pins.get(name, {}).items():
+            matched = np.frombuffer(ids, dtype=np.uint32)
+            if within is not None:
+                matched = np.intersect1d(within, matched, assume_unique=True)
+            if len(matched) and (best_id is None or matched[0] < best_id):
+                best_key, best_id = key, int(matched[0])
+        return best_key
+
+    @_locked
+    def slot_options(self, name: str, pins: Mapping[str, str]) -> dict:
+        """
+        나머지 고정 조건과 함께 가능한 강의의 시간대
+
+        Returns:
+            {'available': 가능한 시간대 (정렬), 'total': 결과에 나오는 전체 시간대 수}
+        """
+        slots = self._pins.get(name, {})
+        within = np.asarray(self.match(pins), dtype=np.uint32) if pins else None
+        available = [
+            key for key, ids in slots.items()
+            if within is None or len(np.intersect1d(within, np.frombuffer(ids, dtype=np.uint32), assume_unique=True))
+        ]
+        return {'available': sorted(available), 'total': len(slots)}
+
+    # --- 내보내기 (HTML 내장 데이터) ---
+
+    @_locked
+    def pack(self) -> PackedSchedules:
+        """타입 배열 형태로 변환"""
+        index_dtype = '<u2' if len(self._sections) <= 0xFFFF else '<u4'
+        id_dtype = '<u2' if len(self) <= 0xFFFF else '<u4'
+        return PackedSchedules(
+            sections=self._sections,
+            rows=np.asarray(self._rows, dtype=index_dtype),
+            offsets=np.asarray(self._offsets, dtype='<u4'),
+            credits=np.asarray(self._credits, dtype=np.uint8),
+            filled=np.asarray(self._filled, dtype=np.uint8),
+            pins={
+                name: {key: np.asarray(ids, dtype=id_dtype) for key, ids in slots.items()}
+                for name, slots in self._pins.items()
+            },
+            course_info=self._course_info,
+        )
+
+
+def pack_schedules(schedules: List[Schedule]) -> PackedSchedules:
+    """
+    결과 화면용 정규화
+
+    같은 분반이 수천 개 조합에 반복 직렬화되지 않도록
+    분반 정보는 테이블에 한 번만 넣고, 조합은 분반 번호 배열 + 오프셋으로 표현
+    결과 화면의 핀/분반 순환은 조합 전체를 훑지 않도록
+    (강의명, 첫 시간대) → 조합 번호 목록 역색인을 함께 만들어 목록 교집합으로 처리
+    """
+    return ResultPages(schedules).pack()
@@ -3,23 +3,44 @@
 ScheduleGenerator 래핑 및 진행률 관리
 """
 import os
+import random
+import shutil
 import webbrowser
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Set
 
 from .scheduler import ScheduleGenerator
 from .visualizer import generate_html
-from ..core.models import Schedule
-from ..core.config import ScheduleConfig
+from .result_cache import ResultCache
+from .result_pages import ResultPages
+from ..core.models import Schedule, build_excluded_mask
+from ..core.result_store import ResultStore
+from ..core.config import ScheduleConfig, ConfigChange, classify_change
+from ..core.constants import SchedulerConfig as AlgoConfig
 from ..core.interfaces import IScheduleService
 
 
 class ScheduleService(IScheduleService):
     """시간표 생성 서비스"""
     
-    def __init__(self):
+    def __init__(self, course_service=None, result_cache: Optional[ResultCache] = None):
+        """
+        Args:
+            course_service: ICourseService 구현체 (필터 해석에 사용, None이면 카탈로그 전체 검사)
+            result_cache: 생성 결과 디스크 캐시 (None이면 캐시 안 함, course_service 필요)
+        """
+        self._course_service = course_service
+        self._result_cache = result_cache if course_service else None
+        self._cache_key: Optional[str] = None  # 현재 결과의 캐시 키
+        self._config: Optional[ScheduleConfig] = None  # 현재 결과를 만든 설정 (마지막 생성 스냅샷)
+        self._store: Optional[ResultStore] = None  # 현재 결과의 압축본 (증분 재생성용)
+        self._store_table = None  # _store의 행 번호가 가리키는 카탈로그와 그 버전
+        self._store_version = -1
         self._generator: Optional[ScheduleGenerator] = None
         self._schedules: List[Schedule] = []
+        self._pages: Optional[ResultPages] = None  # 결과 화면 데이터 원본 (_schedules 기준, 필요할 때 구성)
+        self._pages_source: Optional[List[Schedule]] = None
         self._progress_callback: Optional[Callable] = None
+        self._result_callback: Optional[Callable[[int], None]] = None
     
     def set_progress_callback(self, callback: Callable):
         """
@@ -30,6 +51,16 @@ class ScheduleService(IScheduleService):
         """
         self._progress_callback = callback
     
+    def set_result_callback(self, callback: Optional[Callable[[int], None]]):
+        """
+        생성 중 새 결과 알림 콜백 설정 (결과 화면 점진 표시용)
+        
+        Args:
+            callback: 지금까지 찾은 조합 개수를 받을 함수 (생성 스레드에서 호출,
+                      그 시점의 결과는 get_result_pages()로 조회)
+        """
+        self._result_callback = callback
+    
     def _notify_progress(self, message: str):
         """진행 상태 알림"""
         if self._progress_callback:
@@ -52,23 +83,124 @@ class ScheduleService(IScheduleService):
         """
         self._notify_progress("시간표 생성 중...")
         
+        # 이전 결과와 그 설정은 생성이 성공한 뒤에만 교체 (실패하면 그대로 유지)
+        previous_config = self._config
+        snapshot = config.clone()
+        
+        # 같은 설정 + 같은 카탈로그로 생성한 결과가 있으면 탐색 없이 사용
+        cache_key = None
+        table = self._course_service.get_course_table() if self._course_service else None
+        if self._result_cache:
+            cache_key = self._result_cache.make_key(config, table)
+            cached = self._result_cache.load(cache_key, table)
+            if cached is not None:
+                self._generator = None
+                self._schedules = cached.to_schedules(table)
+                self._config, self._cache_key = snapshot, cache_key
+                self._remember_store(cached, table)
+                self._notify_progress(f"이전 결과 사용: {len(self._schedules)}개 조합")
+                return self._schedules
+        
+        # 조건만 좁힌 경우: 이전 결과 중 새 조건을 만족하는 조합을 그대로 사용
+        previous = self._schedules if self._store_matches(table) else []
+        if previous_config is not None and previous:
+            change = classify_change(previous_config, config)
+            if change in (ConfigChange.SAME, ConfigChange.TIGHTENING):
+                indices = self._store.filter(
+                    build_excluded_mask(config.excluded_days, config.excluded_time_slots),
+                    config.min_credits, config.max_credits
+                )
+                survivors = [self._schedules[i] for i in indices.tolist()]
+                
+                # 생성기는 전체 탐색을 보장하지 않으므로(포화/재시작 한도에서 중단, 무작위 탐색)
+                # 살아남은 조합이 충분할 때만 그대로 사용하고, 적으면 Warm Start로 추가 탐색
+                if len(survivors) >= AlgoConfig.INCREMENTAL_MIN_RESULTS:
+                    self._generator = None
+                    self._schedules = survivors
+                    self._notify_progress(f"이전 결과에서 {len(survivors)}개 조합 유지")
+                    self._finish_generation(snapshot, cache_key, self._store.take(indices), table)
+                    return self._schedules
+        
         # Generator 생성
-        self._generator = ScheduleGenerator(all_courses, config)
+        resolve_filter = self._course_service.resolve_filter if self._course_service else None
+        self._generator = ScheduleGenerator(all_courses, config, resolve_filter=resolve_filter)
+        
+        # 이전 결과로 Warm Start (아직 유효한 조합은 그대로 앞에 두고 그 주변부터 탐색)
+        if previous:
+            self._generator.warm_start(previous)
+        
+        # 결과 화면 점진 표시: 새로 찾은 조합을 결과 화면 데이터에 바로 추가
+        # (생성 중에는 get_result_pages()가 이 데이터를 반환)
+        streaming = None
+        on_results = None
+        if self._result_callback:
+            streaming = ResultPages((), self._course_names('required'), self._course_names('desired'))
+            self._pages, self._pages_source = streaming, self._schedules
+            
+            def on_results(batch: List[Schedule]):
+                self._result_callback(streaming.extend(batch))
         
         # 시간표 생성
         # 진행률 콜백 전달
-        self._schedules = self._generator.generate_all_schedules(
-            progress_callback=self._notify_progress
-        )
+        try:
+            results = self._generator.generate_all_schedules(
+                progress_callback=self._notify_progress,
+                result_callback=on_results
+            )
+        except Exception:
+            self._pages = None  # 이전 결과 기준으로 다시 구성
+            raise
+        
+        # 표시 순서: 생성 순서는 같은 분반 주변 조합이 몰려 있으므로 한 번 섞음
+        # (내보낸 HTML과 앱 안 결과 화면 모두 이 순서, 결과 화면 데이터는 이 순서로 다시 구성)
+        self._schedules = list(results)
+        random.shuffle(self._schedules)
+        
+        self._finish_generation(snapshot, cache_key, None, table)
         
         self._notify_progress(f"총 {len(self._schedules)}개 조합 생성 완료!")
         
         return self._schedules
     
+    def _store_matches(self, table) -> bool:
+        """압축 결과가 현재 카탈로그 기준인지 (재로드되면 행 번호/마스크가 달라질 수 있음)"""
+        return (self._store is not None and table is not None
+                and table is self._store_table and table.version == self._store_version)
+    
+    def _remember_store(self, store: Optional[ResultStore], table):
+        self._store = store
+        self._store_table = table
+        self._store_version = table.version if table is not None else -1
+    
+    def _finish_generation(self, config: ScheduleConfig, cache_key: Optional[str],
+                           store: Optional[ResultStore], table):
+        """생성 설정/결과 압축본 보관 및 디스크 캐시 저장"""
+        self._config, self._cache_key = config, cache_key
+        if table is None or not self._schedules:
+            self._remember_store(None, None)
+            return
+        if store is None:
+            store = ResultStore.from_schedules(self._schedules, table)
+        self._remember_store(store, table)
+        if self._cache_key:
+            self._result_cache.store(self._cache_key, store, table)
+    
     def get_schedules(self) -> List[Schedule]:
         """생성된 시간표 목록 반환"""
         return self._schedules
     
+    def get_result_pages(self) -> ResultPages:
+        """
+        결과 화면 데이터 원본 (앱 안의 결과 화면이 페이지 단위로 조회)
+        결과가 바뀌었을 때만 다시 구성 (생성 중에는 지금까지 찾은 결과)
+        """
+        if self._pages is None or self._pages_source is not self._schedules:
+            self._pages = ResultPages(
+                self._schedules, self._course_names('required'), self._course_names('desired')
+            )
+            self._pages_source = self._schedules
+        return self._pages
+    
     def export_to_html(
         self,
         output_path: str = 'schedule_results.html',
@@ -91,31 +223,57 @@ class ScheduleService(IScheduleService):
         if not self._schedules:
             raise ValueError("생성된 시간표가 없습니다.")
         
+        # 캐시된 결과 화면이 있으면 복사 (강의명 집합을 직접 지정한 경우는 새로 생성)
+        use_cache = self._cache_key is not None and required_names is None and desired_names is None
+        cached_html = self._result_cache.html_path(self._cache_key) if use_cache else None
+        if cached_html:
+            directory = os.path.dirname(output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            shutil.copyfile(cached_html, output_path)
+            return self._finish_export(output_path, open_browser)
+        
         self._notify_progress("HTML 파일 생성 중...")
         
         # 필수/희망 강의 이름 추출
         if required_names is None:
-            required_names = set()
-            if self._generator and hasattr(self._generator, 'required_course_groups'):
-                for group in self._generator.required_course_groups:
-                    for course in group:
-                        required_names.add(course.name)
+            required_names = self._course_names('required')
         
         if desired_names is None:
-            desired_names = set()
-            if self._generator and hasattr(self._generator, 'desired_course_groups'):
-                for group in self._generator.desired_course_groups:
-                    for course in group:
-                        desired_names.add(course.name)
+            desired_names = self._course_names('desired')
         
         # HTML 생성
         generate_html(
             self._schedules,
             output_path,
             required_names,
-            desired_names
+            desired_names,
+            shuffle=False  # 이미 표시 순서
         )
         
+        if use_cache:
+            self._result_cache.store_html(self._cache_key, output_path)
+        
+        return self._finish_export(output_path, open_browser)
+    
+    def _course_names(self, list_type: str) -> Set[str]:
+        """필수/희망 필터에 매칭되는 강의명 (생성기가 없으면 마지막 설정으로 해석)"""
+        names = set()
+        if self._generator:
+            groups = (self._generator.required_course_groups if list_type == 'required'
+                      else self._generator.desired_course_groups)
+            for group in groups:
+                for course in group:
+                    names.add(course.name)
+        elif self._config and self._course_service:
+            filters = self._config.required_filters if list_type == 'required' else self._config.desired_filters
+            for course_filter in filters:
+                for course in self._course_service.resolve_filter(course_filter):
+                    names.add(course.name)
+        return names
+    
+    def _finish_export(self, output_path: str, open_browser: bool) -> str:
+        """내보내기 완료 알림 및 브라우저 열기"""
         abs_path = os.path.abspath(output_path)
         
         self._notify_progress(f"HTML 파일 생성 완료: {abs_path}")
@@ -130,6 +288,31 @@ class ScheduleService(IScheduleService):
         
         return abs_path
     
+    def invalidate_courses(self, course_ids: Set[str]) -> bool:
+        """
+        카탈로그 재로드 후 변경/삭제된 분반을 포함하는 결과만 무효화
+        
+        Args:
+            course_ids: 변경 또는 삭제된 강좌번호 집합
+            
+        Returns:
+            결과를 무효화했으면 True (재생성 필요)
+        """
+        if not course_ids or not self._schedules:
+            return False
+        
+        touched = any(
+            course.course_id in course_ids
+            for schedule in self._schedules
+            for course in schedule.courses
+        )
+        if touched:
+            self._schedules = []
+            self._generator = None
+            self._cache_key = None
+            self._remember_store(None, None)
+        return touched
+    
     def get_schedule_count(self) -> int:
         """생성된 시간표 개수 반환"""
         return len(self._schedules)
@@ -7,6 +7,7 @@ DFS 백트래킹을 사용하여 시간표 조합을 생성하되, 다양성을
 - 중복 제거 (content hash)
 - 휴리스틱 정렬 (학점 우선, 제약 많은 것 우선)
 - 로깅 강화
+- Warm Start (이전 결과 재사용 + 이전 조합에서 탐색 시작)
 """
 import re
 import random
@@ -14,12 +15,12 @@ import sys
 import time
 import logging
 from collections import deque
-from typing import List, Optional, Callable
-from ..core.models import Course, Schedule, time_str_to_index
-from ..core.config import ScheduleConfig, CourseFilter
-from ..core.models import Course, Schedule, time_str_to_index
+from typing import Dict, List, Optional, Callable, Sequence
+from ..core.models import Course, Schedule, build_excluded_mask, time_to_minutes
+from ..core.course_table import CourseView
 from ..core.config import ScheduleConfig, CourseFilter
 from ..core.constants import SchedulerConfig as AlgoConfig, BusinessConstants
+from .feasibility import CONFLICT_MESSAGE, ConflictExplanation, explain_conflict
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -27,24 +28,50 @@ logger = logging.getLogger(__name__)
 # 커스텀 예외 정의
 class GenerationError(Exception):
     """시간표 생성 중 발생하는 예외 (사용자에게 알릴 메시지 포함)"""
-    pass
+
+    def __init__(self, message: str, conflict: Optional[ConflictExplanation] = None):
+        super().__init__(message)
+        # 필수 강의 조합이 불가능한 경우 최소 충돌 집합 (원인이 되는 필터/제외 조건)
+        self.conflict = conflict
 
 class ScheduleGenerator:
     
-    def __init__(self, all_courses: List[Course], config: ScheduleConfig):
+    def __init__(
+        self,
+        all_courses: List[Course],
+        config: ScheduleConfig,
+        resolve_filter: Optional[Callable[[CourseFilter], List[Course]]] = None
+    ):
+        """
+        Args:
+            all_courses: 전체 강의 카탈로그
+            config: 시간표 설정
+            resolve_filter: 필터 → 매칭 강의 목록 (CourseService.resolve_filter)
+                            None이면 카탈로그 전체를 CourseFilter.matches로 검사
+        """
         self.all_courses = all_courses
         self.config = config
+        self._resolve_filter = resolve_filter
         self.results: List[Schedule] = []
         
+        # 생성 중 새 결과 전달 (generate_all_schedules의 result_callback)
+        self._result_callback: Optional[Callable[[List[Schedule]], None]] = None
+        self._streamed = 0
+        self._last_streamed = 0.0
+        
+        # 카탈로그 뷰(CourseView) → Course 레코드 캐시
+        # DFS 내부 루프는 속성 접근이 잦으므로 탐색에 쓰이는 강의만 레코드로 변환하여 사용
+        self._records: dict = {}
+        
         # Random Fill을 위한 '전학년' 대상 강의 후보군 미리 필터링
         # (학점 채우기 용도)
         # [Refactor] Regex 대신 하드코딩된 제외 목록 사용 (BusinessConstants.EXCLUDED_RANDOM_FILL_SUBJECTS)
         
-        self.random_fill_candidates = [
+        self.random_fill_candidates = self._as_records(
             c for c in all_courses 
             if ("전학년" in c.target_grade or "전학년" in c.category) 
             and c.name not in BusinessConstants.EXCLUDED_RANDOM_FILL_SUBJECTS
-        ]
+        )
         
         # [Refactor] 필수 강의 Grouping 로직 개선 (Object-Oriented Fix)
         # 이전 로직: 필터링 결과의 모든 강의를 '강의명' 기준으로 다시 쪼개서 Grouping (필터 1개 -> 여러 Group -> AND 조건)
@@ -86,6 +113,9 @@ class ScheduleGenerator:
         
         # 제외 시간 비트마스크 선계산 (최적화)
         self.excluded_mask = self._calculate_excluded_mask()
+        
+        # Warm Start: 이전 결과 (warm_start()로 지정, 다음 생성 한 번에만 사용)
+        self._seeds: List[Schedule] = []
 
         self._print_init_info()
 
@@ -102,15 +132,43 @@ class ScheduleGenerator:
         
         print(f"\n🎲 Random Fill 후보군: {len(self.random_fill_candidates)}개 (전학년 대상)")
 
+    def _as_records(self, courses) -> List[Course]:
+        """카탈로그 뷰를 Course 레코드로 변환 (같은 강의는 같은 객체를 재사용)"""
+        records = []
+        for course in courses:
+            if isinstance(course, CourseView):
+                record = self._records.get(course.course_id)
+                if record is None:
+                    record = course.to_course()
+                    self._records[course.course_id] = record
+                course = record
+            records.append(course)
+        return records
+
     def _find_all_matching_courses(self, filter_obj: CourseFilter) -> List[Course]:
-        """필터에 매칭되는 모든 강의 찾기"""
-        matched = []
-        for course in self.all_courses:
-            if filter_obj.matches(course):
-                matched.append(course)
-        return matched
+        """필터에 매칭되는 모든 강의 찾기 (인덱스 기반 해석이 있으면 사용)"""
+        if self._resolve_filter is not None:
+            return self._as_records(self._resolve_filter(filter_obj))
+        return self._as_records(
+            course for course in self.all_courses if filter_obj.matches(course)
+        )
     
-    def generate_all_schedules(self, progress_callback: Optional[Callable[[str], None]] = None) -> List[Schedule]:
+    def warm_start(self, schedules: Sequence[Schedule]):
+        """
+        이전 결과로 탐색 시작 (다음 generate_all_schedules 한 번에 적용)
+        
+        - 새 설정에서도 유효한 조합은 결과와 중복 집합에 미리 넣음
+        - 각 조합에서 새 설정에 맞지 않는 강의만 뺀 부분 조합을 DFS 시작점으로 사용
+          (추가된 희망 강의, 늘어난 학점, 풀린 제외 시간 등 새로 열린 영역부터 탐색)
+        - 이전 조합의 필수 강의 부분을 첫 라운드 시작 조합으로 우선 사용
+        
+        Args:
+            schedules: 이전 생성 결과 (다른 생성기가 만든 Course 객체여도 됨)
+        """
+        self._seeds = list(schedules)
+    
+    def generate_all_schedules(self, progress_callback: Optional[Callable[[str], None]] = None,
+                               result_callback: Optional[Callable[[List[Schedule]], None]] = None) -> List[Schedule]:
         """
         Randomized Backtracking + Restart 전략으로 시간표 생성
         
@@ -119,6 +177,11 @@ class ScheduleGenerator:
         - 발견 속도 기반 조기 종료 (최근 N회 성공률 체크)
         - 최대 Restart 횟수 제한
         - 로깅 강화
+        
+        Args:
+            progress_callback: 진행 메시지 콜백
+            result_callback: 새로 찾은 조합 목록 콜백 (첫 결과는 바로, 이후 RESULT_STREAM_INTERVAL초
+                             또는 RESULT_STREAM_BATCH개마다, 종료 시 나머지; 전달 순서 = 결과 순서)
         """
         print("\n" + "=" * 60)
         print("   시간표 조합 생성 시작 (Randomized Backtracking)")
@@ -139,6 +202,8 @@ class ScheduleGenerator:
             
         # [Safety] Reset results
         self.results.clear()
+        self._result_callback = result_callback
+        self._streamed = 0
         
         # 2. 필수 강의 조합 생성
         print(f"\n🔄 필수 강의 조합 탐색 중...")
@@ -146,11 +211,11 @@ class ScheduleGenerator:
         
         if not required_combinations:
             logger.error("필수 강의들 간 시간 충돌로 조합 생성 불가")
-            # [OOP Fix] 구체적인 에러 메시지 전파
-            raise GenerationError(
-                "필수 강의들 간 시간 충돌 또는 제외된 시간대와 겹쳐서\n"
-                "가능한 조합을 만들 수 없습니다."
-            )
+            # [OOP Fix] 구체적인 에러 메시지 전파 (최소 충돌 집합으로 원인 설명)
+            conflict = self._explain_required_conflict()
+            if conflict:
+                logger.error(f"충돌 원인: {conflict.describe()}")
+            raise GenerationError(conflict.message() if conflict else CONFLICT_MESSAGE, conflict)
         
         # 필수 조합도 휴리스틱 정렬 (총 학점 많은 조합 우선)
         required_combinations.sort(key=lambda sched: -sched.total_credits)
@@ -184,6 +249,9 @@ class ScheduleGenerator:
         restart_count = 0
         found_signatures = set()  # 중복 제거용
         
+        # Warm Start: 이전 결과를 먼저 반영하고 그 주변부터 탐색
+        seeded = self._apply_warm_start(required_combinations, available_desired, found_signatures, start_time)
+        
         # 발견 속도 추적 (최근 N회의 발견 개수)
         recent_discoveries = deque(maxlen=AlgoConfig.SATURATION_CHECK_WINDOW)
         
@@ -197,9 +265,10 @@ class ScheduleGenerator:
                 print(f"\n🛑 최대 Restart 횟수({AlgoConfig.MAX_RESTARTS}) 초과 - 조기 종료")
                 break
             
-            # 희망 강의 셔플
-            random.shuffle(available_desired)
-            random.shuffle(required_combinations)
+            # 희망 강의 셔플 (Warm Start 첫 라운드는 이전 조합의 필수 부분부터 순서대로)
+            if not (seeded and restart_count == 1):
+                random.shuffle(available_desired)
+                random.shuffle(required_combinations)
             
             found_this_round = 0  # 이번 라운드에서 찾은 새로운 결과 수
             
@@ -214,6 +283,7 @@ class ScheduleGenerator:
                     start_time=start_time
                 )
                 found_this_round += cnt
+                self._stream_results()
                 
                 if found_this_round >= AlgoConfig.BATCH_SIZE:
                     break
@@ -257,6 +327,9 @@ class ScheduleGenerator:
                     print(f"\n✨ 포화 감지: 최근 {AlgoConfig.SATURATION_CHECK_WINDOW}회 중 {total_recent_finds}개만 발견 - 조기 종료")
                     break
         
+        self._stream_results(force=True)
+        self._result_callback = None
+        
         elapsed_total = time.time() - start_time
         print(f"\n\n✨ 총 {len(self.results)}개의 시간표 조합 발견! (Restarts: {restart_count}, 소요: {elapsed_total:.2f}초)")
         print("=" * 60 + "\n")
@@ -265,6 +338,105 @@ class ScheduleGenerator:
         
         return self.results
 
+    def _stream_results(self, force: bool = False):
+        """아직 전달하지 않은 결과를 result_callback으로 전달 (간격/개수 조건을 만족할 때만)"""
+        if self._result_callback is None or self._streamed >= len(self.results):
+            return
+        now = time.time()
+        if not (force or self._streamed == 0
+                or len(self.results) - self._streamed >= AlgoConfig.RESULT_STREAM_BATCH
+                or now - self._last_streamed >= AlgoConfig.RESULT_STREAM_INTERVAL):
+            return
+        batch = self.results[self._streamed:]
+        self._streamed = len(self.results)
+        self._last_streamed = now
+        self._result_callback(batch)
+
+    def _apply_warm_start(self, required_combinations: List[Schedule], available_desired: List[Course],
+                          found_signatures: set, start_time: float) -> bool:
+        """
+        이전 결과 반영 (warm_start 참고)
+        
+        Returns:
+            시작점으로 쓸 이전 조합이 있었으면 True (required_combinations 순서도 조정됨)
+        """
+        seeds, self._seeds = self._seeds, []
+        if not seeds:
+            return False
+        
+        # 이 설정에서 쓸 수 있는 강의 (강좌번호 → 이 생성기의 레코드)
+        required_records: Dict[str, Course] = {
+            course.course_id: course for comb in required_combinations for course in comb.courses
+        }
+        desired_records = {course.course_id: course for course in available_desired}
+        fill_records = {
+            course.course_id: course for course in self.random_fill_candidates
+            if not self._is_excluded_time(course)
+        }
+        cores = {frozenset(c.course_id for c in comb.courses): comb for comb in required_combinations}
+        
+        starts: List[Schedule] = []
+        seen_cores = []
+        for seed in seeds:
+            core_ids = frozenset(c.course_id for c in seed.courses if c.course_id in required_records)
+            core = cores.get(core_ids)
+            if core is None:
+                continue  # 필수 강의 부분이 새 설정에서 불가능
+            if core_ids not in seen_cores:
+                seen_cores.append(core_ids)
+            
+            # 새 설정에서 허용되지 않는 강의만 빼고 재구성
+            partial = core.copy()
+            dropped = False
+            for course in seed.courses:
+                if course.course_id in core_ids:
+                    continue
+                record = desired_records.get(course.course_id)
+                is_fill = False
+                if record is None and seed.has_random_filled:
+                    record = fill_records.get(course.course_id)
+                    is_fill = record is not None
+                if record is None or partial.total_credits + record.credits > self.config.max_credits \
+                        or not partial.add_course(record):
+                    dropped = True
+                elif is_fill:
+                    partial.has_random_filled = True
+            
+            # 그대로 유효한 조합은 바로 결과로
+            if not dropped and self.config.min_credits <= partial.total_credits <= self.config.max_credits:
+                sig = partial.get_content_hash()
+                if sig not in found_signatures:
+                    found_signatures.add(sig)
+                    self.results.append(partial)
+            if not partial.has_random_filled:
+                starts.append(partial)
+        
+        reused = len(self.results)
+        self._stream_results()
+        
+        # 이전 조합(부분 조합)에서 새로 열린 영역 탐색
+        found = 0
+        for partial in starts[:AlgoConfig.WARM_START_MAX_SEEDS]:
+            if len(self.results) >= AlgoConfig.TARGET_RESULTS:
+                break
+            in_schedule = set(partial.courses)
+            candidates = [c for c in available_desired if c not in in_schedule]
+            found += self._run_randomized_dfs(
+                partial, candidates, limit=AlgoConfig.BATCH_SIZE,
+                allow_fill=False, found_signatures=found_signatures, start_time=start_time
+            )
+            self._stream_results()
+        
+        # 이전 조합의 필수 부분을 앞으로 (첫 라운드 시작 조합)
+        order = {core_ids: i for i, core_ids in enumerate(seen_cores)}
+        required_combinations.sort(
+            key=lambda comb: order.get(frozenset(c.course_id for c in comb.courses), len(order))
+        )
+        
+        print(f"\n♻️  Warm Start: 이전 결과 {reused}개 재사용, 시작점 {len(starts)}개에서 {found}개 추가 발견")
+        logger.info(f"Warm Start: 재사용={reused}, 시작점={len(starts)}, 추가={found}")
+        return bool(seen_cores)
+
     def _filter_available_courses(self, candidates: List[Course], excluded_courses: List[Course]) -> List[Course]:
         """조건(요일/시간 제외)에 맞는 강의만 필터링"""
         filtered = []
@@ -466,30 +638,17 @@ class ScheduleGenerator:
         backtrack(0, Schedule())
         return combinations
     
+    def _explain_required_conflict(self) -> Optional[ConflictExplanation]:
+        """필수 강의 조합이 불가능한 원인 (필수 필터 + 제외 조건 중 최소 충돌 집합)"""
+        domains = [
+            list(dict.fromkeys((course.name, course.time_mask) for course in group))
+            for group in self.required_course_groups
+        ]
+        return explain_conflict(self.config.required_filters, domains, self.config)
+
     # [최적화] 비트마스크 선계산
     def _calculate_excluded_mask(self) -> int:
-        mask = 0
-        # 1. 특정 시간대 제외
-        if self.config.excluded_time_slots:
-            from ..core.models import time_str_to_index
-            for (day, start, end) in self.config.excluded_time_slots:
-                start_idx = time_str_to_index(day, start)
-                end_idx = time_str_to_index(day, end)
-                for i in range(start_idx, end_idx):
-                    mask |= (1 << i)
-                    
-        # 2. 요일 전체 제외
-        if self.config.excluded_days:
-            # 하루 = 288 slots (5분 단위)
-            from ..core.models import DAYS_MAP
-            for day in self.config.excluded_days:
-                day_idx = DAYS_MAP.get(day, 0)
-                start_idx = day_idx * 288
-                end_idx = (day_idx + 1) * 288
-                for i in range(start_idx, end_idx):
-                    mask |= (1 << i)
-                    
-        return mask
+        return build_excluded_mask(self.config.excluded_days, self.config.excluded_time_slots)
 
     def _is_excluded_time(self, course: Course) -> bool:
         """제외 시간 체크 (비트마스크 최적화)"""
@@ -497,5 +656,5 @@ class ScheduleGenerator:
         return (course.time_mask & self.excluded_mask) > 0
 
     def _time_overlaps(self, start1: str, end1: str, start2: str, end2: str) -> bool:
-        def to_min(t): h, m = map(int, t.split(':')); return h*60 + m
-        return to_min(start1) < to_min(end2) and to_min(start2) < to_min(end1)
+        return (time_to_minutes(start1) < time_to_minutes(end2)
+                and time_to_minutes(start2) < time_to_minutes(end1))
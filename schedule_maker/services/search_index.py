@@ -0,0 +1,324 @@
+"""
+강의 검색 인덱스
+강의명/교수명의 고유 문자열 단위 n-gram 역색인으로 부분 문자열 검색을 처리
+
+초성/오타 허용 검색용 초성 문자열과 자모 문자열도 색인 시점에 한 번만 만들어 둠
+"""
+from typing import Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from ..core.constants import SearchMode
+from ..core.course_table import CourseTable, StringTable
+from ..core.exceptions import SearchCancelled
+from ..core.hangul import choseong_of, decompose, has_choseong, is_choseong, to_choseong
+
+
+def fuzzy_budget(length: int) -> int:
+    """자모 길이별 허용 편집 거리 (짧은 검색어는 오타를 허용하지 않음)"""
+    if length < 4:
+        return 0
+    if length < 8:
+        return 1
+    if length < 14:
+        return 2
+    return 3
+
+
+def substring_distance(pattern: str, text: str) -> int:
+    """
+    pattern과 text의 부분 문자열 사이 최소 편집 거리 (Sellers 알고리즘)
+    """
+    m = len(pattern)
+    prev = list(range(m + 1))
+    best = prev[m]
+    for char in text:
+        cur = [0] * (m + 1)
+        for i in range(1, m + 1):
+            cost = 0 if pattern[i - 1] == char else 1
+            cur[i] = min(prev[i - 1] + cost, prev[i] + 1, cur[i - 1] + 1)
+        if cur[m] < best:
+            best = cur[m]
+        prev = cur
+    return best
+
+
+# 초성/오타 허용 검색에서 취소 여부를 확인하는 후보 간격
+CANCEL_CHECK_INTERVAL = 256
+
+CancelCheck = Optional[Callable[[], bool]]
+
+
+def _check_cancelled(cancel_check: CancelCheck, count: int):
+    if cancel_check is not None and count % CANCEL_CHECK_INTERVAL == 0 and cancel_check():
+        raise SearchCancelled()
+
+
+def choseong_position(query: str, text: str) -> int:
+    """
+    초성이 섞인 검색어가 처음 일치하는 위치 (없으면 -1)
+    검색어의 자음은 음절의 초성과, 나머지 글자는 그대로 비교 (ㅇ어ㅎ → 영어회화)
+    """
+    n = len(query)
+    for start in range(len(text) - n + 1):
+        for offset, q in enumerate(query):
+            t = text[start + offset]
+            if q != t and not (is_choseong(q) and choseong_of(t) == q):
+                break
+        else:
+            return start
+    return -1
+
+
+class _Postings:
+    """문자열 코드별 글자/바이그램 포스팅 목록"""
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self._chars: Dict[str, List[int]] = {}
+        self._bigrams: Dict[str, List[int]] = {}
+
+    def add(self, text: str):
+        code = len(self.texts)
+        self.texts.append(text)
+        for char in set(text):
+            self._chars.setdefault(char, []).append(code)
+        for gram in {text[i:i + 2] for i in range(len(text) - 1)}:
+            self._bigrams.setdefault(gram, []).append(code)
+
+    def candidates(self, query: str) -> Set[int]:
+        """query의 글자/바이그램을 모두 가진 코드 (부분 문자열 여부는 호출자가 검증)"""
+        if len(query) == 1:
+            return set(self._chars.get(query, ()))
+
+        postings = []
+        for gram in {query[i:i + 2] for i in range(len(query) - 1)}:
+            posting = self._bigrams.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        # 가장 짧은 포스팅부터 교집합
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+        return result
+
+    def gram_counts(self, query: str) -> Dict[int, int]:
+        """코드별로 query의 (서로 다른) 바이그램을 몇 개 가지고 있는지"""
+        counts: Dict[int, int] = {}
+        for gram in {query[i:i + 2] for i in range(len(query) - 1)}:
+            for code in self._bigrams.get(gram, ()):
+                counts[code] = counts.get(code, 0) + 1
+        return counts
+
+
+class NgramIndex:
+    """
+    문자열 테이블(StringTable) 하나에 대한 검색 인덱스
+
+    - 색인 단위는 행이 아니라 고유 문자열 코드 (같은 강의명은 한 번만 색인)
+    - 1글자 검색어는 글자 색인, 2글자 이상은 바이그램 포스팅 교집합으로 후보를 좁힌 뒤
+      실제 부분 문자열 포함 여부로 검증하므로 선형 검색과 결과가 같음
+    - 소문자 문자열 / 초성 문자열 / 자모 문자열을 각각 색인
+    - 문자열 테이블은 추가만 되므로 새로 생긴 문자열만 이어서 색인함 (재로드 대응)
+    """
+
+    def __init__(self, strings: StringTable):
+        self._strings = strings
+        self._lowered = _Postings()
+        self._choseong = _Postings()
+        self._jamo = _Postings()
+
+    def sync(self):
+        """아직 색인하지 않은 문자열 색인 (초성/자모 분해 포함)"""
+        for code in range(len(self._lowered.texts), len(self._strings)):
+            text = self._strings[code].lower()
+            self._lowered.add(text)
+            self._choseong.add(to_choseong(text))
+            self._jamo.add(decompose(text))
+
+    def match_codes(self, query: str) -> List[int]:
+        """
+        검색어(소문자)를 포함하는 문자열 코드 목록
+
+        Args:
+            query: 소문자로 변환된 검색어 (공백 제거 후)
+        """
+        self.sync()
+        candidates = self._lowered.candidates(query)
+        if len(query) <= 2:
+            return list(candidates)
+
+        # 바이그램이 모두 있어도 연속으로 나타나는지는 별도 확인
+        lowered = self._lowered.texts
+        return [code for code in candidates if query in lowered[code]]
+
+    def match_codes_exact_case(self, keyword: str) -> List[int]:
+        """대소문자를 구분하여 keyword를 포함하는 문자열 코드 (CourseFilter.matches와 같은 기준)"""
+        strings = self._strings
+        return [code for code in self.match_codes(keyword.lower()) if keyword in strings[code]]
+
+    def choseong_scores(self, query: str, cancel_check: CancelCheck = None) -> Dict[int, int]:
+        """
+        초성 검색: 문자열 코드 → 일치 위치 (앞에서 일치할수록 작음)
+        """
+        self.sync()
+        lowered = self._lowered.texts
+        scores = {}
+        for count, code in enumerate(self._choseong.candidates(to_choseong(query))):
+            _check_cancelled(cancel_check, count)
+            position = choseong_position(query, lowered[code])
+            if position >= 0:
+                scores[code] = position
+        return scores
+
+    def fuzzy_scores(
+        self,
+        query: str,
+        max_distance: Optional[int] = None,
+        cancel_check: CancelCheck = None
+    ) -> Dict[int, int]:
+        """
+        오타 허용 검색: 문자열 코드 → 자모 단위 편집 거리 (max_distance 이하만)
+
+        편집 한 번은 바이그램을 최대 2개 깨뜨리므로, 검색어 바이그램 중
+        (개수 - 2 × 허용 거리)개 이상을 가진 문자열만 거리 계산 대상으로 삼음
+        cancel_check가 True를 반환하면 SearchCancelled 발생
+        """
+        self.sync()
+        pattern = decompose(query)
+        if max_distance is None:
+            max_distance = fuzzy_budget(len(pattern))
+
+        grams = {pattern[i:i + 2] for i in range(len(pattern) - 1)}
+        threshold = len(grams) - 2 * max_distance
+        if threshold > 0:
+            counts = self._jamo.gram_counts(pattern)
+            candidates = [code for code, count in counts.items() if count >= threshold]
+        else:
+            candidates = range(len(self._jamo.texts))
+
+        jamo = self._jamo.texts
+        scores = {}
+        for count, code in enumerate(candidates):
+            _check_cancelled(cancel_check, count)
+            distance = substring_distance(pattern, jamo[code])
+            if distance <= max_distance:
+                scores[code] = distance
+        return scores
+
+
+class CourseSearchIndex:
+    """강의명/교수명 검색 인덱스 (CourseTable과 함께 사용)"""
+
+    def __init__(self, table: CourseTable):
+        self.table = table
+        self._names = NgramIndex(table.names)
+        self._professors = NgramIndex(table.professors)
+        self.refresh()
+
+    def refresh(self):
+        """카탈로그에 새로 생긴 강의명/교수명 색인 (검색 시점이 아닌 로드 시점에 호출)"""
+        self._names.sync()
+        self._professors.sync()
+
+    def _columns(self, search_by_name: bool, search_by_professor: bool):
+        table = self.table
+        if search_by_name:
+            yield self._names, table.names, table.name_codes
+        if search_by_professor:
+            yield self._professors, table.professors, table.professor_codes
+
+    def search_rows(
+        self,
+        query: str,
+        search_by_name: bool = True,
+        search_by_professor: bool = True,
+        mode: SearchMode = SearchMode.EXACT,
+        cancel_check: CancelCheck = None
+    ) -> np.ndarray:
+        """
+        검색어와 일치하는 활성 행 번호
+
+        - EXACT: 카탈로그 순서
+        - CHOSEONG / FUZZY: 일치 품질 순 (같으면 카탈로그 순서)
+
+        Args:
+            query: 소문자로 변환된 검색어 (공백 제거 후)
+            mode: 검색 방식
+            cancel_check: 초성/오타 허용 검색 중 주기적으로 호출, True면 SearchCancelled 발생
+        """
+        if mode == SearchMode.CHOSEONG and has_choseong(query):
+            return self._ranked_rows(
+                [(index.choseong_scores(query, cancel_check), strings, column)
+                 for index, strings, column in self._columns(search_by_name, search_by_professor)]
+            )
+        if mode == SearchMode.FUZZY:
+            return self._ranked_rows(
+                [(index.fuzzy_scores(query, cancel_check=cancel_check), strings, column)
+                 for index, strings, column in self._columns(search_by_name, search_by_professor)]
+            )
+
+        hit = None
+        for index, strings, column in self._columns(search_by_name, search_by_professor):
+            codes = index.match_codes(query)
+            if not codes:
+                continue
+            # 문자열 코드 → 일치 여부 조회표를 행 컬럼에 적용
+            code_hit = np.zeros(len(strings), dtype=bool)
+            code_hit[codes] = True
+            rows_hit = code_hit[column]
+            hit = rows_hit if hit is None else (hit | rows_hit)
+
+        if hit is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(hit & self.table.active)
+
+    def keyword_rows(self, name_keywords: List[str], professor_keywords: List[str]) -> np.ndarray:
+        """
+        강의명/교수명이 각각 모든 키워드를 포함하는 활성 행 번호 (카탈로그 순서)
+        대소문자를 구분하며, 키워드가 없는 컬럼은 조건 없음
+        """
+        table = self.table
+        hit = table.active.copy()
+
+        for keywords, index, strings, column in (
+            (name_keywords, self._names, table.names, table.name_codes),
+            (professor_keywords, self._professors, table.professors, table.professor_codes),
+        ):
+            if not keywords:
+                continue
+            codes = None
+            for keyword in keywords:
+                matched = set(index.match_codes_exact_case(keyword))
+                codes = matched if codes is None else (codes & matched)
+                if not codes:
+                    return np.zeros(0, dtype=np.int64)
+            code_hit = np.zeros(len(strings), dtype=bool)
+            code_hit[list(codes)] = True
+            hit &= code_hit[column]
+
+        return np.flatnonzero(hit)
+
+    def _ranked_rows(self, scored_columns) -> np.ndarray:
+        """문자열 코드별 점수(작을수록 좋음)를 행에 적용하여 점수 순으로 정렬"""
+        missing = np.iinfo(np.int32).max
+        row_scores = None
+
+        for scores, strings, column in scored_columns:
+            if not scores:
+                continue
+            code_scores = np.full(len(strings), missing, dtype=np.int32)
+            code_scores[list(scores.keys())] = list(scores.values())
+            column_scores = code_scores[column]
+            row_scores = column_scores if row_scores is None else np.minimum(row_scores, column_scores)
+
+        if row_scores is None:
+            return np.zeros(0, dtype=np.int64)
+
+        rows = np.flatnonzero((row_scores < missing) & self.table.active)
+        return rows[np.argsort(row_scores[rows], kind='stable')]
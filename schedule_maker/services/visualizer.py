@@ -2,11 +2,103 @@
 HTML 시각화 모듈
 시간표 조합을 인터랙티브 HTML로 출력
 """
-from typing import List
+from typing import List, Sequence, TextIO
 from ..core.models import Schedule, Course
+from .result_pages import pack_schedules
+import base64
+import hashlib
 import json
 import random
 
+import numpy as np
+
+
+# 내장 결과 데이터 형식 버전 (pack_schedules 출력/인코딩이 바뀌면 올림)
+PAYLOAD_FORMAT = 1
+
+# base64 스트리밍 단위 (3의 배수여야 조각을 이어 붙여도 전체 인코딩과 같음)
+B64_CHUNK_BYTES = 3 * 16384
+
+
+def _b64(array: np.ndarray) -> str:
+    return base64.b64encode(array.tobytes()).decode('ascii')
+
+
+def _write_b64(f: TextIO, array: np.ndarray):
+    """배열을 base64로 조각조각 인코딩하여 바로 기록 (전체 문자열을 만들지 않음)"""
+    buffer = memoryview(np.ascontiguousarray(array)).cast('B')
+    for start in range(0, len(buffer), B64_CHUNK_BYTES):
+        f.write(base64.b64encode(buffer[start:start + B64_CHUNK_BYTES]).decode('ascii'))
+
+
+def build_schedule_payload(schedules: List[Schedule]) -> dict:
+    """
+    결과 화면용 정규화 데이터 (JSON 객체)
+    번호/오프셋/학점/채우기 여부/핀 색인은 리틀 엔디언 typed array를 base64로 압축 (JS에서 한 번 디코딩)
+
+    Returns:
+        {'sections': [[강의명, 학점, 교수명, [[요일, 시작, 종료], ...]], ...],
+         'index_type': 'u16' | 'u32', 'rows', 'offsets', 'credits', 'filled',
+         'id_type': 'u16' | 'u32', 'pins': {강의명: {'요일 시작': 조합 번호}}, 'course_info': {강의명: 분반 번호}}
+    """
+    packed = pack_schedules(schedules)
+    return {
+        'sections': packed.sections,
+        'index_type': packed.index_type,
+        'rows': _b64(packed.rows),
+        'offsets': _b64(packed.offsets),
+        'credits': _b64(packed.credits),
+        'filled': _b64(packed.filled),
+        'id_type': packed.id_type,
+        'pins': {
+            name: {key: _b64(ids) for key, ids in slots.items()}
+            for name, slots in packed.pins.items()
+        },
+        'course_info': packed.course_info,
+    }
+
+
+def write_schedule_payload(f: TextIO, schedules: List[Schedule]):
+    """
+    build_schedule_payload()와 같은 JSON을 파일에 바로 기록
+    분반/핀 항목 단위로 인코딩하고 큰 배열은 base64 조각으로 나눠 써서 전체 문자열을 만들지 않음
+    """
+    packed = pack_schedules(schedules)
+    dumps = lambda value: json.dumps(value, ensure_ascii=False)
+
+    f.write('{"sections":[')
+    for i, section in enumerate(packed.sections):
+        if i:
+            f.write(',')
+        f.write(dumps(section))
+    f.write(f'],"index_type":{dumps(packed.index_type)}')
+    for key in ('rows', 'offsets', 'credits', 'filled'):
+        f.write(f',"{key}":"')
+        _write_b64(f, getattr(packed, key))
+        f.write('"')
+    f.write(f',"id_type":{dumps(packed.id_type)},"pins":{{')
+    for i, (name, slots) in enumerate(packed.pins.items()):
+        f.write(f'{"," if i else ""}{dumps(name)}:{{')
+        for j, (key, ids) in enumerate(slots.items()):
+            f.write(f'{"," if j else ""}{dumps(key)}:"')
+            _write_b64(f, ids)
+            f.write('"')
+        f.write('}')
+    f.write(f'}},"course_info":{dumps(packed.course_info)}}}')
+
+
+def _split_template(template: str, placeholders: Sequence[str]) -> List[str]:
+    """템플릿을 자리표시자 기준으로 한 번만 분할 (자리표시자 순서대로, 조각 수 = 자리표시자 수 + 1)"""
+    parts = []
+    rest = template
+    for placeholder in placeholders:
+        head, found, rest = rest.partition(placeholder)
+        if not found:
+            raise ValueError(f"템플릿에 자리표시자가 없습니다: {placeholder}")
+        parts.append(head)
+    parts.append(rest)
+    return parts
+
 
 class HtmlVisualizer:
     """HTML 시각화 생성기"""
@@ -486,10 +578,193 @@ class HtmlVisualizer:
     </div>
     
     <script>
-        // 데이터
-        const schedules = SCHEDULE_DATA_PLACEHOLDER;
-        const allCourseNames = ALL_COURSES_PLACEHOLDER; // 전체 강의 목록 (필수 + 희망)
-        const requiredCourseNames = REQUIRED_COURSES_PLACEHOLDER; // 필수 강의 목록
+        // base64 → 바이트 버퍼 (리틀 엔디언 배열)
+        function decodeBase64(b64) {
+            const binary = atob(b64);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            return bytes.buffer;
+        }
+
+        // 정규화된 결과 → 시간표 목록 (한 번만 디코딩, 같은 분반은 같은 객체 공유)
+        function decodeSchedules(payload, sections) {
+            const IndexArray = payload.index_type === 'u16' ? Uint16Array : Uint32Array;
+            const rows = new IndexArray(decodeBase64(payload.rows));
+            const offsets = new Uint32Array(decodeBase64(payload.offsets));
+            const credits = new Uint8Array(decodeBase64(payload.credits));
+            const filled = new Uint8Array(decodeBase64(payload.filled));
+
+            const result = new Array(credits.length);
+            for (let i = 0; i < credits.length; i++) {
+                const courses = [];
+                for (let k = offsets[i]; k < offsets[i + 1]; k++) courses.push(sections[rows[k]]);
+                result[i] = {courses, total_credits: credits[i], has_random_filled: filled[i] === 1};
+            }
+            return result;
+        }
+
+        // 핀 색인: 강의명 → (첫 시간대 '요일 시작' → 그 분반을 포함한 스케줄 번호, 오름차순)
+        function decodePinIndex(payload) {
+            const IdArray = payload.id_type === 'u16' ? Uint16Array : Uint32Array;
+            const index = new Map();
+            for (const [name, slots] of Object.entries(payload.pins)) {
+                const byTime = new Map();
+                for (const [timeKey, ids] of Object.entries(slots)) {
+                    byTime.set(timeKey, new IdArray(decodeBase64(ids)));
+                }
+                index.set(name, byTime);
+            }
+            return index;
+        }
+
+        // 정렬된 두 번호 목록의 교집합 / 교집합 존재 여부
+        function intersectSorted(a, b) {
+            const result = [];
+            let i = 0, j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] === b[j]) { result.push(a[i]); i++; j++; }
+                else if (a[i] < b[j]) i++;
+                else j++;
+            }
+            return result;
+        }
+
+        function intersectsSorted(a, b) {
+            let i = 0, j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] === b[j]) return true;
+                if (a[i] < b[j]) i++; else j++;
+            }
+            return false;
+        }
+
+        // 분반 배열 [강의명, 학점, 교수명, 시간대] → 강의 객체
+        function toCourse([name, credits, professor, slots]) {
+            return {
+                name, credits, professor,
+                time_slots: slots.map(([day, start_time, end_time]) => ({day, start_time, end_time}))
+            };
+        }
+
+        // 결과 데이터 원본 (두 구현이 같은 인터페이스, 응답은 콜백으로 전달)
+        //  - 내장 데이터: 파일로 연 경우 (내보낸 HTML)
+        //  - QWebChannel: 앱 안의 결과 화면 (Python 결과 저장소에 페이지/핀 질의)
+        // count() / get(index, cb) / match(filters, cb) / firstSlot(name, filters, cb)
+        // slotOptions(name, filters, cb) → {available, total} / courseInfo(name)
+        function createEmbeddedSource(payload) {
+            const sections = payload.sections.map(toCourse);
+            const schedules = decodeSchedules(payload, sections);
+            const pinIndex = decodePinIndex(payload);
+            const courseInfo = new Map(
+                Object.entries(payload.course_info).map(([name, section]) => [name, sections[section]])
+            );
+            const EMPTY_IDS = new Uint32Array(0);
+            const slotsOf = name => pinIndex.get(name) || new Map();
+            const idsOf = (name, timeKey) => slotsOf(name).get(timeKey) || EMPTY_IDS;
+
+            // 고정(핀) 조건에 맞는 스케줄 번호 (조건별 색인 목록의 교집합, 오름차순)
+            function match(filters) {
+                const lists = [];
+                for (const [filterName, filterTime] of filters) lists.push(idsOf(filterName, filterTime));
+                if (lists.length === 0) return Array.from({length: schedules.length}, (_, i) => i);
+                // 짧은 목록부터 교차 (비용은 일치 개수에 비례)
+                lists.sort((a, b) => a.length - b.length);
+                let result = Array.from(lists[0]);
+                for (let k = 1; k < lists.length && result.length > 0; k++) {
+                    result = intersectSorted(result, lists[k]);
+                }
+                return result;
+            }
+
+            return {
+                count: () => schedules.length,
+                get: (index, cb) => cb(schedules[index]),
+                match: (filters, cb) => cb(match(filters)),
+                firstSlot(name, filters, cb) {
+                    // 현재 고정 범위에서 가장 앞 스케줄에 나오는 시간대
+                    const within = filters.size > 0 ? match(filters) : null;
+                    let best = null, firstIndex = Infinity;
+                    for (const [timeKey, ids] of slotsOf(name)) {
+                        const matched = within ? intersectSorted(within, ids) : ids;
+                        if (matched.length > 0 && matched[0] < firstIndex) {
+                            firstIndex = matched[0];
+                            best = timeKey;
+                        }
+                    }
+                    cb(best);
+                },
+                slotOptions(name, filters, cb) {
+                    const within = filters.size > 0 ? match(filters) : null;
+                    const available = [];
+                    for (const [timeKey, ids] of slotsOf(name)) {
+                        if (within === null || intersectsSorted(within, ids)) available.push(timeKey);
+                    }
+                    cb({available: available.sort(), total: slotsOf(name).size});
+                },
+                courseInfo: name => courseInfo.get(name),
+            };
+        }
+
+        // 페이지 단위로 가져오는 조합 수 (Python PAGE_SIZE와 같게)
+        const PAGE_SIZE = 200;
+
+        function createChannelSource(bridge, summary) {
+            const sections = []; // 지금까지 받은 분반 (추가만 됨)
+            const pages = new Map(); // 페이지 번호 → 조합 목록
+            const waiting = new Map(); // 요청 중인 페이지 → 콜백 목록
+            const courseInfo = new Map(
+                Object.entries(summary.course_info).map(([name, section]) => [name, toCourse(section)])
+            );
+            let count = summary.count;
+            const pinsJson = filters => JSON.stringify(Object.fromEntries(filters));
+
+            function loadPage(page, cb) {
+                if (pages.has(page)) return cb(pages.get(page));
+                if (waiting.has(page)) return waiting.get(page).push(cb);
+                waiting.set(page, [cb]);
+                bridge.page(page * PAGE_SIZE, PAGE_SIZE, sections.length, json => {
+                    const data = JSON.parse(json);
+                    data.sections.forEach((section, k) => { sections[data.section_base + k] = toCourse(section); });
+                    const list = data.schedules.map(([rows, credits, filled]) => ({
+                        courses: rows.map(row => sections[row]),
+                        total_credits: credits,
+                        has_random_filled: filled
+                    }));
+                    // 덜 찬 마지막 페이지는 생성 중 늘어날 수 있으므로 보관하지 않음
+                    if (list.length === PAGE_SIZE) pages.set(page, list);
+                    const callbacks = waiting.get(page);
+                    waiting.delete(page);
+                    callbacks.forEach(fn => fn(list));
+                });
+            }
+
+            return {
+                count: () => count,
+                get(index, cb) {
+                    const page = Math.floor(index / PAGE_SIZE);
+                    loadPage(page, list => cb(list[index - page * PAGE_SIZE]));
+                    // 다음 페이지 미리 요청 (넘길 때 대기 없음)
+                    if ((page + 1) * PAGE_SIZE < count && !pages.has(page + 1)) loadPage(page + 1, () => {});
+                },
+                match: (filters, cb) => bridge.match(pinsJson(filters), json => cb(JSON.parse(json))),
+                firstSlot: (name, filters, cb) => bridge.firstSlot(name, pinsJson(filters), json => cb(JSON.parse(json))),
+                slotOptions: (name, filters, cb) => bridge.slotOptions(name, pinsJson(filters), json => cb(JSON.parse(json))),
+                courseInfo: name => courseInfo.get(name),
+                // 생성 중 결과 추가: 개수와 강의별 대표 분반만 갱신 (받아 둔 페이지/분반은 유지)
+                update(next) {
+                    count = next.count;
+                    for (const [name, section] of Object.entries(next.course_info)) {
+                        if (!courseInfo.has(name)) courseInfo.set(name, toCourse(section));
+                    }
+                },
+            };
+        }
+
+        // 데이터 (내장 데이터가 없으면 앱 안에서 QWebChannel로 연결)
+        const schedulePayload = SCHEDULE_DATA_PLACEHOLDER;
+        let allCourseNames = ALL_COURSES_PLACEHOLDER; // 전체 강의 목록 (필수 + 희망)
+        let requiredCourseNames = REQUIRED_COURSES_PLACEHOLDER; // 필수 강의 목록
+        let source = null;
         
         let currentIndex = 0;
         let lastInteractedCourse = null; // 마지막으로 클릭한 강의 (정렬 유지용)
@@ -605,12 +880,19 @@ class HtmlVisualizer:
             return ((hour - startHour) * slotsPerHour) + (minute / 30);
         }
         
-        // 시간표 렌더링
+        // 시간표 렌더링 (조합을 받아 온 뒤 그림, 더 최근 요청이 있으면 이전 응답은 무시)
+        let renderToken = 0;
         function renderSchedule(index) {
-            if (index < 0 || index >= schedules.length) return;
+            if (!source || index < 0 || index >= source.count()) return;
             
+            const token = ++renderToken;
+            source.get(index, schedule => {
+                if (token === renderToken && schedule) drawSchedule(index, schedule);
+            });
+        }
+        
+        function drawSchedule(index, schedule) {
             currentIndex = index;
-            const schedule = schedules[index];
             
             // 컨트롤 업데이트
             if (filteredIndices.length > 0 && filteredPosition >= 0) {
@@ -621,7 +903,7 @@ class HtmlVisualizer:
             } else {
                 // 일반 모드
                 document.getElementById('current').textContent = index + 1;
-                document.getElementById('total').textContent = schedules.length;
+                document.getElementById('total').textContent = source.count();
             }
             document.getElementById('credits').textContent = schedule.total_credits + '학점';
             document.getElementById('courseCount').textContent = schedule.courses.length + '개';
@@ -742,13 +1024,9 @@ class HtmlVisualizer:
                 courseList.appendChild(li);
             }
             
-            // 강의 정보 찾기 (전체 스케줄 탐색)
+            // 강의 정보 찾기 (강의명 → 대표 분반 색인)
             function findCourseInfo(name) {
-                for (let s of schedules) {
-                    const found = s.courses.find(c => c.name === name);
-                    if (found) return found;
-                }
-                return { name: name, professor: '-', credits: '-' };
+                return source.courseInfo(name) || { name: name, professor: '-', credits: '-' };
             }
             
             // 시간표 그리드 초기화
@@ -814,7 +1092,7 @@ class HtmlVisualizer:
             lastInteractedCourse = null;
             let newIndex = currentIndex - 1;
             if (newIndex < 0) {
-                newIndex = schedules.length - 1; // 처음에서 끝으로
+                newIndex = source.count() - 1; // 처음에서 끝으로
             }
             renderSchedule(newIndex);
         }
@@ -832,7 +1110,7 @@ class HtmlVisualizer:
             // 일반 모드: 순환
             lastInteractedCourse = null;
             let newIndex = currentIndex + 1;
-            if (newIndex >= schedules.length) {
+            if (newIndex >= source.count()) {
                 newIndex = 0; // 끝에서 처음으로
             }
             renderSchedule(newIndex);
@@ -855,6 +1133,15 @@ class HtmlVisualizer:
             }
         });
         
+        // 고정 조건이 바뀐 뒤 필터 결과 반영
+        function applyFilteredIndices(indices) {
+            filteredIndices = indices;
+            filteredPosition = 0;
+            if (filteredIndices.length > 0) {
+                renderSchedule(filteredIndices[0]);
+            }
+        }
+        
         // 특정 강의 핀 해제
         function unpinCourse(event, courseName) {
             event.stopPropagation(); // 부모 클릭 이벤트 방지
@@ -866,35 +1153,8 @@ class HtmlVisualizer:
             
             // 남은 필터로 재계산
             if (courseFilters.size > 0) {
-                // 남은 필터 조건으로 스케줄 재검색
-                const newFilteredIndices = [];
-                for (let i = 0; i < schedules.length; i++) {
-                    const s = schedules[i];
-                    let matchesAll = true;
-                    
-                    for (const [filterName, filterTime] of courseFilters) {
-                        const c = s.courses.find(course => course.name === filterName);
-                        let state = 'NONE';
-                        if (c) {
-                            state = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                        }
-                        if (state !== filterTime) {
-                            matchesAll = false;
-                            break;
-                        }
-                    }
-                    
-                    if (matchesAll) {
-                        newFilteredIndices.push(i);
-                    }
-                }
-                
-                filteredIndices = newFilteredIndices;
-                filteredPosition = 0;
-                
-                if (filteredIndices.length > 0) {
-                    renderSchedule(filteredIndices[0]);
-                }
+                // 남은 필터 조건으로 스케줄 재검색 (색인 교집합)
+                source.match(courseFilters, applyFilteredIndices);
             } else {
                 // 필터 없음
                 filteredIndices = [];
@@ -916,63 +1176,42 @@ class HtmlVisualizer:
             
             // 새로운 강의 클릭: 현재 시간대로 핀만 (순환 안함)
             if (!isAlreadyPinned) {
-                let targetTime = currentTime;
-
-                // 현재 스케줄에 없는 강의(NONE)인 경우, 가능한 시간대 중 하나를 찾음
-                if (targetTime === 'NONE') {
-                     let potentialIndices = filteredIndices.length > 0 ? filteredIndices : 
-                        Array.from({length: schedules.length}, (_, i) => i);
-                     
-                     for (const i of potentialIndices) {
-                        const s = schedules[i];
-                        const c = s.courses.find(course => course.name === courseName);
-                        if (c) {
-                            targetTime = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                            break; // 첫 번째 발견된 시간대 사용
+                // 현재 시간대(혹은 찾은 시간대)로 핀
+                const pin = targetTime => {
+                    courseFilters.set(courseName, targetTime);
+                    console.log(`Pinned ${courseName} at ${targetTime}`);
+                    
+                    // 현재 필터된 범위 내에서 이 시간대의 스케줄만 필터링
+                    source.match(courseFilters, indices => {
+                        if (indices.length === 0) {
+                            showToast("조건 불충족", "선택하신 조건에 맞는 시간표 조합이 없습니다.", "error");
+                            // 롤백 (선택 취소)
+                            courseFilters.delete(courseName);
+                        } else {
+                            applyFilteredIndices(indices);
                         }
-                     }
+                    });
+                };
 
-                     if (targetTime === 'NONE') {
-                         showToast(
-                             "유일한 시간대입니다.",
-                             "현재 설정된 조건(필수/고정 강의)과 충돌 없이 이동 가능한 다른 분반이 없습니다.",
-                             "error"
-                         );
-                         console.log(`Cannot pin ${courseName}: no available schedule in current filter`);
-                         return;
-                     }
+                if (currentTime !== 'NONE') {
+                    pin(currentTime);
+                    return;
                 }
-                
-                // 현재 시간대(혹은 찾은 시간대)로 핀
-                courseFilters.set(courseName, targetTime);
-                console.log(`Pinned ${courseName} at ${targetTime}`);
-                
-                // 현재 필터된 범위 내에서 이 시간대의 스케줄만 필터링
-                let searchIndices = filteredIndices.length > 0 ? filteredIndices : 
-                    Array.from({length: schedules.length}, (_, i) => i);
-                
-                const newFilteredIndices = [];
-                for (const i of searchIndices) {
-                    const s = schedules[i];
-                    const c = s.courses.find(course => course.name === courseName);
-                    if (c) {
-                        const timeKey = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                        if (timeKey === targetTime) {
-                            newFilteredIndices.push(i);
-                        }
+
+                // 현재 스케줄에 없는 강의(NONE)인 경우, 가능한 시간대 중 하나를 찾음
+                // (현재 필터 범위에서 가장 앞 스케줄에 나오는 시간대)
+                source.firstSlot(courseName, courseFilters, targetTime => {
+                    if (targetTime === null) {
+                        showToast(
+                            "유일한 시간대입니다.",
+                            "현재 설정된 조건(필수/고정 강의)과 충돌 없이 이동 가능한 다른 분반이 없습니다.",
+                            "error"
+                        );
+                        console.log(`Cannot pin ${courseName}: no available schedule in current filter`);
+                        return;
                     }
-                }
-                
-                filteredIndices = newFilteredIndices;
-                filteredPosition = 0;
-                
-                if (filteredIndices.length === 0) {
-                    showToast("조건 불충족", "선택하신 조건에 맞는 시간표 조합이 없습니다.", "error");
-                    // 롤백 (선택 취소)
-                    courseFilters.delete(courseName);
-                } else {
-                    renderSchedule(filteredIndices[0]);
-                }
+                    pin(targetTime);
+                });
                 
             } else {
                 // 이미 핀된 강의 클릭 -> 다른 시간대로 로테이션 (Rotate)
@@ -981,124 +1220,132 @@ class HtmlVisualizer:
                 const otherFilters = new Map(courseFilters);
                 otherFilters.delete(courseName);
                 
-                // 2. 나머지 조건에 맞는 스케줄만 탐색하여, 해당 강의의 가능한 '다른 시간대' 목록 수집
-                const availableTimeSlots = new Set();
-                
-                for (const s of schedules) {
-                    // 나머지 필터 조건 확인
-                    let matchesOthers = true;
-                    for (const [filterName, filterTime] of otherFilters) {
-                        const c = s.courses.find(course => course.name === filterName);
-                        let state = 'NONE';
-                        if (c && c.time_slots.length > 0) {
-                            state = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                        }
-                        if (state !== filterTime) {
-                            matchesOthers = false;
-                            break;
-                        }
-                    }
+                // 2. 나머지 조건에 맞는 스케줄과 겹치는 해당 강의의 '다른 시간대' 목록 (정렬됨)
+                source.slotOptions(courseName, otherFilters, ({available, total}) => {
+                    const sortedSlots = available;
                     
-                    if (matchesOthers) {
-                        // 조건에 맞으면, 대상 강의(courseName)의 시간대 수집
-                        const c = s.courses.find(course => course.name === courseName);
-                        if (c && c.time_slots.length > 0) {
-                            const timeKey = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                            availableTimeSlots.add(timeKey);
+                    if (sortedSlots.length <= 1) {
+                        // [개선된 로직] 원인 파악 (분반이 하나뿐 vs 충돌)
+                        if (total <= 1) {
+                             showToast(
+                                "유일한 시간대입니다.",
+                                "이 강의는 개설된 분반이 하나뿐이라 이동할 수 없습니다.",
+                                "error"
+                            );
+                        } else {
+                             showToast(
+                                "이동 불가 (시간 중복)",
+                                "다른 분반이 존재하지만, 현재 설정된 조건(필수/고정 강의)과 시간이 겹쳐 이동할 수 없습니다.",
+                                "error"
+                            );
                         }
+                        return;
                     }
-                }
-                
-                // 3. 정렬 (요일, 시간 순) -> 순환을 위해
-                const sortedSlots = Array.from(availableTimeSlots).sort();
-                
-                if (sortedSlots.length <= 1) {
-                    // [개선된 로직] 원인 파악 (분반이 하나뿐 vs 충돌)
-                    const totalSlots = new Set();
-                     for (const s of schedules) {
-                        const c = s.courses.find(course => course.name === courseName);
-                        if (c && c.time_slots.length > 0) {
-                             const timeKey = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                             totalSlots.add(timeKey);
-                        }
-                     }
                     
-                    if (totalSlots.size <= 1) {
-                         showToast(
-                            "유일한 시간대입니다.",
-                            "이 강의는 개설된 분반이 하나뿐이라 이동할 수 없습니다.",
-                            "error"
-                        );
-                    } else {
-                         showToast(
-                            "이동 불가 (시간 중복)",
-                            "다른 분반이 존재하지만, 현재 설정된 조건(필수/고정 강의)과 시간이 겹쳐 이동할 수 없습니다.",
-                            "error"
-                        );
-                    }
-                    return;
-                }
-                
-                // 4. 현재 시간 다음 순번 찾기
-                const currentTime = courseFilters.get(courseName);
-                let currentIdx = sortedSlots.indexOf(currentTime);
-                let nextIdx = (currentIdx + 1) % sortedSlots.length;
-                let nextTime = sortedSlots[nextIdx];
-                
-                // 5. 필터 업데이트 및 적용
-                courseFilters.set(courseName, nextTime);
-                console.log(`Rotated ${courseName}: ${currentTime} -> ${nextTime}`);
-                
-                // 필터 적용 (위에서 이미 로직이 있으므로 재활용하거나 새로 작성)
-                // 여기선 간단히 전체 재검색 (성능 이슈 없음)
-                const newFilteredIndices = [];
-                for (let i = 0; i < schedules.length; i++) {
-                    const s = schedules[i];
-                    let matchesAll = true;
+                    // 3. 현재 시간 다음 순번 찾기
+                    const currentTime = courseFilters.get(courseName);
+                    let currentIdx = sortedSlots.indexOf(currentTime);
+                    let nextIdx = (currentIdx + 1) % sortedSlots.length;
+                    let nextTime = sortedSlots[nextIdx];
                     
-                    for (const [filterName, filterTime] of courseFilters) {
-                        const c = s.courses.find(course => course.name === filterName);
-                        let state = 'NONE';
-                        if (c && c.time_slots.length > 0) {
-                            state = `${c.time_slots[0].day} ${c.time_slots[0].start_time}`;
-                        }
-                        if (state !== filterTime) {
-                            matchesAll = false;
-                            break;
-                        }
-                    }
+                    // 4. 필터 업데이트 및 적용 (색인 교집합)
+                    courseFilters.set(courseName, nextTime);
+                    console.log(`Rotated ${courseName}: ${currentTime} -> ${nextTime}`);
                     
-                    if (matchesAll) {
-                        newFilteredIndices.push(i);
-                    }
-                }
-                
-                filteredIndices = newFilteredIndices;
-                filteredPosition = 0;
-                
-                if (filteredIndices.length > 0) {
-                    renderSchedule(filteredIndices[0]);
+                    source.match(courseFilters, indices => {
+                        if (indices.length > 0) {
+                            applyFilteredIndices(indices);
+                        } else {
+                            // 이론상 여기 도달하면 안됨 (slotOptions에서 가져왔으므로)
+                            showToast("시스템 오류", "해당 시간표를 찾을 수 없습니다.", "error");
+                            courseFilters.set(courseName, currentTime); // 롤백
+                        }
+                    });
+                });
+            }
+        }
+        
+        // 결과 화면 상태 초기화 (새 결과)
+        function resetView() {
+            courseFilters.clear();
+            filteredIndices = [];
+            filteredPosition = -1;
+            lastInteractedCourse = null;
+            currentIndex = 0;
+        }
+        
+        // 앱 결과 저장소 연결 (QWebChannel 'results' 객체)
+        function connectResultBridge(bridge) {
+            const reload = () => bridge.summary(json => {
+                const summary = JSON.parse(json);
+                allCourseNames = summary.all_names;
+                requiredCourseNames = summary.required_names;
+                source = createChannelSource(bridge, summary);
+                resetView();
+                renderSchedule(0);
+            });
+            // 생성 중 추가된 결과: 보던 조합과 고정 조건 유지
+            const append = () => bridge.summary(json => {
+                if (!source) return reload();
+                const summary = JSON.parse(json);
+                allCourseNames = summary.all_names;
+                requiredCourseNames = summary.required_names;
+                source.update(summary);
+                if (courseFilters.size > 0) {
+                    source.match(courseFilters, indices => {
+                        filteredIndices = indices;
+                        renderSchedule(currentIndex);
+                    });
                 } else {
-                    // 이론상 여기 도달하면 안됨 (availableTimeSlots에서 가져왔으므로)
-                     showToast("시스템 오류", "해당 시간표를 찾을 수 없습니다.", "error");
-                     courseFilters.set(courseName, currentTime); // 롤백
+                    renderSchedule(currentIndex);
                 }
-            }
+            });
+            bridge.resultsChanged.connect(reload);
+            bridge.resultsAppended.connect(append);
+            reload();
         }
         
-        // 초기 렌더링
-        renderSchedule(0);
+        // 초기 렌더링: 내장 데이터가 있으면 바로, 앱 안에서는 결과 저장소에서 첫 페이지를 받아 표시
+        if (schedulePayload) {
+            source = createEmbeddedSource(schedulePayload);
+            renderSchedule(0);
+        } else if (typeof qt !== 'undefined' && typeof QWebChannel !== 'undefined') {
+            new QWebChannel(qt.webChannelTransport, channel => connectResultBridge(channel.objects.results));
+        }
     </script>
 </body>
 </html>
 """
 
+    # 템플릿 조각 (모듈 로드 시 한 번 분할): 앞부분, 결과 데이터, 전체 강의, 필수 강의, 뒷부분
+    TEMPLATE_PLACEHOLDERS = ('SCHEDULE_DATA_PLACEHOLDER', 'ALL_COURSES_PLACEHOLDER', 'REQUIRED_COURSES_PLACEHOLDER')
+    TEMPLATE_PARTS = _split_template(HTML_TEMPLATE, TEMPLATE_PLACEHOLDERS)
+
+    # 결과 화면 버전 (템플릿/내장 데이터 형식이 바뀌면 달라짐, 저장된 HTML 재사용 판단용)
+    VIEWER_VERSION = hashlib.blake2b(
+        f"{PAYLOAD_FORMAT}:{HTML_TEMPLATE}".encode('utf-8'), digest_size=8
+    ).hexdigest()
+
+    @staticmethod
+    def live_html() -> str:
+        """
+        앱 안의 결과 화면용 HTML (내장 데이터 없음)
+        QWebChannel 'results' 객체(ResultBridge)에서 요약/페이지/핀 질의를 받아 표시
+        """
+        prefix, after_data, after_all, suffix = HtmlVisualizer.TEMPLATE_PARTS
+        prefix = prefix.replace(
+            '    <script>',
+            '    <script src="qrc:///qtwebchannel/qwebchannel.js"></script>\n    <script>', 1
+        )
+        return prefix + 'null' + after_data + '[]' + after_all + '[]' + suffix
+
     @staticmethod
     def generate_html(
         schedules: List[Schedule], 
         output_file: str, 
         required_course_names: set = None,
-        desired_course_names: set = None
+        desired_course_names: set = None,
+        shuffle: bool = True
     ):
         """
         시간표 조합 결과를 인터랙티브 HTML 파일로 저장
@@ -1108,6 +1355,7 @@ class HtmlVisualizer:
             output_file: 저장할 파일 경로
             required_course_names: 필수 강의명 집합 (시각적 강조용)
             desired_course_names: 희망 강의명 집합 (전체 목록 표시용)
+            shuffle: 무작위 순서로 표시 (이미 표시 순서로 섞은 결과면 False)
         """
         if not schedules:
             print("❌ 생성된 시간표가 없어 HTML을 생성하지 않습니다.")
@@ -1139,40 +1387,12 @@ class HtmlVisualizer:
                 logger.error(f"HTML 생성 실패: {e}")
                 return None
 
+        # 정규화 데이터는 조합당 분반 번호 몇 개뿐이므로 전체 결과를 그대로 포함
         shuffled_schedules = schedules.copy()
-        
-        # 결과가 너무 많으면 10,000개만 샘플링 (브라우저 성능 고려)
-        if len(shuffled_schedules) > 10000:
-            print(f"⚠️  결과가 너무 많아 10,000개만 랜덤 추출하여 시각화합니다.")
-            shuffled_schedules = random.sample(shuffled_schedules, 10000)
-        else:
+        if shuffle:
             random.shuffle(shuffled_schedules)
             
-        # 2. 데이터 직렬화 (JSON)
-        # Schedule -> dict 변환
-        schedule_data = []
-        for s in shuffled_schedules:
-            courses_data = []
-            for c in s.courses:
-                courses_data.append({
-                    "name": c.name,
-                    "credits": c.credits,
-                    "professor": c.professor,
-                    "time_slots": [
-                        {"day": t.day, "start_time": t.start_time, "end_time": t.end_time}
-                        for t in c.time_slots
-                    ]
-                })
-            
-            schedule_data.append({
-                "courses": courses_data,
-                "total_credits": s.total_credits,
-                "has_random_filled": getattr(s, 'has_random_filled', False)
-            })
-            
-        json_str = json.dumps(schedule_data, ensure_ascii=False)
-        
-        # 3. 전체 강의 목록 준비 (사이드바용)
+        # 2. 전체 강의 목록 준비 (사이드바용)
         if required_course_names is None: required_course_names = set()
         if desired_course_names is None: desired_course_names = set()
         
@@ -1187,17 +1407,20 @@ class HtmlVisualizer:
         all_courses_json = json.dumps(list(all_names), ensure_ascii=False)
         required_courses_json = json.dumps(list(required_course_names), ensure_ascii=False)
         
-        # 4. HTML 생성
-        final_html = HtmlVisualizer.HTML_TEMPLATE.replace('SCHEDULE_DATA_PLACEHOLDER', json_str)
-        final_html = final_html.replace('ALL_COURSES_PLACEHOLDER', all_courses_json)
-        final_html = final_html.replace('REQUIRED_COURSES_PLACEHOLDER', required_courses_json)
-        
+        # 3. HTML 생성 (템플릿 조각 사이에 데이터를 바로 기록, 결과 데이터는 스트리밍 인코딩)
+        prefix, after_data, after_all, suffix = HtmlVisualizer.TEMPLATE_PARTS
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_html)
+            f.write(prefix)
+            write_schedule_payload(f, shuffled_schedules)
+            f.write(after_data)
+            f.write(all_courses_json)
+            f.write(after_all)
+            f.write(required_courses_json)
+            f.write(suffix)
             
         print(f"✅ HTML 시각화 파일 생성 완료: {output_file}")
 
 
-def generate_html(schedules, output_file, required_names=None, desired_names=None):
+def generate_html(schedules, output_file, required_names=None, desired_names=None, shuffle=True):
     """호환성 래퍼"""
-    HtmlVisualizer.generate_html(schedules, output_file, required_names, desired_names)
+    HtmlVisualizer.generate_html(schedules, output_file, required_names, desired_names, shuffle)
@@ -3,6 +3,8 @@ Config Interface
 Replaces ConfigTab with Fluent UI.
 Uses Card Widgets for grouping settings.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QFileDialog, 
     QTableWidgetItem, QHeaderView, QAbstractItemView, QSizePolicy, QAbstractSpinBox
@@ -16,6 +18,7 @@ from qfluentwidgets import (
 )
 
 from ..viewmodels.config_viewmodel import ConfigViewModel
+from ..utils.main_thread import MainThreadDispatcher
 
 # Helper for dialogs
 from .search_interface import SearchInterface # Just for reference or sharing types? No.
@@ -35,7 +38,13 @@ class ConfigInterface(ScrollArea):
         # ViewModel Initialization
         config_service = controller.config_service if controller else None
         course_service = controller.course_service if controller else None
-        self.vm = ConfigViewModel(config_service, course_service)
+        # 필수 강의 조합 가능 여부는 백그라운드에서 검사하고 결과만 UI 스레드로 전달
+        self._dispatcher = MainThreadDispatcher(self)
+        self.vm = ConfigViewModel(
+            config_service, course_service,
+            executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix='feasibility'),
+            dispatcher=self._dispatcher
+        )
         
         # Inject Interaction Service (Critical for Alerts)
         if controller and controller.interaction_service:
@@ -266,6 +275,9 @@ class ConfigInterface(ScrollArea):
         table.setSelectionBehavior(QAbstractItemView.SelectRows)
         table.setSelectionMode(QAbstractItemView.SingleSelection)
         table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # 우클릭: 분반 변경 / 삭제
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.customContextMenuRequested.connect(lambda pos: self._show_course_menu(list_type, pos))
         
         layout.addWidget(table)
 
@@ -279,9 +291,13 @@ class ConfigInterface(ScrollArea):
         addBtn.clicked.connect(lambda: self._show_add_dialog(list_type))
         delBtn = PushButton("삭제", self.view)
         delBtn.clicked.connect(lambda: self._delete_course(list_type))
+        # 제외 시간/다른 필수 강의와 겹치지 않는 다음 분반으로 변경
+        rotateBtn = PushButton("분반 변경", self.view)
+        rotateBtn.clicked.connect(lambda: self._rotate_course(list_type))
 
         btnLayout.addWidget(addBtn)
         btnLayout.addWidget(delBtn)
+        btnLayout.addWidget(rotateBtn)
         layout.addLayout(btnLayout)
 
 
@@ -449,6 +465,24 @@ class ConfigInterface(ScrollArea):
             menu.addAction(Action("삭제", triggered=lambda: self.vm.remove_excluded_time(item.row())))
             menu.exec(self.exScheduleTable.mapToGlobal(pos))
 
+    def _show_course_menu(self, list_type, pos):
+        from qfluentwidgets import RoundMenu, Action
+        table = self.reqTable if list_type == 'required' else self.desTable
+        item = table.itemAt(pos)
+        if item is not None:
+            row = item.row()
+            menu = RoundMenu(parent=self)
+            menu.addAction(Action("분반 변경", triggered=lambda: self.vm.rotate_course(list_type, row)))
+            menu.addAction(Action("삭제", triggered=lambda: self.vm.remove_course(list_type, row)))
+            menu.exec(table.mapToGlobal(pos))
+
+    def _rotate_course(self, list_type):
+        table = self.reqTable if list_type == 'required' else self.desTable
+        row = table.currentRow()
+        if row >= 0:
+            self.vm.rotate_course(list_type, row)
+            table.selectRow(row)
+
     def _delete_course(self, list_type):
         table = self.reqTable if list_type == 'required' else self.desTable
         row = table.currentRow()
@@ -1,16 +1,24 @@
 """
 Result Interface
-Embeds the generated HTML schedule using QWebEngineView.
+Shows generated schedules with a native Qt timetable (ResultViewModel),
+or embeds the HTML result view using QWebEngineView.
 Uses native Qt widgets for instant loading screen display.
+
+QtWebEngine (Chromium) is imported and created lazily: only when the web view
+is actually needed, or when warm_up() is called after the window's first paint.
 """
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QStackedWidget
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtCore import QUrl, QTimer, Qt
 from PySide6.QtGui import QFont
 import os
 
 from ..widgets.loading_spinner import LoadingSpinner
 from ..widgets.stable_label import StableLabel
+from ..widgets.native_result_view import NativeResultView
+from ..services.result_bridge import ResultBridge
+from ..viewmodels.result_viewmodel import ResultViewModel
+from ...core.constants import UIConstants
+from ...services.visualizer import HtmlVisualizer
 
 
 class ResultInterface(QWidget):
@@ -34,15 +42,56 @@ class ResultInterface(QWidget):
         self.loadingWidget = self._create_loading_widget()
         self.stackedWidget.addWidget(self.loadingWidget)  # Index 0
         
-        # 🎯 페이지 2: WebView 결과 화면
-        self.webView = QWebEngineView(self)
-        self.stackedWidget.addWidget(self.webView)  # Index 1
-        
-        # 초기 상태: 빈 화면
-        self.stackedWidget.setCurrentIndex(1)
-        
-        # Initial load if exists
-        self.load_schedule()
+        # 🎯 페이지 2: 안내/오류 메시지 (네이티브 라벨)
+        self.messageLabel = QLabel("", self)
+        self.messageLabel.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.messageLabel.setWordWrap(True)
+        self.messageLabel.setContentsMargins(20, 50, 20, 20)
+        self.messageLabel.setStyleSheet("background-color: white;")
+        self.stackedWidget.addWidget(self.messageLabel)  # Index 1
+        
+        # 🎯 페이지 3: 네이티브 시간표 (결과 저장소를 직접 읽음, Chromium 없이 즉시 표시)
+        schedule_service = getattr(controller, 'schedule_service', None)
+        self.resultVm = ResultViewModel(schedule_service)
+        if controller and controller.interaction_service:
+            self.resultVm.set_interaction_service(controller.interaction_service)
+        self.nativeView = NativeResultView(self.resultVm, self)
+        self.stackedWidget.addWidget(self.nativeView)  # Index 2
+        
+        # 🎯 페이지 4: WebView 결과 화면 (필요할 때 생성, _ensure_web_view)
+        # 결과 저장소 연결: 화면은 필요한 페이지만 QWebChannel로 요청
+        self.resultBridge = ResultBridge(schedule_service, self)
+        self.webView = None
+        self.webChannel = None
+        self._live_loaded = False
+        
+        # 초기 상태: 빈 화면 (저장된 결과는 처음 표시될 때 로드)
+        self.stackedWidget.setCurrentWidget(self.messageLabel)
+        self._initial_loaded = False
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Initial load if exists (창 생성 시점이 아니라 결과 탭이 처음 보일 때)
+        if not self._initial_loaded:
+            self._initial_loaded = True
+            if self.stackedWidget.currentWidget() is self.messageLabel:
+                self.load_schedule()
+    
+    def _ensure_web_view(self):
+        """QWebEngineView + QWebChannel 생성 (처음 한 번, Chromium 프로세스 시작)"""
+        if self.webView is None:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            from PySide6.QtWebChannel import QWebChannel
+            self.webView = QWebEngineView(self)
+            self.webChannel = QWebChannel(self.webView.page())
+            self.webChannel.registerObject("results", self.resultBridge)
+            self.stackedWidget.addWidget(self.webView)  # Index 3
+        return self.webView
+    
+    def warm_up(self):
+        """웹 엔진 미리 시작 (첫 화면 표시 후 유휴 시간에 호출, 네이티브 결과 화면이면 생략)"""
+        if not UIConstants.NATIVE_RESULT_VIEW:
+            self._ensure_web_view()
     
     def _create_loading_widget(self):
         """네이티브 Qt 위젯으로 로딩 화면 생성"""
@@ -81,11 +130,27 @@ class ResultInterface(QWidget):
         
         return widget
     def load_schedule(self):
-        """Loads the schedule_results.html file"""
+        """결과 표시 (앱에 결과가 있으면 결과 저장소에 연결, 없으면 저장된 schedule_results.html)"""
         # 🎯 스피너 정지
         if hasattr(self, 'spinner'):
             self.spinner.stop()
         
+        if UIConstants.NATIVE_RESULT_VIEW and self.resultBridge.has_results():
+            self.resultVm.refresh()
+            self.stackedWidget.setCurrentWidget(self.nativeView)
+            self.nativeView.setFocus()
+            return
+        
+        if self.resultBridge.has_results():
+            # 결과 화면 HTML은 한 번만 로드, 이후에는 결과 교체 신호만 보냄
+            webView = self._ensure_web_view()
+            if not self._live_loaded:
+                webView.setHtml(HtmlVisualizer.live_html(), QUrl("qrc:///"))
+                self._live_loaded = True
+            self.resultBridge.refresh()
+            self.stackedWidget.setCurrentWidget(webView)
+            return
+        
         # Try to find the file
         path = "schedule_results.html"
         if self.controller:
@@ -95,13 +160,15 @@ class ResultInterface(QWidget):
                  path = os.path.join(self.controller.data_path, 'schedule_results.html')
         
         if os.path.exists(path):
+            self._live_loaded = False
             import time
             abs_path = os.path.abspath(path)
             # Force reload by adding dummy query param
-            self.webView.setUrl(QUrl(f"file:///{abs_path.replace(os.sep, '/')}?t={int(time.time()*1000)}"))
+            webView = self._ensure_web_view()
+            webView.setUrl(QUrl(f"file:///{abs_path.replace(os.sep, '/')}?t={int(time.time()*1000)}"))
             
             # 🎯 WebView로 전환
-            self.stackedWidget.setCurrentIndex(1)
+            self.stackedWidget.setCurrentWidget(webView)
         else:
             self.show_placeholder()
             
@@ -111,8 +178,8 @@ class ResultInterface(QWidget):
         if hasattr(self, 'spinner'):
             self.spinner.stop()
             
-        self.webView.setHtml("")
-        self.stackedWidget.setCurrentIndex(1)
+        self.messageLabel.setText("")
+        self.stackedWidget.setCurrentWidget(self.messageLabel)
 
     def show_loading(self):
         """🎯 네이티브 로딩 화면으로 즉시 전환 (0~10ms)"""
@@ -135,10 +202,10 @@ class ResultInterface(QWidget):
         
     def show_error(self, msg):
         """에러 메시지 표시"""
-        self.webView.setHtml(f"""
-        <div style="text-align: center; margin-top: 50px; font-family: 'Segoe UI', sans-serif; color: #d13438;">
+        self.messageLabel.setText(f"""
+        <div style="text-align: center; font-family: 'Segoe UI', sans-serif; color: #d13438;">
             <h3>⚠️ 오류가 발생했습니다</h3>
             <p>{msg}</p>
         </div>
         """)
-        self.stackedWidget.setCurrentIndex(1)
+        self.stackedWidget.setCurrentWidget(self.messageLabel)
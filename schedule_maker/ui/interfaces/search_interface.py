@@ -3,18 +3,33 @@ Search Interface
 Replaces SearchTab with modern Fluent UI components.
 """
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QHeaderView, QTableWidgetItem, QMenu,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QHeaderView, QMenu,
     QAbstractItemView
 )
 
 from PySide6.QtCore import Qt, Signal, Slot
 from qfluentwidgets import (
-    SearchLineEdit, CheckBox, PrimaryPushButton, TableWidget,
+    SearchLineEdit, CheckBox, PrimaryPushButton, TableView,
     FluentIcon as FIF, RoundMenu, Action, BodyLabel, TitleLabel,
-    SubtitleLabel, StrongBodyLabel, PushButton, SegmentedWidget
+    SubtitleLabel, StrongBodyLabel, PushButton, SegmentedWidget, ComboBox
 )
 
 from ..viewmodels.search_viewmodel import SearchViewModel
+from ..utils.main_thread import MainThreadDispatcher
+from ..models.search_result_model import SearchResultModel, HEADERS, SORT_COLUMNS
+from ...core.constants import SearchMode
+from ...core.course_query import WEEKDAYS
+
+# 검색 방식 선택지 (표시 이름, 모드)
+SEARCH_MODE_OPTIONS = [
+    ("일반 검색", SearchMode.EXACT),
+    ("초성 검색", SearchMode.CHOSEONG),
+    ("오타 허용", SearchMode.FUZZY),
+]
+
+# 패싯 필터 선택지
+FACET_DAYS = WEEKDAYS[:5]
+FACET_CREDITS = [None, 1, 2, 3, 4]  # None: 전체
 
 
 class CourseDetailWidget(QWidget):
@@ -158,7 +173,9 @@ class SearchInterface(QWidget):
         # ViewModel Initialization
         course_service = controller.course_service if controller else None
         config_service = controller.config_service if controller else None
-        self.vm = SearchViewModel(course_service, config_service)
+        # 검색은 백그라운드에서 실행하고 결과만 UI 스레드로 전달
+        self._dispatcher = MainThreadDispatcher(self)
+        self.vm = SearchViewModel(course_service, config_service, dispatcher=self._dispatcher)
         
         # Inject Interaction Service (Critical for Alerts)
         if controller and controller.interaction_service:
@@ -189,7 +206,7 @@ class SearchInterface(QWidget):
         self.searchLineEdit.setPlaceholderText("강의명, 교수명 검색...")
         self.searchLineEdit.setFixedWidth(300)
         self.searchLineEdit.textChanged.connect(self._on_query_change)
-        self.searchLineEdit.returnPressed.connect(self.vm.perform_search)
+        self.searchLineEdit.returnPressed.connect(lambda: self.vm.search_async(debounce=False))
         self.searchLayout.addWidget(self.searchLineEdit)
         
         # Options
@@ -203,33 +220,64 @@ class SearchInterface(QWidget):
         self.profCheckBox.stateChanged.connect(self._on_options_change)
         self.searchLayout.addWidget(self.profCheckBox)
         
+        self.modeComboBox = ComboBox(self)
+        self.modeComboBox.addItems([label for label, _ in SEARCH_MODE_OPTIONS])
+        self.modeComboBox.currentIndexChanged.connect(self._on_mode_change)
+        self.searchLayout.addWidget(self.modeComboBox)
+        
         self.searchLayout.addStretch(1)
         
         # Search Button (Optional, since Enter works, but good for UX)
         self.searchButton = PrimaryPushButton("검색", self)
         self.searchButton.setIcon(FIF.SEARCH)
-        self.searchButton.clicked.connect(self.vm.perform_search)
+        self.searchButton.clicked.connect(lambda: self.vm.search_async(debounce=False))
         self.searchLayout.addWidget(self.searchButton)
 
         self.vBoxLayout.addLayout(self.searchLayout)
         
+        # Facet Bar (요일만 / 학점 / 전학년, 괄호 안은 선택 시 결과 수 - 요일은 현재 선택에 추가했을 때)
+        self.facetLayout = QHBoxLayout()
+        self.facetLayout.addWidget(StrongBodyLabel("요일만", self))
+        self.dayCheckBoxes = {}
+        for day in FACET_DAYS:
+            box = CheckBox(day, self)
+            box.stateChanged.connect(self._on_facet_change)
+            self.dayCheckBoxes[day] = box
+            self.facetLayout.addWidget(box)
+        
+        self.creditsComboBox = ComboBox(self)
+        self.creditsComboBox.addItems(self._credit_labels({}))
+        self.creditsComboBox.currentIndexChanged.connect(self._on_facet_change)
+        self.facetLayout.addWidget(self.creditsComboBox)
+        
+        self.allGradeCheckBox = CheckBox("전학년", self)
+        self.allGradeCheckBox.stateChanged.connect(self._on_facet_change)
+        self.facetLayout.addWidget(self.allGradeCheckBox)
+        self.facetLayout.addStretch(1)
+        self.vBoxLayout.addLayout(self.facetLayout)
+        
         # Results Count
         self.countLabel = BodyLabel("검색 결과: 0개", self)
         self.countLabel.setTextColor(Qt.GlobalColor.gray, Qt.GlobalColor.gray) # Fluent way might differ
         self.vBoxLayout.addWidget(self.countLabel)
 
-        # Table
-        self.table = TableWidget(self)
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(['강의번호', '강의명', '학점', '교수', '시간'])
+        # Table (모델/뷰: 보이는 행만 표시 문자열 생성)
+        course_service = self.vm.course_service
+        self.model = SearchResultModel(course_service.get_course_table() if course_service else None, self)
+        self.table = TableView(self)
+        self.table.setModel(self.model)
         self.table.verticalHeader().hide()
         
         header = self.table.horizontalHeader()
         
         # Reset all to Interactive for manual control
-        for i in range(5):
+        for i in range(len(HEADERS)):
              header.setSectionResizeMode(i, QHeaderView.Interactive)
         
+        # 헤더 클릭 → 정렬 (순위 배열 기반)
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(lambda col: self.vm.toggle_sort(SORT_COLUMNS[col]))
+        
         # Selection Mode
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -241,7 +289,7 @@ class SearchInterface(QWidget):
         # self.table.customContextMenuRequested.connect(self._show_context_menu)
         
         # Click Interaction
-        self.table.cellClicked.connect(self._on_table_click)
+        self.table.clicked.connect(self._on_table_click)
         
         self.vBoxLayout.addWidget(self.table)
         
@@ -257,7 +305,7 @@ class SearchInterface(QWidget):
         
     def _on_table_resize(self, event):
         # Call original resize first
-        super(TableWidget, self.table).resizeEvent(event)
+        super(TableView, self.table).resizeEvent(event)
         
         width = self.table.viewport().width()
         total_ratio = sum(self.column_ratios)
@@ -267,97 +315,90 @@ class SearchInterface(QWidget):
             self.table.setColumnWidth(i, new_width)
 
     def _bind_viewmodel(self):
-        self.vm.bind('results', self._update_results)
-        # self.vm.bind('sort_changed', ...) # Sort logic adaptation needed for TableWidget if custom
+        self.vm.bind('result_rows', self._update_results)
+        self.vm.bind('sort_changed', self._update_sort_indicator)
+        self.vm.bind('facets', self._update_facets)
 
     def _on_query_change(self, text):
         self.vm.query = text
+        self.vm.search_async()
 
     def _on_options_change(self, state):
         self.vm.set_search_options(self.nameCheckBox.isChecked(), self.profCheckBox.isChecked())
+        self.vm.search_async(debounce=False)
 
-    def _update_results(self, data):
-        self.table.setRowCount(len(data))
-        self.countLabel.setText(f"검색 결과: {len(data)}개")
-        
-        for i, row_data in enumerate(data):
-            for j, val in enumerate(row_data):
-                text = str(val)
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignCenter)
-                # Tooltip for truncated text
-                item.setToolTip(text)
-                self.table.setItem(i, j, item)
-        
-    
+    def _on_mode_change(self, index):
+        self.vm.set_search_mode(SEARCH_MODE_OPTIONS[index][1])
+        self.vm.search_async(debounce=False)
+
+    def _on_facet_change(self, *args):
+        only_days = {day for day, box in self.dayCheckBoxes.items() if box.isChecked()}
+        credits = FACET_CREDITS[max(self.creditsComboBox.currentIndex(), 0)]
+        self.vm.set_facet_filter('only_days', only_days or None)
+        self.vm.set_facet_filter('credits', {credits} if credits is not None else None)
+        self.vm.set_facet_filter('all_grade', True if self.allGradeCheckBox.isChecked() else None)
+        self.vm.search_async(debounce=False)
 
-    def _on_table_click(self, row, col):
-        # 1. Check if clicked row is a Detail Row
-        # We identify detail rows by checking if they contain our widget
-        if self.table.cellWidget(row, 0):
-            # It's a detail row or has a widget. 
-            # In our logic, detail row spans all columns and has widget in col 0.
+    @staticmethod
+    def _credit_labels(counts):
+        labels = []
+        for credits in FACET_CREDITS:
+            if credits is None:
+                labels.append("전체 학점")
+            else:
+                labels.append(f"{credits}학점 ({counts.get(credits, 0)})")
+        return labels
+
+    def _update_facets(self, facets):
+        # 항목 텍스트만 바꿔서 선택 상태 유지
+        for index, label in enumerate(self._credit_labels(facets.get('credits', {}))):
+            self.creditsComboBox.setItemText(index, label)
+        days = facets.get('days', {})
+        for day, box in self.dayCheckBoxes.items():
+            box.setText(f"{day} ({days.get(day, 0)})")
+        self.allGradeCheckBox.setText(f"전학년 ({facets.get('all_grade', 0)})")
+
+    def _update_results(self, rows):
+        # 카탈로그가 재로드로 교체되었으면 모델도 교체
+        table = self.controller.course_service.get_course_table() if self.controller else None
+        if table is not None and table is not self.model.table:
+            self.model.set_table(table)
+        
+        self.table.clearSpans()
+        self.model.set_rows(rows)
+        self.countLabel.setText(f"검색 결과: {self.model.result_count}개")
+        self._attach_detail_widget()
+
+    def _update_sort_indicator(self, sort_info):
+        column_id, sort_state = sort_info
+        header = self.table.horizontalHeader()
+        if sort_state == 0:
+            header.setSortIndicatorShown(False)
             return
+        header.setSortIndicatorShown(True)
+        order = Qt.AscendingOrder if sort_state == 1 else Qt.DescendingOrder
+        header.setSortIndicator(SORT_COLUMNS.index(column_id), order)
 
-        # 2. Check if the NEXT row is already a detail row (Toggle Off)
-        if row + 1 < self.table.rowCount():
-            if isinstance(self.table.cellWidget(row + 1, 0), CourseDetailWidget):
-                self.table.removeRow(row + 1)
-                return
+    def _on_table_click(self, index):
+        # 상세 행은 위젯이 처리
+        if self.model.is_detail_row(index.row()):
+            return
+        
+        # 상세 행 열기/닫기는 모델 상태로 처리 (한 번에 하나만 열림)
+        self.table.clearSpans()
+        self.model.toggle_detail(index.row())
+        self._attach_detail_widget()
 
-        # 3. Collapse any other open detail rows
-        # Iterate backwards to avoid index shifting issues when removing
-        for i in range(self.table.rowCount() - 1, -1, -1):
-            if isinstance(self.table.cellWidget(i, 0), CourseDetailWidget):
-                self.table.removeRow(i)
-        
-        # 4. Re-calculate row index (it might have changed if we removed rows above)
-        # But wait, if we removed a row *above* the clicked one, 'row' is invalid.
-        # Simple fix: We cleared ALL detail rows. So the clicked row index might need adjustment?
-        # Actually, if we remove Detail Rows, formatting changes.
-        # To be safe: Store the Item (unique ID) of clicked row before clearing?
-        # But `row` is just an index.
-        #
-        # Better approach: 
-        # Since we enforce "One Detail Row", just find it. 
-        # If it was below current row, current row index is same.
-        # If it was above current row, current row index decreases.
-        
-        # Let's rely on QTableWidget.item to find the row again?
-        # Or simplistic: Just clear all, then find which row has the data we want?
-        # 
-        # FASTEST WAY:
-        # Just use the data from the clicked row (text) to identify it, clear all, then find the row with that data.
-        
-        c_id = self.table.item(row, 0).text()
-        c_name = self.table.item(row, 1).text()
-        
-        # Clear all detail rows again (just to be sure)
-        for i in range(self.table.rowCount() - 1, -1, -1):
-             if isinstance(self.table.cellWidget(i, 0), CourseDetailWidget):
-                self.table.removeRow(i)
-                
-        # Find the row again (as indices shifted)
-        current_row = -1
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            if item and item.text() == c_id:
-                # Potential collision if multiple same IDs? (Unlikely for lecture ID)
-                # But actually ID is unique per lecture usually, or at least visible one.
-                # Let's assume ID is column 0.
-                current_row = i
-                break
-        
-        if current_row == -1: return 
-        
-        # 5. Insert New Detail Row
-        insert_idx = current_row + 1
-        self.table.insertRow(insert_idx)
-        
-        # Widget
-        detail_widget = CourseDetailWidget(self.vm, c_id, c_name)
-        self.table.setCellWidget(insert_idx, 0, detail_widget)
-        self.table.setRowHeight(insert_idx, 60)
-        self.table.setSpan(insert_idx, 0, 1, 5) # Span 5 columns
+    def _attach_detail_widget(self):
+        """모델의 상세 행 위치에 CourseDetailWidget 배치"""
+        detail_row = self.model.detail_row
+        if detail_row < 0:
+            return
+        
+        course = self.model.table.view(self.model.course_row_at(detail_row - 1))
+        detail_widget = CourseDetailWidget(self.vm, course.course_id, course.name)
+        self.table.setIndexWidget(self.model.index(detail_row, 0), detail_widget)
+        self.table.setRowHeight(detail_row, 60)
+        self.table.setSpan(detail_row, 0, 1, len(HEADERS))
         
     # Context menu removed
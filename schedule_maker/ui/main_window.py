@@ -4,8 +4,9 @@ Fluent Window with Navigation
 """
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QIcon, QColor
-from PySide6.QtCore import QThread, Signal, QObject, Qt, QTimer
+from PySide6.QtCore import QThread, Signal, QObject, Qt, QTimer, QFileSystemWatcher
 import os
+import threading
 
 from qfluentwidgets import (
     FluentWindow, NavigationItemPosition, FluentIcon as FIF,
@@ -17,8 +18,17 @@ from .interfaces.config_interface import ConfigInterface
 from .interfaces.result_interface import ResultInterface
 from .services.interaction_service import MainWindowInteractionService
 from .workers import ScheduleGenerationWorker, GenerationStateManager, GenerationState
+from ..core.profiling import profiler
 
 class MainWindow(FluentWindow):
+    # 백그라운드 강의 CSV 로드 완료 (성공 여부, UI 스레드로 전달)
+    catalogLoaded = Signal(bool)
+    # 다시 내보낸 강의 CSV 비교 완료 (CatalogDiff, 실패 시 None)
+    catalogChangesRead = Signal(object)
+    
+    # 첫 화면 표시 후 웹 엔진 미리 시작까지 대기 (ms)
+    WEB_WARMUP_DELAY_MS = 1500
+    
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -42,11 +52,18 @@ class MainWindow(FluentWindow):
         self.is_settings_dirty = True # Initial state
 
         # Create Interfaces
-        self.searchInterface = SearchInterface(self, controller)
-        self.configInterface = ConfigInterface(self, controller)
-        self.resultInterface = ResultInterface(self, controller)
+        with profiler.phase('main_window.search_interface'):
+            self.searchInterface = SearchInterface(self, controller)
+        with profiler.phase('main_window.config_interface'):
+            self.configInterface = ConfigInterface(self, controller)
+        with profiler.phase('main_window.result_interface'):
+            self.resultInterface = ResultInterface(self, controller)
         
-        self.initNavigation()
+        with profiler.phase('main_window.navigation'):
+            self.initNavigation()
+        self.initCatalogWatcher()
+        self.catalogLoaded.connect(self._on_catalog_loaded)
+        self._generate_when_loaded = False
         self.splashScreen = SplashScreen(self.windowIcon(), self)
         self.splashScreen.finish()
         
@@ -93,6 +110,99 @@ class MainWindow(FluentWindow):
             self.configInterface.vm.bind('config_changed', lambda _: self.set_dirty(True))
 
 
+    def initCatalogWatcher(self):
+        """강의 CSV 재내보내기 감지 (저장 도중 여러 번 발생하는 이벤트는 디바운스)"""
+        self._catalog_reload_timer = QTimer(self)
+        self._catalog_reload_timer.setSingleShot(True)
+        self._catalog_reload_timer.setInterval(1000)
+        self._catalog_reload_timer.timeout.connect(self._reload_catalog)
+        
+        self._catalog_watcher = QFileSystemWatcher(self)
+        if os.path.exists(self.controller.csv_path):
+            self._catalog_watcher.addPath(self.controller.csv_path)
+        self._catalog_watcher.fileChanged.connect(lambda _: self._catalog_reload_timer.start())
+        
+        # CSV 파싱/비교는 백그라운드에서, 카탈로그 반영은 UI 스레드에서 생성 사이에만
+        self._catalog_reading = False
+        self._catalog_reread = False
+        self._pending_catalog_diff = None
+        self.catalogChangesRead.connect(self._on_catalog_changes_read)
+
+    def start_catalog_load(self):
+        """
+        강의 CSV를 백그라운드에서 로드 (창을 먼저 띄운 뒤 호출)
+        완료되면 catalogLoaded 신호로 탭 갱신
+        """
+        if self.controller.is_catalog_loaded:
+            self.catalogLoaded.emit(True)
+            return
+        thread = threading.Thread(
+            target=lambda: self.catalogLoaded.emit(self.controller.load_catalog(show_errors=False)),
+            name='catalog-load', daemon=True
+        )
+        thread.start()
+        
+        # 첫 화면이 그려진 뒤 유휴 시간에 웹 엔진 준비 (네이티브 결과 화면이면 생략됨)
+        QTimer.singleShot(self.WEB_WARMUP_DELAY_MS, self.resultInterface.warm_up)
+    
+    def _on_catalog_loaded(self, ok):
+        if not ok:
+            msg = self.controller.catalog_error or 'CSV 파일 로드 실패'
+            self.show_error('오류', msg)
+            if self._generate_when_loaded:
+                self._generate_when_loaded = False
+                self.resultInterface.show_error(msg)
+            return
+        self.refresh_tabs()
+        # 로드 중에 결과 탭으로 이동했으면 이제 생성
+        if self._generate_when_loaded:
+            self._generate_when_loaded = False
+            self._check_and_generate()
+    
+    def _reload_catalog(self):
+        # 처음 로드가 끝나기 전이면 그 로드가 최신 파일을 읽음
+        if not self.controller.is_catalog_loaded:
+            return
+        # 파일을 교체하는 방식으로 저장하면 감시 대상에서 빠지므로 다시 등록
+        csv_path = self.controller.csv_path
+        if os.path.exists(csv_path) and csv_path not in self._catalog_watcher.files():
+            self._catalog_watcher.addPath(csv_path)
+        # 읽는 중에 다시 바뀌면 끝난 뒤 한 번 더 읽음 (비교는 한 번에 하나씩)
+        if self._catalog_reading:
+            self._catalog_reread = True
+            return
+        self._catalog_reading = True
+        thread = threading.Thread(
+            target=lambda: self.catalogChangesRead.emit(self.controller.read_catalog_changes()),
+            name='catalog-reload', daemon=True
+        )
+        thread.start()
+
+    def _on_catalog_changes_read(self, diff):
+        self._catalog_reading = False
+        if diff is None:
+            self.show_error('오류', self.controller.catalog_error or 'CSV 파일 재로드 실패')
+        elif diff.has_changes:
+            # 아직 반영하지 않은 이전 비교 결과는 같은 카탈로그 기준이므로 새 결과로 대체
+            self._pending_catalog_diff = diff
+        if self._catalog_reread:
+            self._catalog_reread = False
+            self._reload_catalog()
+            return
+        self._apply_pending_catalog_changes()
+
+    def _apply_pending_catalog_changes(self):
+        """비교가 끝난 변경 내역 반영 (생성 중이면 생성이 끝난 뒤로 미룸)"""
+        diff = self._pending_catalog_diff
+        if diff is None or self._catalog_reading:
+            return
+        if self.generation_state_manager.is_busy:
+            # 생성 스레드가 같은 카탈로그를 읽는 중이므로 지금은 반영하지 않음
+            self.set_dirty(True)
+            return
+        self._pending_catalog_diff = None
+        self.controller.apply_catalog_changes(diff)
+
     # --- Interaction Service Implementation ---
     # MainWindow는 IInteractionService를 구현하여 하위 호환성 유지
     def show_error(self, title, msg):
@@ -111,6 +221,11 @@ class MainWindow(FluentWindow):
         print(f"[DEBUG] MainWindow.set_dirty({dirty}) - Prev: {self.is_settings_dirty}")
         self.is_settings_dirty = dirty
 
+    def closeEvent(self, event):
+        # 검색 디바운스 스레드/실행기 정리 (진행 중인 검색 결과는 버림)
+        self.searchInterface.vm.shutdown()
+        super().closeEvent(event)
+
     # --- Controller callbacks ---
     def refresh_tabs(self):
         # Refresh logic
@@ -142,26 +257,43 @@ class MainWindow(FluentWindow):
 
     def _check_and_generate(self):
         print(f"[DEBUG] _check_and_generate called. is_settings_dirty={self.is_settings_dirty}")
+        if self.is_settings_dirty and not self.controller.is_catalog_loaded:
+            # 강의 데이터 로드가 끝나면 생성
+            self._generate_when_loaded = True
+            self.resultInterface.show_loading()
+            self.resultInterface.update_progress("강의 데이터를 불러오는 중...")
+            return
         if self.is_settings_dirty:
-            # [Validation Check]
+            # [Validation Check] 백그라운드 조합 가능 여부 검사가 진행 중이면 끝난 뒤 이어서 (UI 스레드를 막지 않음)
             if hasattr(self.configInterface, 'vm'):
-                is_valid, msg = self.configInterface.vm.get_validation_status()
-                if not is_valid:
-                    print(f"[INFO] Generation skipped due to validation error: {msg}")
-                    self.resultInterface.show_error(f"생성 불가: {msg}")
-                    self.is_settings_dirty = False 
-                    return
-
-            # 🎯 상태 전이: IDLE → PREPARING (이벤트가 UI 업데이트 트리거)
-            self.generation_state_manager.transition_to(
-                GenerationState.PREPARING,
-                "UI 준비 중..."
-            )
-            # 이후 처리는 _on_generation_state_changed에서
+                vm = self.configInterface.vm
+                if vm.validation_pending:
+                    self.resultInterface.show_loading()
+                    self.resultInterface.update_progress("설정 확인 중...")
+                vm.request_validation_status(self._generate_if_valid)
+            else:
+                self._generate_if_valid((True, ""))
             
         else:
             self.resultInterface.load_schedule()
 
+    def _generate_if_valid(self, status):
+        is_valid, msg = status
+        if not is_valid:
+            print(f"[INFO] Generation skipped due to validation error: {msg}")
+            self.resultInterface.show_error(f"생성 불가: {msg}")
+            self.is_settings_dirty = False
+            return
+        if self.generation_state_manager.is_busy:
+            return  # 검사를 기다리는 동안 이미 생성이 시작됨
+
+        # 🎯 상태 전이: IDLE → PREPARING (이벤트가 UI 업데이트 트리거)
+        self.generation_state_manager.transition_to(
+            GenerationState.PREPARING,
+            "UI 준비 중..."
+        )
+        # 이후 처리는 _on_generation_state_changed에서
+
     def _on_generation_state_changed(self, old_state, new_state):
         """상태 전이 핸들러 - 각 상태별 UI 업데이트"""
         print(f"[MainWindow] State: {old_state.value} → {new_state.value}")
@@ -195,6 +327,7 @@ class MainWindow(FluentWindow):
         self.worker.finished.connect(self._on_generation_finished)
         self.worker.error.connect(self._on_generation_error)
         self.worker.progress.connect(self._on_generation_progress)
+        self.worker.results_found.connect(self._on_generation_results)
         self.worker.start()
         
         self.is_settings_dirty = False
@@ -204,6 +337,11 @@ class MainWindow(FluentWindow):
         if self.resultInterface:
             self.resultInterface.update_progress(msg)
         
+    def _on_generation_results(self, count):
+        """생성 중 찾은 결과를 바로 표시 (탐색은 계속 진행)"""
+        if self.resultInterface and self.generation_state_manager.is_busy:
+            self.resultInterface.load_schedule()
+        
     def _on_generation_finished(self, count):
         # [State Management] Mark current config as "Generated Basis" on SUCCESS
         if hasattr(self.configInterface, 'vm') and hasattr(self.configInterface.vm, 'mark_as_generated'):
@@ -215,6 +353,7 @@ class MainWindow(FluentWindow):
         
         # 🎯 상태 초기화
         self.generation_state_manager.reset()
+        self._apply_pending_catalog_changes()
             
         # 결과 탭이 아닐 경우 (예: 다른 탭에서 생성만 시켰을 때) 알림 혹은 이동
         # 하지만 _check_and_generate는 보통 결과 탭 진입 시 호출되므로 이미 결과 탭임.
@@ -227,3 +366,4 @@ class MainWindow(FluentWindow):
         
         # 🎯 상태 초기화
         self.generation_state_manager.reset()
+        self._apply_pending_catalog_changes()
@@ -0,0 +1,7 @@
+"""
+UI Models Package
+Qt 모델/뷰 구조의 모델 클래스들
+"""
+from .search_result_model import SearchResultModel
+
+__all__ = ['SearchResultModel']
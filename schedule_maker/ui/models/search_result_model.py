@@ -0,0 +1,161 @@
+"""
+검색 결과 테이블 모델
+카탈로그(CourseTable)의 행 번호 배열을 그대로 감싸며, 화면에 보이는 셀만 표시 문자열을 생성
+"""
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from ...core.course_table import CourseTable
+
+HEADERS = ['강의번호', '강의명', '학점', '교수', '시간']
+
+# 헤더 컬럼 → SearchViewModel 정렬 컬럼 ID
+SORT_COLUMNS = ['ID', 'Name', 'Credits', 'Professor', 'Time']
+
+
+class SearchResultModel(QAbstractTableModel):
+    """
+    검색 결과 모델
+
+    - 결과는 카탈로그 행 번호 배열 (QTableWidgetItem을 미리 만들지 않음)
+    - 상세 행(CourseDetailWidget 자리)은 모델 상태: 펼친 강의 바로 아래에 빈 행 하나를 끼워 넣음
+    """
+
+    def __init__(self, table: CourseTable, parent=None):
+        super().__init__(parent)
+        self._table = table
+        self._rows = np.zeros(0, dtype=np.int64)
+        self._expanded: Optional[int] = None  # 상세 행을 펼친 카탈로그 행 번호
+        self._expanded_pos = -1               # 그 강의의 결과 내 위치
+        self._time_texts = {}                 # 시간 패턴 코드 → 표시 문자열
+
+    # --- 결과 갱신 ---
+
+    def set_rows(self, rows: np.ndarray):
+        """검색 결과 교체 (펼친 강의가 새 결과에도 있으면 상세 행 유지)"""
+        self.beginResetModel()
+        self._rows = rows
+        self._expanded_pos = self._position_of(self._expanded)
+        if self._expanded_pos < 0:
+            self._expanded = None
+        self.endResetModel()
+
+    def set_table(self, table: CourseTable):
+        """카탈로그 교체 (재로드 등)"""
+        self.beginResetModel()
+        self._table = table
+        self._rows = np.zeros(0, dtype=np.int64)
+        self._expanded, self._expanded_pos = None, -1
+        self._time_texts = {}
+        self.endResetModel()
+
+    def _position_of(self, course_row: Optional[int]) -> int:
+        if course_row is None:
+            return -1
+        hits = np.flatnonzero(self._rows == course_row)
+        return int(hits[0]) if len(hits) else -1
+
+    @property
+    def table(self) -> CourseTable:
+        return self._table
+
+    @property
+    def result_count(self) -> int:
+        return len(self._rows)
+
+    # --- 상세 행 ---
+
+    @property
+    def detail_row(self) -> int:
+        """상세 행의 모델 행 번호 (없으면 -1)"""
+        return self._expanded_pos + 1 if self._expanded_pos >= 0 else -1
+
+    def is_detail_row(self, model_row: int) -> bool:
+        return model_row == self.detail_row
+
+    def course_row_at(self, model_row: int) -> Optional[int]:
+        """모델 행 → 카탈로그 행 번호 (상세 행이면 None)"""
+        detail = self.detail_row
+        if model_row == detail:
+            return None
+        if detail >= 0 and model_row > detail:
+            model_row -= 1
+        return int(self._rows[model_row])
+
+    def toggle_detail(self, model_row: int) -> int:
+        """
+        강의 행 클릭 시 상세 행 열기/닫기 (한 번에 하나만 열림)
+
+        Returns:
+            새로 열린 상세 행의 모델 행 번호 (닫혔으면 -1)
+        """
+        course_row = self.course_row_at(model_row)
+        if course_row is None:
+            return self.detail_row
+
+        was_open = course_row == self._expanded
+        self._collapse()
+        if was_open:
+            return -1
+
+        position = self._position_of(course_row)
+        self.beginInsertRows(QModelIndex(), position + 1, position + 1)
+        self._expanded, self._expanded_pos = course_row, position
+        self.endInsertRows()
+        return self.detail_row
+
+    def _collapse(self):
+        detail = self.detail_row
+        if detail < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), detail, detail)
+        self._expanded, self._expanded_pos = None, -1
+        self.endRemoveRows()
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) + (1 if self._expanded_pos >= 0 else 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignCenter)
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+
+        course_row = self.course_row_at(index.row())
+        if course_row is None:
+            return None  # 상세 행은 위젯이 표시
+        return self._cell_text(course_row, index.column())
+
+    def _cell_text(self, row: int, column: int) -> str:
+        table = self._table
+        if column == 0:
+            return table.course_ids[row]
+        if column == 1:
+            return table.names[table.name_codes[row]]
+        if column == 2:
+            return str(int(table.credits[row]))
+        if column == 3:
+            return table.professors[table.professor_codes[row]]
+
+        code = int(table.pattern_codes[row])
+        text = self._time_texts.get(code)
+        if text is None:
+            text = ", ".join(str(slot) for slot in table.patterns[code])
+            self._time_texts[code] = text
+        return text
@@ -3,5 +3,6 @@ UI Services Package
 UI 레이어의 서비스 구현체들
 """
 from .interaction_service import MainWindowInteractionService
+from .result_bridge import ResultBridge
 
-__all__ = ['MainWindowInteractionService']
+__all__ = ['MainWindowInteractionService', 'ResultBridge']
@@ -0,0 +1,84 @@
+"""
+결과 화면 QWebChannel 브리지
+앱 안의 결과 화면(HTML)이 ScheduleService의 ResultPages에서
+요약/페이지/핀 질의 결과를 필요할 때만 받아 가도록 연결 (전체 결과를 HTML에 넣지 않음)
+
+- 슬롯은 JSON 문자열을 반환 (JS에서 JSON.parse)
+- 결과가 바뀌면 resultsChanged(개수) 신호 → 화면이 요약부터 다시 요청
+- 같은 결과에 조합이 추가되면(생성 중 점진 표시) resultsAppended(개수) 신호
+  → 화면은 보던 조합/고정 조건을 유지한 채 개수와 강의 목록만 갱신
+"""
+import json
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class ResultBridge(QObject):
+    """QWebChannel 'results' 객체"""
+
+    resultsChanged = Signal(int)
+    resultsAppended = Signal(int)
+
+    def __init__(self, schedule_service=None, parent=None):
+        """
+        Args:
+            schedule_service: IScheduleService 구현체 (get_result_pages 제공)
+        """
+        super().__init__(parent)
+        self.schedule_service = schedule_service
+        self._pages = None
+
+    def has_results(self) -> bool:
+        return self.schedule_service is not None and len(self.schedule_service.get_result_pages()) > 0
+
+    def refresh(self):
+        """최신 결과를 화면에 알림 (같은 결과가 늘어난 경우는 추가 알림)"""
+        pages = self.schedule_service.get_result_pages() if self.schedule_service else None
+        count = len(pages) if pages is not None else 0
+        if pages is not None and pages is self._pages:
+            self.resultsAppended.emit(count)
+            return
+        self._pages = pages
+        self.resultsChanged.emit(count)
+
+    @staticmethod
+    def _dump(value) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    @staticmethod
+    def _pins(pins_json: str) -> dict:
+        try:
+            pins = json.loads(pins_json) if pins_json else {}
+        except ValueError:
+            return {}
+        return pins if isinstance(pins, dict) else {}
+
+    @Slot(result=str)
+    def summary(self) -> str:
+        if self._pages is None:
+            return self._dump({'count': 0, 'all_names': [], 'required_names': [], 'course_info': {}})
+        return self._dump(self._pages.summary())
+
+    @Slot(int, int, int, result=str)
+    def page(self, start: int, limit: int, known_sections: int) -> str:
+        if self._pages is None:
+            return self._dump({'start': start, 'section_base': known_sections, 'sections': [], 'schedules': []})
+        return self._dump(self._pages.page(start, limit, known_sections))
+
+    @Slot(str, result=str)
+    def match(self, pins_json: str) -> str:
+        if self._pages is None:
+            return '[]'
+        return self._dump(self._pages.match(self._pins(pins_json)))
+
+    @Slot(str, str, result=str)
+    def firstSlot(self, name: str, pins_json: str) -> str:
+        if self._pages is None:
+            return 'null'
+        return self._dump(self._pages.first_slot(name, self._pins(pins_json)))
+
+    @Slot(str, str, result=str)
+    def slotOptions(self, name: str, pins_json: str) -> str:
+        if self._pages is None:
+            return self._dump({'available': [], 'total': 0})
+        return self._dump(self._pages.slot_options(name, self._pins(pins_json)))
@@ -0,0 +1,80 @@
+"""
+디바운서 (Qt 비의존)
+마지막 요청 후 일정 시간 동안 새 요청이 없으면 한 번만 실행
+입력마다 스레드/타이머를 만들지 않고 대기 스레드 하나를 계속 재사용
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+
+class Debouncer:
+    """
+    마지막으로 예약한 함수만 delay_ms 후 대기 스레드에서 실행
+
+    사용 예: SearchViewModel이 타이핑 중 검색 요청을 모아서 실행
+    """
+
+    def __init__(self, delay_ms: int, name: str = 'debounce'):
+        self._delay = delay_ms / 1000
+        self._name = name
+        self._cond = threading.Condition()
+        self._task: Optional[Callable[[], None]] = None
+        self._deadline = 0.0
+        self._running = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def call(self, fn: Callable[[], None]):
+        """fn 예약 (이전에 예약된 함수는 버리고 대기 시간을 다시 시작)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._task = fn
+            self._deadline = time.monotonic() + self._delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def cancel(self):
+        """예약된 함수 취소 (이미 실행 중이면 그대로 끝남)"""
+        with self._cond:
+            self._task = None
+            self._cond.notify_all()
+
+    def wait(self, timeout: float = None) -> bool:
+        """예약된 함수가 실행을 마칠 때까지 대기 (테스트/종료용)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._task is None and not self._running, timeout)
+
+    def shutdown(self):
+        """예약 취소 및 대기 스레드 종료"""
+        with self._cond:
+            self._closed = True
+            self._task = None
+            self._cond.notify_all()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if self._task is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                fn, self._task = self._task, None
+                self._running = True
+            try:
+                fn()
+            except Exception as e:
+                print(f"[ERROR] {self._name} 실행 실패: {e}")
+            finally:
+                with self._cond:
+                    self._running = False
+                    self._cond.notify_all()
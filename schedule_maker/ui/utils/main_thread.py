@@ -0,0 +1,28 @@
+"""
+UI 스레드 디스패처
+백그라운드 스레드에서 만든 결과를 Qt 메인 스레드에서 반영하기 위한 유틸리티
+"""
+from typing import Callable
+
+from PySide6.QtCore import QObject, Signal, Qt
+
+
+class MainThreadDispatcher(QObject):
+    """
+    함수를 메인(UI) 스레드에서 실행
+    메인 스레드에서 생성해야 하며, 어느 스레드에서 호출해도 큐 연결로 전달됨
+
+    사용 예: SearchViewModel(..., dispatcher=MainThreadDispatcher(self))
+    """
+
+    _invoke = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._invoke.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    def __call__(self, fn: Callable[[], None]):
+        self._invoke.emit(fn)
+
+    def _run(self, fn: Callable[[], None]):
+        fn()
@@ -27,6 +27,10 @@ class BaseViewModel:
             self._observers[property_name] = []
         self._observers[property_name].append(callback)
         
+    def has_observers(self, property_name: str) -> bool:
+        """감시자가 등록된 속성인지 여부 (알림 값 생성 비용을 아낄 때 사용)"""
+        return bool(self._observers.get(property_name))
+        
     def notify(self, property_name: str, new_value: Any):
         """
         속성 변경 알림
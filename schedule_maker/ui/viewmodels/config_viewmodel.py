@@ -1,15 +1,20 @@
 """
 설정 탭 ViewModel (리팩토링 버전)
 단일 책임 원칙을 준수하도록 매니저 클래스들로 책임 분리
+
+설정이 바뀔 때마다 필수 강의 조합 가능 여부(FeasibilityChecker)를 검사하여
+'validation_status'로 알림 (executor가 있으면 백그라운드에서 검사, 결과는 dispatcher로 전달)
 """
-from typing import List, Any, Optional
+import threading
+from typing import List, Any, Optional, Callable
 from .base_viewmodel import BaseViewModel
 from .managers import CourseListManager, SettingsManager
+from ...services.feasibility import FeasibilityChecker
 
 try:
-    from ...core.config import CourseFilter
+    from ...core.config import CourseFilter, ScheduleConfig
 except ImportError:
-    from core.config import CourseFilter
+    from core.config import CourseFilter, ScheduleConfig
 
 
 class ConfigViewModel(BaseViewModel):
@@ -18,7 +23,20 @@ class ConfigViewModel(BaseViewModel):
     실제 로직은 CourseListManager와 SettingsManager에 위임
     """
     
-    def __init__(self, config_service, course_service=None):
+    def __init__(
+        self,
+        config_service,
+        course_service=None,
+        executor=None,
+        dispatcher: Callable[[Callable], None] = None
+    ):
+        """
+        Args:
+            config_service: IConfigService 구현체
+            course_service: ICourseService 구현체 (없으면 조합 가능 여부 검사 생략)
+            executor: 조합 가능 여부 검사 실행기 (None이면 호출한 스레드에서 바로 검사)
+            dispatcher: 함수를 UI 스레드에서 실행하는 함수 (None이면 즉시 호출)
+        """
         super().__init__()
         self.config_service = config_service
         self.course_service = course_service
@@ -27,6 +45,18 @@ class ConfigViewModel(BaseViewModel):
         self.course_manager = CourseListManager(config_service, course_service)
         self.settings_manager = SettingsManager(config_service)
         
+        # 필수 강의 조합 가능 여부 검사 (세대 번호로 오래된 결과는 버림)
+        self.feasibility_checker = FeasibilityChecker(course_service) if course_service else None
+        self._executor = executor
+        self._dispatch = dispatcher or (lambda fn: fn())
+        self._validation_generation = 0
+        self._validation_lock = threading.Lock()
+        self._pending_validation = None
+        # 마지막으로 전달된 검사 결과 (세대 번호가 현재와 같을 때만 유효)
+        self._feasibility_status = None
+        self._delivered_generation = 0
+        self._validation_waiters: List[Callable] = []
+        
         # 상태 변수 (UI 바인딩용)
         self._min_credits = "12"
         self._max_credits = "18"
@@ -37,9 +67,16 @@ class ConfigViewModel(BaseViewModel):
         
         # [State Management] Original Snapshot for Dirty Checking (Unsaved)
         self._original_config = None
+        self._original_fingerprint = None
         
-        # [State Management] Last Generated Snapshot for Stale Checking
+        # [State Management] Last Generated Snapshot for Stale Checking (설정 지문으로 비교)
         self._last_generated_config = None
+        self._last_generated_fingerprint = None
+
+    @staticmethod
+    def _fingerprint(config):
+        """설정 지문 (ScheduleConfig가 아니면 None)"""
+        return config.fingerprint() if isinstance(config, ScheduleConfig) else None
 
     def mark_as_generated(self):
         """현재 설정을 '생성됨' 상태로 마킹"""
@@ -49,23 +86,31 @@ class ConfigViewModel(BaseViewModel):
         else:
             import copy
             self._last_generated_config = copy.deepcopy(current)
+        self._last_generated_fingerprint = self._fingerprint(current)
         self._check_dirty()
 
     def _check_dirty(self):
-        """현재 설정 상태 확인 (Unsaved & Stale)"""
+        """현재 설정 상태 확인 (Unsaved & Stale, 설정 지문 비교)"""
         current_config = self.config_service.get_config()
         if not current_config:
             return
+        current_fingerprint = self._fingerprint(current_config)
             
         # 1. Check Unsaved (vs File)
         is_unsaved = False
         if self._original_config:
-             is_unsaved = (current_config != self._original_config)
+            if current_fingerprint is not None and self._original_fingerprint is not None:
+                is_unsaved = (current_fingerprint != self._original_fingerprint)
+            else:
+                is_unsaved = (current_config != self._original_config)
              
         # 2. Check Stale (vs Last Generated)
         is_stale = True # Default to true (if never generated)
         if self._last_generated_config:
-            is_stale = (current_config != self._last_generated_config)
+            if current_fingerprint is not None and self._last_generated_fingerprint is not None:
+                is_stale = (current_fingerprint != self._last_generated_fingerprint)
+            else:
+                is_stale = (current_config != self._last_generated_config)
         
         # Notify
         self.notify('is_dirty_changed', is_unsaved)       # For "Save" status
@@ -132,22 +177,102 @@ class ConfigViewModel(BaseViewModel):
         if not config: return
             
         req_filters = config.required_filters
-        # [Fix] Use getter method
-        all_courses = self.course_service.get_all_courses() if self.course_service else []
         
         for f in req_filters:
              # Find matching course (Assume 1st match for constraints check)
-             match = next((c for c in all_courses if f.matches(c)), None)
+             match = self._first_match(f)
              if match:
                  total_required_credits += match.credits
         
         if total_required_credits > max_c:
              self.notify('validation_status', (False, f"필수 강의 학점({total_required_credits})이 최대 학점({max_c})을 초과합니다."))
              return
+        
+        # 4. 필수 강의 조합 가능 여부 (시간 충돌 / 제외 시간대)
+        # 강의 데이터 로드 전에는 모든 필수 강의가 '찾을 수 없음'이 되므로 보류
+        # (로드가 끝나면 MainWindow.refresh_tabs → load_data에서 다시 검사)
+        if self.feasibility_checker and self.course_service.is_loaded():
+            self._check_feasibility(config.clone() if hasattr(config, 'clone') else config)
+            return
+        self._cancel_feasibility()
              
         # All Checks Passed
         self.notify('validation_status', (True, ""))
 
+    def _check_feasibility(self, config):
+        """조합 가능 여부 검사 요청 (더 새로운 요청이 오면 이전 결과는 버림)"""
+        with self._validation_lock:
+            self._validation_generation += 1
+            generation = self._validation_generation
+        
+        if self._executor is None:
+            self._deliver_validation(generation, self.feasibility_checker.check(config).as_status())
+            return
+        self._pending_validation = self._executor.submit(self._run_feasibility, generation, config)
+
+    def _cancel_feasibility(self):
+        """진행 중인 조합 가능 여부 검사 결과 버림"""
+        with self._validation_lock:
+            self._validation_generation += 1
+            self._delivered_generation = self._validation_generation
+        self._feasibility_status = None
+        self._flush_validation_waiters()
+
+    def _run_feasibility(self, generation: int, config):
+        """실행기 스레드에서 검사 후 UI 스레드로 결과 전달"""
+        if generation != self._validation_generation:
+            return
+        try:
+            status = self.feasibility_checker.check(config).as_status()
+        except Exception as e:
+            print(f"[ERROR] 조합 가능 여부 검사 실패: {e}")
+            status = None  # 검사 실패는 생성을 막지 않음 (대기 중인 요청만 풀어줌)
+        self._dispatch(lambda: self._deliver_validation(generation, status))
+
+    def _deliver_validation(self, generation: int, status):
+        if generation != self._validation_generation:
+            return
+        self._feasibility_status = status
+        self._delivered_generation = generation
+        if status is not None:
+            self.notify('validation_status', status)
+        self._flush_validation_waiters()
+
+    @property
+    def validation_pending(self) -> bool:
+        """백그라운드 조합 가능 여부 검사 결과를 기다리는 중인지"""
+        return self._delivered_generation != self._validation_generation
+
+    def request_validation_status(self, callback: Callable[[tuple], None]):
+        """
+        생성 전 유효성 확인 (UI 스레드를 막지 않음)
+        백그라운드 검사가 진행 중이면 결과가 전달된 뒤 callback((is_valid, msg)) 호출
+        """
+        if self.validation_pending:
+            self._validation_waiters.append(callback)
+        else:
+            callback(self.get_validation_status())
+
+    def _flush_validation_waiters(self):
+        if self.validation_pending or not self._validation_waiters:
+            return
+        waiters, self._validation_waiters = self._validation_waiters, []
+        status = self.get_validation_status()
+        for callback in waiters:
+            callback(status)
+
+    def wait_for_validation(self, timeout: float = None):
+        """진행 중인 조합 가능 여부 검사 완료 대기 (테스트/종료용)"""
+        if self._pending_validation is not None:
+            self._pending_validation.result(timeout)
+
+    def _first_match(self, course_filter):
+        """필터에 매칭되는 첫 강의 (CourseService의 인덱스/캐시 사용)"""
+        if not self.course_service:
+            return None
+        matches = self.course_service.resolve_filter(course_filter)
+        return matches[0] if matches else None
+
     def get_validation_status(self):
         """외부에서 유효성 상태 확인용"""
         try:
@@ -161,14 +286,20 @@ class ConfigViewModel(BaseViewModel):
         config = self.config_service.get_config()
         if config:
             req = config.required_filters
-            # [Fix] Use getter method
-            courses = self.course_service.get_all_courses() if self.course_service else []
             for f in req:
-                m = next((c for c in courses if f.matches(c)), None)
+                m = self._first_match(f)
                 if m: total += m.credits
         
         if total > max_c: return (False, f"필수 강의 학점({total}) 초과")
         
+        # 조합 가능 여부: 백그라운드 검사를 쓰면 마지막으로 전달된 결과
+        # (UI 스레드에서 탐색하지 않음, 진행 중이면 request_validation_status로 기다림)
+        if config and self.feasibility_checker and self.course_service.is_loaded():
+            if self._executor is None:
+                return self.feasibility_checker.check(config).as_status()
+            if not self.validation_pending and self._feasibility_status is not None:
+                return self._feasibility_status
+        
         return (True, "")
 
     # --- Properties ---
@@ -234,6 +365,7 @@ class ConfigViewModel(BaseViewModel):
             # Fallback for mock objects or errors
             import copy
             self._original_config = copy.deepcopy(config)
+        self._original_fingerprint = self._fingerprint(config)
             
         self._excluded_times_list = self.settings_manager.get_excluded_times()
         self.notify('excluded_times', self._excluded_times_list)
@@ -296,6 +428,7 @@ class ConfigViewModel(BaseViewModel):
             self.refresh_ui()
             self.notify('config_changed', None)
             self._check_dirty()
+            self._validate_configuration()
             return True
         else:
             self.show_error("이동 오류", "강의 이동에 실패했습니다.")
@@ -312,7 +445,17 @@ class ConfigViewModel(BaseViewModel):
             self.show_error("순서 변경 오류", "순서 변경에 실패했습니다.")
             return False
             
-    # ... (rotate currently unsed)
+    def rotate_course(self, list_type: str, index: int):
+        """강의를 함께 들을 수 있는 다음 분반으로 변경"""
+        if self.course_manager.rotate_course_slot(list_type, index):
+            self.refresh_ui()
+            self.notify('config_changed', None)
+            self._check_dirty()
+            self._validate_configuration()
+            return True
+        else:
+            self.show_error("분반 변경", "제외 시간이나 다른 필수 강의와 겹치지 않는 다른 분반이 없습니다.")
+            return False
     
     # --- 설정 관리 (SettingsManager에 위임) ---
     
@@ -322,6 +465,7 @@ class ConfigViewModel(BaseViewModel):
             self.refresh_ui()
             self.notify('config_changed', None)
             self._check_dirty()
+            self._validate_configuration()
         else:
             self.show_error("오류", "시간대 추가 실패")
     
@@ -331,6 +475,7 @@ class ConfigViewModel(BaseViewModel):
             self.refresh_ui()
             self.notify('config_changed', None)
             self._check_dirty()
+            self._validate_configuration()
         else:
             self.show_error("오류", "시간대 삭제 실패")
     
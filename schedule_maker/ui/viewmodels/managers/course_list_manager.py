@@ -36,16 +36,12 @@ class CourseListManager:
                 if not name:
                     return False
                 
-                # 검색 쿼리: 이름 (교수명은 옵션)
-                candidates = self.course_service.search_courses(query=name)
+                # 시간표 생성기와 같은 기준(CourseFilter)으로 매칭 강의 확인
+                candidates = self.course_service.resolve_filter(
+                    CourseFilter(name=name, professor=prof if prof else None)
+                )
                 
-                # 교수명이 지정된 경우, 해당 교수의 강의가 있는지 확인
-                if prof:
-                    has_match = any(c.professor == prof for c in candidates)
-                    if not has_match:
-                        return False # 해당 교수의 강의 없음
-                
-                # 검색 결과가 아예 없으면 실패
+                # 매칭 강의가 없으면 실패 (교수명이 지정되면 해당 교수 강의만)
                 if not candidates:
                     return False
 
@@ -126,7 +122,10 @@ class CourseListManager:
         return False
     
     def rotate_course_slot(self, list_type: str, index: int) -> bool:
-        """강의의 다른 시간대(분반)로 변경"""
+        """
+        강의의 다른 시간대(분반)로 변경
+        제외 시간/다른 필수 강의와 겹치는 분반은 건너뜀 (함께 들을 수 있는 분반만 순환)
+        """
         if not self.course_service:
             return False
         
@@ -136,24 +135,40 @@ class CourseListManager:
         if 0 <= index < len(target_list):
             filter_item = target_list[index]
             
-            # 이름으로 모든 분반 검색
-            candidates = self.course_service.search_courses(query=filter_item.name)
+            # 현재 분반 (강좌번호가 없으면 필터에 매칭되는 강의명들 기준, 예: '자료구조' → '자료구조및실습')
+            current = self.course_service.get_course_by_id(filter_item.course_id) if filter_item.course_id else None
+            if current:
+                names = [current.name]
+            else:
+                names = list(dict.fromkeys(c.name for c in self.course_service.resolve_filter(filter_item)))
+            if not names:
+                return False
+            
+            # 그 강의명들의 분반 중 현재 설정과 함께 들을 수 있는 분반 (카탈로그 순서)
+            candidates = sorted(
+                (course for name in names
+                 for course in self.course_service.find_alternative_sections(name, config, ignore=filter_item)),
+                key=lambda course: course.row
+            )
             if not candidates:
                 return False
             
-            # 현재 ID와 일치하는 인덱스 찾기
-            current_idx = -1
-            for i, c in enumerate(candidates):
-                if c.course_id == filter_item.course_id:
-                    current_idx = i
-                    break
+            # 현재 분반 다음 위치의 분반으로 순환 (현재 분반이 후보가 아니어도 카탈로그 순서 기준)
+            table = self.course_service.get_course_table()
+            current_row = table.row_of(current.course_id) if current else None
+            next_course = candidates[0]
+            if current_row is not None:
+                for course in candidates:
+                    if course.row > current_row:
+                        next_course = course
+                        break
             
-            # 다음 분반으로 순환
-            next_idx = (current_idx + 1) % len(candidates)
-            next_course = candidates[next_idx]
+            if current is not None and next_course.course_id == current.course_id:
+                return False  # 바꿀 수 있는 다른 분반 없음
             
             # 필터 업데이트
             filter_item.course_id = next_course.course_id
+            filter_item.name = next_course.name
             filter_item.professor = next_course.professor
             
             # [Fix] Update Service with modified list (items are changed in place in target_list)
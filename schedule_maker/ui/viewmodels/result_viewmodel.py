@@ -0,0 +1,291 @@
+"""
+결과 탭 ViewModel (네이티브 시간표 화면)
+ScheduleService의 결과 화면 데이터(ResultPages)를 직접 읽어 한 조합씩 표시
+
+HTML 결과 화면(visualizer.py의 JS)과 같은 규칙
+- 이전/다음: 순환 (고정 조건이 있으면 조건을 만족하는 조합 안에서 순환)
+- 강의 클릭: 고정되지 않은 강의는 현재 시간대로 고정 (현재 조합에 없으면 조건 안의 첫 시간대),
+  고정된 강의는 나머지 고정 조건과 함께 가능한 다음 시간대로 이동
+- 결과가 늘어나면(생성 중 점진 표시) 보던 조합과 고정 조건 유지
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .base_viewmodel import BaseViewModel
+
+# 강의 목록 정렬 순서 (HTML 화면의 CSS order와 같음)
+ORDER_REQUIRED = -1000
+ORDER_PINNED = -500
+ORDER_ACTIVE = 0
+ORDER_STAY_TOP = 500
+ORDER_INACTIVE = 1000
+
+
+@dataclass
+class TimetableBlock:
+    """시간표에 그릴 강의 블록 하나"""
+    name: str
+    professor: str
+    day: str
+    start_time: str
+    end_time: str
+
+
+@dataclass
+class CourseEntry:
+    """강의 목록 항목"""
+    name: str
+    professor: str
+    credits: object          # 결과에 없는 강의는 '-'
+    required: bool
+    active: bool             # 현재 조합에 포함
+    pinned: bool
+    slot: Optional[str]      # 현재 조합에서의 시간대 '요일 시작' (없으면 None)
+    order: int
+
+
+@dataclass
+class ResultView:
+    """현재 표시할 조합"""
+    index: int               # 전체 결과 안의 조합 번호
+    position: int            # 화면에 표시할 번호 (1부터, 고정 조건이 있으면 조건 안의 위치)
+    total: int               # 전체 (또는 고정 조건을 만족하는) 조합 수
+    pinned_count: int
+    credits: int
+    has_random_filled: bool
+    blocks: List[TimetableBlock] = field(default_factory=list)
+    courses: List[CourseEntry] = field(default_factory=list)
+
+
+def _slot_key(section: list) -> Optional[str]:
+    slots = section[3]
+    return f"{slots[0][0]} {slots[0][1]}" if slots else None
+
+
+class ResultViewModel(BaseViewModel):
+    """
+    결과 탭 비즈니스 로직 (Qt 비의존)
+
+    알림: 'view' (ResultView, 결과가 없으면 None)
+    """
+
+    def __init__(self, schedule_service):
+        """
+        Args:
+            schedule_service: IScheduleService 구현체 (get_result_pages 제공)
+        """
+        super().__init__()
+        self.schedule_service = schedule_service
+        self._pages = None
+        self._summary: Optional[dict] = None  # 강의 목록/대표 분반 (refresh에서만 갱신)
+        self._index = 0
+        self._pins: Dict[str, str] = {}  # 강의명 → 시간대 (삽입 순서 = 고정 순서)
+        self._filtered: List[int] = []
+        self._position = -1
+        self._last_interacted: Optional[str] = None
+        self._fill_notice_shown = False
+        self._view: Optional[ResultView] = None
+
+    # --- 상태 ---
+
+    @property
+    def count(self) -> int:
+        return len(self._pages) if self._pages is not None else 0
+
+    @property
+    def pins(self) -> Dict[str, str]:
+        return dict(self._pins)
+
+    @property
+    def view(self) -> Optional[ResultView]:
+        return self._view
+
+    def _filter_mode(self) -> bool:
+        return bool(self._filtered) and self._position >= 0
+
+    # --- 명령 ---
+
+    def refresh(self):
+        """최신 결과 반영 (같은 결과가 늘어난 경우 위치/고정 조건 유지)"""
+        pages = self.schedule_service.get_result_pages()
+        if pages is self._pages:
+            if self._pins:
+                self._filtered = pages.match(self._pins)
+        else:
+            self._pages = pages
+            self._pins.clear()
+            self._filtered = []
+            self._position = -1
+            self._last_interacted = None
+            self._index = 0
+        self._summary = pages.summary()
+        self._render()
+
+    def next_schedule(self):
+        if self._filter_mode():
+            self._position = (self._position + 1) % len(self._filtered)
+            self._show(self._filtered[self._position])
+        elif self.count:
+            self._last_interacted = None
+            self._show((self._index + 1) % self.count)
+
+    def prev_schedule(self):
+        if self._filter_mode():
+            self._position = (self._position - 1) % len(self._filtered)
+            self._show(self._filtered[self._position])
+        elif self.count:
+            self._last_interacted = None
+            self._show((self._index - 1) % self.count)
+
+    def clear_pins(self):
+        """고정 조건 모두 해제 (현재 조합 유지)"""
+        if not self._pins and not self._filtered:
+            return
+        self._pins.clear()
+        self._filtered = []
+        self._position = -1
+        self._last_interacted = None
+        self._render()
+
+    def unpin(self, name: str):
+        """강의 고정 해제 (남은 조건으로 다시 필터)"""
+        if name not in self._pins:
+            return
+        del self._pins[name]
+        if self._pins:
+            self._apply_filter(self._pages.match(self._pins))
+        else:
+            self._filtered = []
+            self._position = -1
+            self._render()
+
+    def select_course(self, name: str):
+        """
+        강의 클릭
+        고정되지 않은 강의는 고정, 고정된 강의는 다음 시간대로 이동
+        """
+        if not self.count:
+            return
+        self._last_interacted = name
+
+        if name not in self._pins:
+            target = self._current_slot(name)
+            if target is None:
+                # 현재 조합에 없는 강의: 조건 안에서 가장 앞 조합에 나오는 시간대
+                target = self._pages.first_slot(name, self._pins)
+                if target is None:
+                    self.show_error(
+                        "유일한 시간대입니다.",
+                        "현재 설정된 조건(필수/고정 강의)과 충돌 없이 이동 가능한 다른 분반이 없습니다."
+                    )
+                    self._render()
+                    return
+            self._pins[name] = target
+            indices = self._pages.match(self._pins)
+            if not indices:
+                del self._pins[name]
+                self.show_error("조건 불충족", "선택하신 조건에 맞는 시간표 조합이 없습니다.")
+                self._render()
+                return
+            self._apply_filter(indices)
+            return
+
+        # 고정된 강의: 나머지 조건과 함께 가능한 다음 시간대로
+        others = {k: v for k, v in self._pins.items() if k != name}
+        options = self._pages.slot_options(name, others)
+        available = options['available']
+        if len(available) <= 1:
+            if options['total'] <= 1:
+                self.show_error("유일한 시간대입니다.", "이 강의는 개설된 분반이 하나뿐이라 이동할 수 없습니다.")
+            else:
+                self.show_error(
+                    "이동 불가 (시간 중복)",
+                    "다른 분반이 존재하지만, 현재 설정된 조건(필수/고정 강의)과 시간이 겹쳐 이동할 수 없습니다."
+                )
+            self._render()
+            return
+
+        current = self._pins[name]
+        next_index = (available.index(current) + 1) % len(available) if current in available else 0
+        self._pins[name] = available[next_index]
+        indices = self._pages.match(self._pins)
+        if not indices:
+            self._pins[name] = current
+            self.show_error("시스템 오류", "해당 시간표를 찾을 수 없습니다.")
+            self._render()
+            return
+        self._apply_filter(indices)
+
+    # --- 내부 ---
+
+    def _apply_filter(self, indices: List[int]):
+        self._filtered = indices
+        self._position = 0
+        self._show(indices[0])
+
+    def _current_slot(self, name: str) -> Optional[str]:
+        sections, _, _ = self._pages.schedule(self._index)
+        for section in sections:
+            if section[0] == name:
+                return _slot_key(section)
+        return None
+
+    def _show(self, index: int):
+        self._index = index
+        self._render()
+
+    def _render(self):
+        if not self.count:
+            self._view = None
+            self.notify('view', None)
+            return
+        self._index = min(self._index, self.count - 1)
+        sections, credits, filled = self._pages.schedule(self._index)
+
+        if self._filter_mode():
+            position, total = self._position + 1, len(self._filtered)
+        else:
+            position, total = self._index + 1, self.count
+
+        blocks = [
+            TimetableBlock(name, professor, day, start, end)
+            for name, _, professor, slots in sections
+            for day, start, end in slots
+        ]
+
+        summary = self._summary
+        course_info = summary['course_info']
+        required = set(summary['required_names'])
+        active = {section[0]: section for section in sections}
+        pin_order = list(self._pins)
+        courses = []
+        for name in summary['all_names']:
+            section = active.get(name) or course_info.get(name)
+            professor, credits_text = (section[2], section[1]) if section else ('-', '-')
+            is_active, pinned, is_required = name in active, name in self._pins, name in required
+            if is_required:
+                order = ORDER_REQUIRED
+            elif pinned:
+                order = ORDER_PINNED + pin_order.index(name)
+            elif is_active:
+                order = ORDER_ACTIVE
+            elif name == self._last_interacted:
+                order = ORDER_STAY_TOP
+            else:
+                order = ORDER_INACTIVE
+            courses.append(CourseEntry(
+                name, professor, credits_text, is_required, is_active, pinned,
+                _slot_key(active[name]) if is_active else None, order
+            ))
+        courses.sort(key=lambda entry: entry.order)  # 같은 순서 안에서는 이름순 유지
+
+        self._view = ResultView(self._index, position, total, len(self._pins), credits, filled, blocks, courses)
+        self.notify('view', self._view)
+
+        # 랜덤 채우기 안내 (최초 1회)
+        if filled and not self._fill_notice_shown:
+            self._fill_notice_shown = True
+            self.show_info(
+                "🎲 무작위 채우기 발동",
+                "선택한 강의만으로는 최소 학점을 채울 수 없어, 공강 시간에 '전학년' 대상 강의가 자동으로 추가되었습니다."
+            )
@@ -1,67 +1,234 @@
 """
 검색 탭 ViewModel
 강의 검색, 필터링, 정렬 로직 관리
+
+타이핑 중 검색은 search_async()로 백그라운드 실행기에서 처리
+- 디바운스: 마지막 입력 후 일정 시간이 지나야 검색 시작 (대기 스레드 하나를 재사용)
+- 세대 번호: 더 새로운 요청이 들어오면 이전 검색 결과는 버림 (진행 중이면 취소)
+- 결과 반영(notify)은 dispatcher를 통해 UI 스레드에서 수행
 """
-from typing import List, Any, Optional, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Any, Optional, Dict, Callable
+
+import numpy as np
+
 from .base_viewmodel import BaseViewModel
+from ..utils.debouncer import Debouncer
+from ...core.constants import SearchMode
+from ...core.course_query import CourseQuery
+from ...core.exceptions import SearchCancelled
+
+# 마지막 입력 후 검색 시작까지 대기 시간 (ms)
+SEARCH_DEBOUNCE_MS = 150
+
+# 정렬 컬럼 ID → CourseTable.sort_ranks 키
+SORT_KEY_MAP = {
+    'ID': 'course_id',
+    'Name': 'name',
+    'Credits': 'credits',
+    'Professor': 'professor',
+    'Time': 'time',
+}
 
 class SearchViewModel(BaseViewModel):
     """
     SearchTab의 비즈니스 로직을 담당
+    
+    검색 결과는 카탈로그 행 번호 배열로 보관하며 'result_rows'로 알림
+    (뷰 객체/표시 문자열은 화면에 보이는 행만 모델에서 생성)
     """
     
-    def __init__(self, course_service, config_service=None):
+    def __init__(
+        self,
+        course_service,
+        config_service=None,
+        executor=None,
+        dispatcher: Callable[[Callable], None] = None,
+        debounce_ms: int = SEARCH_DEBOUNCE_MS
+    ):
+        """
+        Args:
+            course_service: ICourseService 구현체
+            config_service: IConfigService 구현체
+            executor: 비동기 검색 실행기 (None이면 전용 스레드 1개)
+            dispatcher: 함수를 UI 스레드에서 실행하는 함수 (None이면 즉시 호출)
+            debounce_ms: 디바운스 대기 시간
+        """
         super().__init__()
         self.course_service = course_service
         self.config_service = config_service
         
+        # 비동기 검색
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='search')
+        self._dispatch = dispatcher or (lambda fn: fn())
+        self._debounce_ms = debounce_ms
+        self._debouncer = Debouncer(debounce_ms, name='search-debounce')
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._pending: Optional[Future] = None
+        
         # 상태 변수
-        self._search_results = []
+        self._result_rows = np.zeros(0, dtype=np.int64)  # 현재 표시 순서의 카탈로그 행 번호
         self._search_query = ""
         self._search_by_name = True
         self._search_by_prof = True
+        self._search_mode = SearchMode.EXACT
         self._sort_column = None
         self._sort_reverse = False
         self._last_sort_col = None
         self._sort_state = 0 # 0: 기본, 1: 오름차순, 2: 내림차순
+        self._facet_filters: Dict[str, Any] = {}  # CourseQuery 필드 → 값 (학점/요일만/전학년)
+        self._facets: Dict[str, Dict] = {}
         
     @property
-    def results(self): return self._search_results
+    def results(self):
+        """검색 결과 강의 목록 (표시 순서)"""
+        return self.course_service.get_course_table().views(self._result_rows)
+    
+    @property
+    def result_rows(self) -> np.ndarray: return self._result_rows
     
     @property
     def query(self): return self._search_query
     @query.setter
     def query(self, value): self._search_query = value
     
+    @property
+    def search_mode(self): return self._search_mode
+    
+    @property
+    def facets(self) -> Dict[str, Dict]:
+        """현재 검색어 기준 조건별 결과 개수 (CourseQueryEngine 패싯)"""
+        return self._facets
+    
     # --- Actions ---
     
     def perform_search(self):
-        """검색 수행"""
+        """검색 수행 (동기, 진행 중인 비동기 검색은 무효화)"""
+        if not self.course_service: return
+        
+        self._next_generation()
+        self._result_rows, facets = self._search(self._search_params())
+        self._notify_results(facets)
+
+    def search_async(self, debounce: bool = True):
+        """
+        검색 요청 (백그라운드 실행, UI 스레드를 막지 않음)
+        
+        Args:
+            debounce: True면 마지막 요청 후 debounce_ms 동안 추가 입력이 없을 때 시작
+        """
         if not self.course_service: return
         
-        query = self._search_query.strip()
-        search_by = []
-        if self._search_by_name: search_by.append('name')
-        if self._search_by_prof: search_by.append('professor')
+        generation = self._next_generation()
+        params = self._search_params()
         
-        # CourseService.search_courses()에 올바른 타입으로 전달
-        results = self.course_service.search_courses(
-            query=query,
-            search_by_name=self._search_by_name,
-            search_by_professor=self._search_by_prof
+        if debounce and self._debounce_ms > 0:
+            self._debouncer.call(lambda: self._submit(generation, params))
+        else:
+            self._debouncer.cancel()
+            self._submit(generation, params)
+
+    def _next_generation(self) -> int:
+        with self._generation_lock:
+            self._generation += 1
+            return self._generation
+
+    def _is_stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _search_params(self) -> Dict[str, Any]:
+        """요청 시점의 검색 조건 (실행 스레드에서 상태가 바뀌어도 영향 없도록 복사)"""
+        return {
+            'query': self._search_query.strip(),
+            'search_by_name': self._search_by_name,
+            'search_by_professor': self._search_by_prof,
+            'mode': self._search_mode,
+            'sort_column': self._sort_column,
+            'sort_reverse': self._sort_reverse,
+            'facet_filters': dict(self._facet_filters),
+            'with_facets': self.has_observers('facets'),
+        }
+
+    def _search(self, params: Dict[str, Any], cancel_check=None):
+        """검색 → 패싯 조건 적용 → 정렬, (행 번호, 패싯 또는 None) 반환"""
+        # CourseService.search_rows()에 올바른 타입으로 전달
+        rows = self.course_service.search_rows(
+            query=params['query'],
+            search_by_name=params['search_by_name'],
+            search_by_professor=params['search_by_professor'],
+            mode=params['mode'],
+            cancel_check=cancel_check
         )
-        self._search_results = results
+        
+        # 학점/요일/전학년 조건은 비트맵 질의로 결과를 좁힘 (검색 결과 순서 유지)
+        facets = None
+        if params['facet_filters'] or params['with_facets']:
+            result = self.course_service.query_courses(
+                CourseQuery(rows=rows, **params['facet_filters']),
+                with_facets=params['with_facets']
+            )
+            rows = result.rows
+            if params['with_facets']:
+                facets = result.facets
         
         # 정렬 상태가 있으면 유지
-        if self._sort_column:
-            self._apply_sort()
-            
-        self.notify('results', self._get_formatted_results())
+        if params['sort_column']:
+            rows = self._sorted(rows, params['sort_column'], params['sort_reverse'])
+        return rows, facets
+
+    def _submit(self, generation: int, params: Dict[str, Any]):
+        if self._is_stale(generation):
+            return
+        self._pending = self._executor.submit(self._run_search, generation, params)
+
+    def _run_search(self, generation: int, params: Dict[str, Any]):
+        """실행기 스레드에서 검색 후 UI 스레드로 결과 전달"""
+        try:
+            rows, facets = self._search(params, cancel_check=lambda: self._is_stale(generation))
+        except SearchCancelled:
+            return
+        except Exception as e:
+            print(f"[ERROR] 검색 실패: {e}")
+            return
+        
+        if self._is_stale(generation):
+            return
+        self._dispatch(lambda: self._deliver(generation, rows, facets))
+
+    def _deliver(self, generation: int, rows: np.ndarray, facets=None):
+        """UI 스레드에서 결과 반영 (그 사이 새 요청이 있었으면 버림)"""
+        if self._is_stale(generation):
+            return
+        self._result_rows = rows
+        self._notify_results(facets)
+
+    def _notify_results(self, facets=None):
+        """결과 알림 ('result_rows': 행 번호 배열, 'results': 표시용 튜플 - 구독자가 있을 때만 생성)"""
+        if facets is not None:
+            self._facets = facets
+            self.notify('facets', facets)
+        self.notify('result_rows', self._result_rows)
+        if self.has_observers('results'):
+            self.notify('results', self._get_formatted_results())
+
+    def wait_for_search(self, timeout: float = None):
+        """진행 중인 비동기 검색 완료 대기 (테스트/종료용)"""
+        self._debouncer.wait(timeout)
+        if self._pending is not None:
+            self._pending.result(timeout)
+
+    def shutdown(self):
+        """비동기 검색 중단 및 실행기 종료"""
+        self._next_generation()
+        self._debouncer.shutdown()
+        self._executor.shutdown(wait=False)
 
     def _get_formatted_results(self):
         """Treeview용 데이터 변환"""
         formatted = []
-        for c in self._search_results:
+        for c in self.results:
             formatted.append((
                 c.course_id,
                 c.name,
@@ -76,6 +243,27 @@ class SearchViewModel(BaseViewModel):
         self._search_by_name = by_name
         self._search_by_prof = by_prof
 
+    def set_search_mode(self, mode: SearchMode):
+        """검색 방식 설정 (일반 / 초성 / 오타 허용)"""
+        self._search_mode = SearchMode(mode)
+
+    def set_facet_filter(self, name: str, value):
+        """
+        패싯 조건 설정 (None이면 해제)
+        
+        Args:
+            name: CourseQuery 필드 이름 ('credits', 'only_days', 'all_grade' 등)
+            value: 조건 값
+        """
+        if value is None or value == set():
+            self._facet_filters.pop(name, None)
+        else:
+            self._facet_filters[name] = value
+
+    def clear_facet_filters(self):
+        """패싯 조건 모두 해제"""
+        self._facet_filters.clear()
+
     def toggle_sort(self, column_id: str):
         """정렬 토글 (3단계)"""
         # 0 -> 1 (▲) -> 2 (▼) -> 0
@@ -85,39 +273,24 @@ class SearchViewModel(BaseViewModel):
             self._last_sort_col = column_id
             self._sort_state = 1
             
-        self._sort_column = column_id
-        
         if self._sort_state == 0:
-            # 원본 순서로 복구 (재검색 시뮬레이션)
+            # 원본 순서로 복구 (재검색)
+            self._sort_column = None
             self.perform_search()
         else:
+            self._sort_column = column_id
             self._sort_reverse = (self._sort_state == 2)
-            self._apply_sort()
-            self.notify('results', self._get_formatted_results())
+            self._result_rows = self._sorted(self._result_rows, self._sort_column, self._sort_reverse)
+            self._notify_results()
             
         # UI에 화살표 표시를 위한 알림
         self.notify('sort_changed', (column_id, self._sort_state))
 
-    def _apply_sort(self):
-        """현재 상태로 정렬 적용"""
-        col_map = {
-            'ID': 'course_id',
-            'Name': 'name',
-            'Credits': 'credits',
-            'Professor': 'professor',
-            'Time': 'time_slots'
-        }
-        
-        attr = col_map.get(self._sort_column)
-        if not attr: return
-        
-        def sort_key(course):
-            val = getattr(course, attr)
-            if attr == 'credits': return int(val)
-            if attr == 'time_slots': return str(val[0]) if val else ""
-            return str(val)
-            
-        self._search_results.sort(key=sort_key, reverse=self._sort_reverse)
+    def _sorted(self, rows: np.ndarray, sort_column: str, reverse: bool) -> np.ndarray:
+        """미리 계산된 순위 배열로 행 번호 정렬 (강의 객체를 만들지 않음)"""
+        key = SORT_KEY_MAP.get(sort_column)
+        if not key: return rows
+        return self.course_service.get_course_table().sort_rows(rows, key, reverse)
 
     def add_to_config(self, course_id: str, list_type: str, mode: str = 'fixed'):
         """
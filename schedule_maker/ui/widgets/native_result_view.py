@@ -0,0 +1,107 @@
+"""
+네이티브 결과 화면
+시간표 위젯 + 이전/다음 + 강의 목록 (클릭: 고정/분반 순환, 우클릭: 고정 해제)
+상태와 규칙은 ResultViewModel이 담당하고, 이 위젯은 'view' 알림을 그리기만 함
+"""
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QListWidgetItem
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from qfluentwidgets import (
+    PushButton, ListWidget, BodyLabel, StrongBodyLabel, FluentIcon as FIF, isDarkTheme
+)
+
+from .timetable_widget import TimetableWidget
+
+
+class NativeResultView(QWidget):
+    """ResultViewModel 표시"""
+
+    def __init__(self, vm, parent=None):
+        super().__init__(parent)
+        self.vm = vm
+        self.setFocusPolicy(Qt.StrongFocus)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 12)
+
+        # 상단: 이전/다음, 위치, 학점
+        bar = QHBoxLayout()
+        self.prevBtn = PushButton("이전", self)
+        self.prevBtn.setIcon(FIF.LEFT_ARROW)
+        self.nextBtn = PushButton("다음", self)
+        self.nextBtn.setIcon(FIF.RIGHT_ARROW)
+        self.positionLabel = StrongBodyLabel("0 / 0", self)
+        self.creditsLabel = BodyLabel("", self)
+        self.clearPinsBtn = PushButton("고정 해제", self)
+        self.clearPinsBtn.setIcon(FIF.PIN)
+        self.prevBtn.clicked.connect(self.vm.prev_schedule)
+        self.nextBtn.clicked.connect(self.vm.next_schedule)
+        self.clearPinsBtn.clicked.connect(self.vm.clear_pins)
+        bar.addWidget(self.prevBtn)
+        bar.addWidget(self.positionLabel)
+        bar.addWidget(self.nextBtn)
+        bar.addSpacing(20)
+        bar.addWidget(self.creditsLabel)
+        bar.addStretch(1)
+        bar.addWidget(self.clearPinsBtn)
+        layout.addLayout(bar)
+
+        # 본문: 시간표 + 강의 목록
+        body = QHBoxLayout()
+        self.timetable = TimetableWidget(self)
+        self.courseList = ListWidget(self)
+        self.courseList.setFixedWidth(260)
+        self.courseList.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.courseList.itemClicked.connect(lambda item: self.vm.select_course(item.data(Qt.UserRole)))
+        self.courseList.customContextMenuRequested.connect(self._on_context_menu)
+        body.addWidget(self.timetable, 1)
+        body.addWidget(self.courseList)
+        layout.addLayout(body, 1)
+
+        self.vm.bind('view', self._on_view)
+
+    def _on_context_menu(self, pos):
+        item = self.courseList.itemAt(pos)
+        if item is not None:
+            self.vm.unpin(item.data(Qt.UserRole))
+
+    def _on_view(self, view):
+        if view is None:
+            self.positionLabel.setText("0 / 0")
+            self.creditsLabel.setText("")
+            self.timetable.set_blocks([])
+            self.courseList.clear()
+            return
+
+        total = f"{view.total} ({view.pinned_count}개 고정)" if view.pinned_count else f"{view.total}"
+        self.positionLabel.setText(f"{view.position} / {total}")
+        self.creditsLabel.setText(f"{view.credits}학점 · {sum(entry.active for entry in view.courses)}개")
+        self.clearPinsBtn.setEnabled(view.pinned_count > 0)
+        self.timetable.set_blocks(view.blocks)
+
+        self.courseList.clear()
+        for entry in view.courses:
+            text = entry.name
+            if entry.required:
+                text += " (필수)"
+            if entry.pinned:
+                text += " 📌"
+            item = QListWidgetItem(f"{text}\n{entry.professor} · {entry.credits}학점")
+            item.setData(Qt.UserRole, entry.name)
+            if entry.active:
+                color = self.timetable.color_of(entry.name)
+                item.setForeground(color.lighter(130) if isDarkTheme() else color.darker(130))
+            else:
+                item.setForeground(QColor(255, 255, 255, 110) if isDarkTheme() else QColor(0, 0, 0, 110))
+            self.courseList.addItem(item)
+
+    def keyPressEvent(self, event):
+        """←/→: 이전/다음, Esc: 고정 모두 해제"""
+        if event.key() == Qt.Key_Left:
+            self.vm.prev_schedule()
+        elif event.key() == Qt.Key_Right:
+            self.vm.next_schedule()
+        elif event.key() == Qt.Key_Escape:
+            self.vm.clear_pins()
+        else:
+            super().keyPressEvent(event)
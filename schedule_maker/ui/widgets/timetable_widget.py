@@ -0,0 +1,108 @@
+"""
+네이티브 시간표 위젯
+요일 × 시간 격자에 강의 블록을 직접 그림 (QWebEngineView 없이 결과 표시)
+"""
+from typing import Dict, List
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from qfluentwidgets import isDarkTheme, getFont, qconfig
+
+from ...core.models import time_to_minutes
+
+DAYS = ['월', '화', '수', '목', '금']
+START_HOUR = 9
+END_HOUR = 22  # 22:00까지 표시 (야간 수업 대응)
+
+
+class TimetableWidget(QWidget):
+    """강의 블록 목록(TimetableBlock)을 받아 그리는 시간표"""
+
+    HEADER_HEIGHT = 30
+    TIME_COLUMN_WIDTH = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._blocks = []
+        self._colors: Dict[str, QColor] = {}  # 강의명 → 색 (처음 나온 순서대로 황금각 분산, HTML 화면과 같음)
+        self.setMinimumSize(500, 500)
+        self.setMouseTracking(True)
+        qconfig.themeChanged.connect(self.update)
+
+    def set_blocks(self, blocks: List):
+        self._blocks = list(blocks)
+        self.setToolTip("")
+        self.update()
+
+    def color_of(self, name: str) -> QColor:
+        color = self._colors.get(name)
+        if color is None:
+            color = self._colors[name] = QColor.fromHslF(((len(self._colors) * 137.5) % 360) / 360, 0.7, 0.6)
+        return color
+
+    def _geometry(self):
+        """(열 너비, 분당 높이)"""
+        column = (self.width() - self.TIME_COLUMN_WIDTH) / len(DAYS)
+        per_minute = (self.height() - self.HEADER_HEIGHT) / ((END_HOUR - START_HOUR) * 60)
+        return column, per_minute
+
+    def _block_rect(self, block) -> QRectF:
+        column, per_minute = self._geometry()
+        start, end = time_to_minutes(block.start_time), time_to_minutes(block.end_time)
+        top = self.HEADER_HEIGHT + (start - START_HOUR * 60) * per_minute
+        height = (end - start) * per_minute
+        left = self.TIME_COLUMN_WIDTH + DAYS.index(block.day) * column
+        return QRectF(left + 2, top + 1, column - 4, max(height - 2, 1))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        column, per_minute = self._geometry()
+        # 배경은 테마 배경 그대로, 선/글자만 테마에 맞춤
+        dark = isDarkTheme()
+        text_color = QColor(255, 255, 255) if dark else QColor(0, 0, 0)
+        grid_color = QColor(255, 255, 255, 24) if dark else QColor(0, 0, 0, 18)
+
+        # 격자
+        painter.setPen(QPen(grid_color, 1))
+        for hour in range(START_HOUR, END_HOUR + 1):
+            y = self.HEADER_HEIGHT + (hour - START_HOUR) * 60 * per_minute
+            painter.drawLine(self.TIME_COLUMN_WIDTH, int(y), self.width(), int(y))
+        for i in range(len(DAYS) + 1):
+            x = self.TIME_COLUMN_WIDTH + i * column
+            painter.drawLine(int(x), 0, int(x), self.height())
+
+        # 요일/시간 머리글
+        painter.setPen(text_color)
+        painter.setFont(getFont(13, QFont.DemiBold))
+        for i, day in enumerate(DAYS):
+            rect = QRectF(self.TIME_COLUMN_WIDTH + i * column, 0, column, self.HEADER_HEIGHT)
+            painter.drawText(rect, Qt.AlignCenter, day)
+        painter.setFont(getFont(11))
+        for hour in range(START_HOUR, END_HOUR):
+            y = self.HEADER_HEIGHT + (hour - START_HOUR) * 60 * per_minute
+            painter.drawText(QRectF(0, y, self.TIME_COLUMN_WIDTH - 4, 16), Qt.AlignRight | Qt.AlignTop, f"{hour:02d}:00")
+
+        # 강의 블록
+        painter.setFont(getFont(12, QFont.DemiBold))
+        for block in self._blocks:
+            if block.day not in DAYS:
+                continue
+            rect = self._block_rect(block)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.color_of(block.name))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(Qt.white)
+            painter.drawText(rect.adjusted(4, 2, -4, -2), Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, block.name)
+        painter.end()
+
+    def mouseMoveEvent(self, event):
+        """블록 위에서 강의 정보 툴팁"""
+        pos = event.position() if hasattr(event, 'position') else event.pos()
+        for block in self._blocks:
+            if block.day in DAYS and self._block_rect(block).contains(pos):
+                self.setToolTip(f"{block.name}\n{block.professor}\n{block.day} {block.start_time}~{block.end_time}")
+                return
+        self.setToolTip("")
+        super().mouseMoveEvent(event)
@@ -17,6 +17,7 @@ class ScheduleGenerationWorker(QThread):
     finished = Signal(int)  # 생성된 시간표 개수
     error = Signal(str)     # 에러 메시지
     progress = Signal(str)  # 진행 상황 메시지
+    results_found = Signal(int)  # 생성 중 지금까지 찾은 시간표 개수 (결과 화면 점진 표시)
     
     def __init__(self, controller, state_manager=None):
         """
@@ -59,9 +60,13 @@ class ScheduleGenerationWorker(QThread):
             
             # 콜백 설정
             self.controller.schedule_service.set_progress_callback(on_progress)
+            self.controller.schedule_service.set_result_callback(self.results_found.emit)
             
             # 2. 시간표 생성
-            schedules = self.controller.schedule_service.generate_schedules(all_courses, config)
+            try:
+                schedules = self.controller.schedule_service.generate_schedules(all_courses, config)
+            finally:
+                self.controller.schedule_service.set_result_callback(None)
             
             if not schedules:
                 if self.state_manager:
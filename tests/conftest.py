@@ -5,6 +5,16 @@ import os
 # Ensure the project root is in sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+COURSE_CSV_HEADER = "학년,교과목명,학점,시간,N/P과목,담당교수,강좌번호,신청인원,제한인원,강의시간,비고,강의계획서\n"
+
+@pytest.fixture
+def write_csv():
+    """강의 CSV 작성 함수 (헤더 + 행 목록, 크롤러 출력과 같은 utf-8-sig)"""
+    def write(path, rows):
+        path.write_text(COURSE_CSV_HEADER + "".join(row + "\n" for row in rows), encoding='utf-8-sig')
+        return path
+    return write
+
 @pytest.fixture
 def sample_course_data():
     """Provides sample course data for testing."""
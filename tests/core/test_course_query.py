@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from schedule_maker.core.models import Course, TimeSlot
+from schedule_maker.core.course_table import CourseTable
+from schedule_maker.core.course_query import CourseQuery, CourseQueryEngine
+
+# --- Fixtures ---
+
+@pytest.fixture
+def table():
+    return CourseTable.from_courses([
+        Course('101', 'Math', 3, 'Prof. A', [TimeSlot('화', '09:00', '10:30'), TimeSlot('목', '09:00', '10:30')],
+               category='전공', target_grade='전학년'),
+        Course('102', 'Physics', 3, 'Prof. B', [TimeSlot('월', '13:00', '15:00')], category='전공', target_grade='2학년'),
+        Course('103', 'Art', 2, 'Prof. C', [TimeSlot('화', '18:00', '20:00')], category='교양', target_grade='전학년'),
+        Course('104', 'Seminar', 1, 'Prof. A', [TimeSlot('목', '10:00', '11:00')], category='교양',
+               target_grade='1학년', pass_fail=True),
+    ])
+
+@pytest.fixture
+def engine(table):
+    return CourseQueryEngine(table)
+
+def ids(table, rows):
+    return [table.course_ids[row] for row in rows]
+
+# --- Tests ---
+
+def test_empty_query_returns_all_rows(engine, table):
+    assert ids(table, engine.query(CourseQuery()).rows) == ['101', '102', '103', '104']
+
+def test_criteria_are_anded(engine, table):
+    result = engine.query(CourseQuery(credits={3}, categories={'전공'}, all_grade=True))
+    assert ids(table, result.rows) == ['101']
+
+def test_only_days_and_time_window(engine, table):
+    assert ids(table, engine.query(CourseQuery(only_days={'화', '목'})).rows) == ['101', '103', '104']
+    assert ids(table, engine.query(CourseQuery(days={'월'})).rows) == ['102']
+    result = engine.query(CourseQuery(only_days={'화', '목'}, time_window=('09:00', '18:00')))
+    assert ids(table, result.rows) == ['101', '104']
+
+def test_credit_range_and_pass_fail(engine, table):
+    assert ids(table, engine.query(CourseQuery(max_credits=2)).rows) == ['103', '104']
+    assert ids(table, engine.query(CourseQuery(pass_fail=True)).rows) == ['104']
+    assert ids(table, engine.query(CourseQuery(grades={'2학년'})).rows) == ['102']
+
+def test_rows_order_is_preserved(engine, table):
+    rows = np.array([3, 0, 2])
+    result = engine.query(CourseQuery(rows=rows, only_days={'화', '목'}))
+    assert ids(table, result.rows) == ['104', '101', '103']
+
+def test_facets_exclude_own_criterion(engine):
+    result = engine.query(CourseQuery(credits={3}, categories={'전공'}), with_facets=True)
+    # 학점 패싯은 학점 조건을 뺀 전공 과목 기준
+    assert result.facets['credits'] == {3: 2}
+    # 이수구분 패싯은 이수구분 조건을 뺀 3학점 과목 기준
+    assert result.facets['category'] == {'전공': 2}
+    assert result.facets['pass_fail'] == {True: 0, False: 2}
+
+def test_day_facets_count_results_of_adding_that_day(engine):
+    # 요일 패싯은 only_days 규칙 그대로: 그 요일을 추가 선택했을 때의 결과 수
+    facets = engine.query(CourseQuery(credits={3}), with_facets=True).facets
+    assert (facets['days']['월'], facets['days']['화']) == (1, 0)  # Math는 화/목 수업
+    facets = engine.query(CourseQuery(credits={3}, only_days={'목'}), with_facets=True).facets
+    assert (facets['days']['화'], facets['days']['목']) == (1, 0)
+    assert len(engine.query(CourseQuery(credits={3}, only_days={'화', '목'})).rows) == facets['days']['화']
+
+def test_bitmaps_follow_catalog_patch(engine, table):
+    assert len(engine.query(CourseQuery(credits={4})).rows) == 0
+    diff = table.diff([
+        Course('101', 'Math', 4, 'Prof. A', [TimeSlot('화', '09:00', '10:30')]),
+    ])
+    table.patch(diff)
+    assert ids(table, engine.query(CourseQuery(credits={4})).rows) == ['101']
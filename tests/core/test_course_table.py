@@ -0,0 +1,108 @@
+import pytest
+from schedule_maker.core.models import Course, TimeSlot
+from schedule_maker.core.course_table import CourseTable, CourseView
+
+# --- Fixtures ---
+
+@pytest.fixture
+def courses():
+    return [
+        Course('101', 'Math', 3, 'Prof. A', [TimeSlot('월', '09:00', '10:30')], target_grade='전학년'),
+        Course('102', 'Math', 3, 'Prof. B', [TimeSlot('월', '09:00', '10:30')]),
+        Course('103', 'Physics', 2, 'Prof. A', [TimeSlot('화', '13:00', '15:00'), TimeSlot('목', '13:00', '15:00')]),
+    ]
+
+@pytest.fixture
+def table(courses):
+    return CourseTable.from_courses(courses)
+
+# --- Tests ---
+
+def test_views_expose_course_api(table, courses):
+    assert len(table) == 3
+    for view, course in zip(table, courses):
+        assert isinstance(view, CourseView)
+        assert view.course_id == course.course_id
+        assert view.name == course.name
+        assert view.credits == course.credits
+        assert view.professor == course.professor
+        assert view.time_slots == course.time_slots
+        assert view.time_mask == course.time_mask
+        assert view.time_summary == course.time_summary
+        assert view.target_grade == course.target_grade
+
+def test_view_equality_matches_course(table, courses):
+    assert table[0] == courses[0]
+    assert courses[0] == table[0]
+    assert hash(table[0]) == hash(courses[0])
+    assert table[0] != courses[1]
+    assert courses[1] in table
+
+def test_string_and_pattern_tables_dedupe(table):
+    # 강의명/교수명/시간 패턴은 한 번씩만 저장됨
+    assert len(table.names) == 2
+    assert len(table.professors) == 2
+    assert len(table.patterns) == 2
+    assert table.pattern_codes[0] == table.pattern_codes[1]
+
+def test_numeric_columns(table):
+    assert table.credits.tolist() == [3, 3, 2]
+    assert table.all_grade.tolist() == [True, False, False]
+    # 월=bit0, 화=bit1, 목=bit3
+    assert table.day_masks.tolist() == [0b1, 0b1, 0b1010]
+
+def test_lookup_and_read_only(table):
+    view = table.get('103')
+    assert view.name == 'Physics'
+    assert table.get('999') is None
+    assert table[-1].course_id == '103'
+
+    with pytest.raises(AttributeError):
+        view.name = 'Chemistry'
+
+def test_to_course_roundtrip(table, courses):
+    record = table[2].to_course()
+    assert isinstance(record, Course)
+    assert record == courses[2]
+    assert record.time_mask == courses[2].time_mask
+
+def test_diff_and_patch_only_touch_changed_rows(table, courses):
+    updated = [
+        courses[0],
+        Course('102', 'Math', 3, 'Prof. B', [TimeSlot('수', '09:00', '10:30')]),  # 시간 변경
+        Course('104', 'Chemistry', 3, 'Prof. C', [TimeSlot('금', '10:00', '12:00')]),  # 신설
+    ]  # 103 폐강
+
+    diff = table.diff(updated)
+    assert [c.course_id for c in diff.added] == ['104']
+    assert diff.removed == ['103']
+    assert [c.course_id for c in diff.modified] == ['102']
+    assert diff.unchanged == 1
+    assert diff.changed_ids == {'102', '103'}
+
+    version = table.version
+    table.patch(diff)
+    assert table.version > version
+    assert [v.course_id for v in table] == ['101', '102', '104']
+    assert table.get('103') is None
+    assert table.get('102').time_summary == updated[1].time_summary
+    assert table.row_of('101') == 0  # 변경 없는 행 번호 유지
+
+    # 다시 개설되면 기존 행 재사용
+    table.patch(table.diff(courses))
+    assert table.row_of('103') == 2
+    assert [v.course_id for v in table] == ['101', '102', '103']
+    assert table.diff(courses).has_changes is False
+
+def test_sort_rows_matches_python_sort(table):
+    rows = table.active_rows
+    for key, attr in (('course_id', 'course_id'), ('name', 'name'), ('credits', 'credits'), ('professor', 'professor')):
+        for reverse in (False, True):
+            expected = sorted(table, key=lambda c: getattr(c, attr), reverse=reverse)
+            assert table.views(table.sort_rows(rows, key, reverse)) == expected
+
+def test_sections_of_groups_rows_by_exact_name(table):
+    assert table.sections_of('Math').tolist() == [0, 1]
+    assert table.sections_of('Physics').tolist() == [2]
+    assert table.sections_of('Mat').tolist() == []
+    assert table.time_mask_of(2) == table[2].time_mask
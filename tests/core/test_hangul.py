@@ -0,0 +1,17 @@
+from schedule_maker.core.hangul import decompose, has_choseong, to_choseong
+
+# --- Tests ---
+
+def test_to_choseong_keeps_non_hangul():
+    assert to_choseong("영어회화1") == "ㅇㅇㅎㅎ1"
+    assert to_choseong("ai개론") == "aiㄱㄹ"
+
+def test_decompose_into_jamo():
+    assert decompose("회화") == "ㅎㅚㅎㅘ"
+    assert decompose("각") == "ㄱㅏㄱ"
+    assert decompose("c언어") == "cㅇㅓㄴㅇㅓ"
+
+def test_has_choseong():
+    assert has_choseong("ㅇㅇㅎㅎ")
+    assert has_choseong("영ㅇ")
+    assert not has_choseong("영어")
@@ -97,3 +97,37 @@ def test_schedule_remove_course():
     assert s.total_credits == 0
     assert s.total_time_mask == 0
     assert 'Logic 101' not in s.course_names
+
+# --- Memory-lean Representation Tests ---
+
+def test_timeslot_preparsed_minutes():
+    slot = TimeSlot('화', '13:30', '14:45', 'S1919')
+    assert slot.start_minutes == 13 * 60 + 30
+    assert slot.end_minutes == 14 * 60 + 45
+
+def test_course_is_immutable_and_slotted():
+    c1 = Course('1', 'Logic 101', 3, 'Turing', [TimeSlot('월', '10:00', '12:00')])
+
+    assert not hasattr(c1, '__dict__')
+    assert isinstance(c1.time_slots, tuple)
+    with pytest.raises(AttributeError):
+        c1.name = 'Changed'
+
+def test_course_strings_are_interned():
+    # CSV에서 읽은 문자열처럼 런타임에 만들어진 동일 문자열
+    prof_a = ''.join(['Tu', 'ring'])
+    prof_b = ''.join(['Turi', 'ng'])
+    c1 = Course('1', 'Logic 101', 3, prof_a, [TimeSlot('월', '10:00', '12:00')])
+    c2 = Course('2', 'Logic 102', 3, prof_b, [TimeSlot('화', '10:00', '12:00')])
+
+    assert c1.professor is c2.professor
+
+def test_course_identity_by_course_id():
+    c1 = Course('1', 'Logic 101', 3, 'Turing', [TimeSlot('월', '10:00', '12:00')])
+    c2 = Course('1', 'Logic 101 (renamed)', 2, 'Gödel', [])
+
+    assert c1 == c2
+    assert hash(c1) == hash(c2)
+    assert len({c1, c2}) == 1
+    assert c1.time_summary == '월 10:00~12:00'
+    assert c2.time_summary == '시간 정보 없음'
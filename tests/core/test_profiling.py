@@ -0,0 +1,101 @@
+import json
+import subprocess
+import sys
+import pytest
+from schedule_maker.core.profiling import StartupProfiler, ImportTimer, CLI_FLAG, ENV_VAR, DEFAULT_REPORT
+
+# --- Tests ---
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = StartupProfiler()
+    with profiler.phase('startup'):
+        profiler.mark('ready')
+    assert profiler.report()['phases'] == []
+    assert profiler.report()['marks'] == {}
+    assert profiler.write_report(str(tmp_path / 'report.json')) is None
+
+def test_phases_nest_and_report_as_json(tmp_path):
+    profiler = StartupProfiler()
+    profiler.enable(str(tmp_path / 'report.json'), capture_imports=False)
+    with profiler.phase('main_window'):
+        with profiler.phase('main_window.search_interface'):
+            pass
+    profiler.mark('window_shown')
+    profiler.mark('window_shown')  # 첫 기록만 유지
+
+    path = profiler.write_report()
+    report = json.loads((tmp_path / 'report.json').read_text(encoding='utf-8'))
+    assert path == str(tmp_path / 'report.json')
+    assert [(p['name'], p['depth']) for p in report['phases']] == [
+        ('main_window', 0), ('main_window.search_interface', 1)
+    ]
+    outer, inner = report['phases']
+    assert outer['duration_ms'] >= inner['duration_ms']
+    assert list(report['marks']) == ['window_shown']
+
+def test_configure_from_cli_flag_or_env(tmp_path):
+    argv = ['run.py', f'{CLI_FLAG}={tmp_path / "cli.json"}']
+    profiler = StartupProfiler()
+    assert profiler.configure(argv, environ={}, default_dir=str(tmp_path))
+    assert argv == ['run.py']  # Qt에 넘기기 전에 제거
+    assert profiler.report_path == str(tmp_path / 'cli.json')
+    profiler.import_timer.uninstall()
+
+    profiler = StartupProfiler()
+    assert profiler.configure(['run.py'], environ={ENV_VAR: '1'}, default_dir=str(tmp_path))
+    assert profiler.report_path == str(tmp_path / DEFAULT_REPORT)
+    profiler.import_timer.uninstall()
+
+    assert not StartupProfiler().configure(['run.py'], environ={}, default_dir=str(tmp_path))
+
+def test_import_timer_records_cumulative_and_self_time(tmp_path, monkeypatch):
+    package = tmp_path / 'probe_pkg'
+    package.mkdir()
+    (package / '__init__.py').write_text("from . import child\n", encoding='utf-8')
+    (package / 'child.py').write_text("import time\ntime.sleep(0.02)\n", encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    timer = ImportTimer(packages=('probe_pkg',))
+    timer.install()
+    try:
+        import probe_pkg  # noqa: F401
+    finally:
+        timer.uninstall()
+        for name in ('probe_pkg', 'probe_pkg.child'):
+            sys.modules.pop(name, None)
+
+    records = {r['module']: r for r in timer.records}
+    assert set(records) == {'probe_pkg', 'probe_pkg.child'}
+    assert records['probe_pkg.child']['cumulative_ms'] >= 15
+    # 하위 import 시간은 부모의 누적 시간에만 포함
+    assert records['probe_pkg']['cumulative_ms'] >= records['probe_pkg.child']['cumulative_ms']
+    assert records['probe_pkg']['self_ms'] < records['probe_pkg.child']['cumulative_ms']
+
+
+EXTENSION_PROBE = """
+import importlib.machinery, importlib.util, json, sys, time
+from schedule_maker.core.profiling import ImportTimer
+for name in ('_curses', '_testcapi'):  # 단일 단계 초기화 (PySide6와 같이 create_module에서 초기화)
+    spec = None if name in sys.modules else importlib.util.find_spec(name)
+    if spec is not None and isinstance(spec.loader, importlib.machinery.ExtensionFileLoader):
+        break
+else:
+    print('null')
+    sys.exit()
+timer = ImportTimer(packages=(name,))
+timer.install()
+start = time.perf_counter()
+__import__(name)
+wall_ms = (time.perf_counter() - start) * 1000
+timer.uninstall()
+print(json.dumps({'records': timer.records, 'wall_ms': wall_ms}))
+"""
+
+def test_import_timer_includes_extension_module_loading():
+    # 확장 모듈은 create_module(dlopen/초기화)이 대부분이므로 그 시간도 기록해야 함
+    result = subprocess.run([sys.executable, '-c', EXTENSION_PROBE], capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout)
+    if data is None:
+        pytest.skip("가져오지 않은 확장 모듈이 없음")
+    [record] = data['records']
+    assert record['cumulative_ms'] >= data['wall_ms'] * 0.5
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from schedule_maker.core.models import Course, Schedule, TimeSlot
+from schedule_maker.core.course_table import CourseTable
+from schedule_maker.core.config import ScheduleConfig, CourseFilter
+from schedule_maker.core.result_store import ResultStore, MASK_WORDS, mask_to_words
+
+# --- Fixtures ---
+
+@pytest.fixture
+def courses():
+    return [
+        Course('101', 'Math', 3, 'Prof. A', [TimeSlot('월', '09:00', '10:30')]),
+        Course('102', 'English', 2, 'Prof. B', [TimeSlot('화', '10:00', '11:30')]),
+        Course('103', 'Physics', 3, 'Prof. C', [TimeSlot('수', '13:00', '15:00')]),
+    ]
+
+@pytest.fixture
+def table(courses):
+    return CourseTable.from_courses(courses)
+
+def schedule_of(*courses, filled=False):
+    schedule = Schedule()
+    for course in courses:
+        schedule.add_course(course)
+    schedule.has_random_filled = filled
+    return schedule
+
+# --- Tests ---
+
+def test_roundtrip_keeps_order_and_shares_records(courses, table):
+    schedules = [schedule_of(courses[0], courses[1]), schedule_of(courses[0], courses[2], filled=True), schedule_of()]
+    store = ResultStore.from_schedules(schedules, table)
+
+    assert len(store) == 3
+    assert store.credits.tolist() == [5, 6, 0]
+    assert store.masks.shape == (3, MASK_WORDS)
+    assert not store.masks[2].any()
+
+    restored = store.to_schedules(table)
+    assert [[c.course_id for c in s.courses] for s in restored] == [['101', '102'], ['101', '103'], []]
+    assert [s.has_random_filled for s in restored] == [False, True, False]
+    # 같은 분반은 같은 Course 객체
+    assert restored[0].courses[0] is restored[1].courses[0]
+
+def test_dict_roundtrip_uses_course_ids(courses, table):
+    store = ResultStore.from_schedules([schedule_of(courses[1], courses[2])], table)
+    data = store.to_dict(table)
+    assert data['schedules'] == [['102', '103']]
+
+    # 행 순서가 다른 카탈로그에서도 복원
+    reordered = CourseTable.from_courses(list(reversed(courses)))
+    restored = ResultStore.from_dict(data, reordered)
+    assert np.array_equal(restored.masks, store.masks)
+    # 없어진 분반이 있으면 복원하지 않음
+    assert ResultStore.from_dict(data, CourseTable.from_courses(courses[:2])) is None
+
+def test_mask_words_roundtrip():
+    mask = (1 << 0) | (1 << 63) | (1 << 64) | (1 << (7 * 288 - 1))
+    words = mask_to_words(mask)
+    assert int.from_bytes(words.astype('<u8').tobytes(), 'little') == mask
+
+def test_fingerprints_are_stable(courses, table):
+    config = ScheduleConfig(12, 18, [CourseFilter(name='Math')], [], ['월', '화'], [('수', '09:00', '10:00')])
+    same = ScheduleConfig(12, 18, [CourseFilter(name='Math')], [], ['화', '월'], [('수', '09:00', '10:00')])
+    assert config.fingerprint() == same.fingerprint()
+    same.max_credits = 21
+    assert config.fingerprint() != same.fingerprint()
+
+    assert table.fingerprint() == CourseTable.from_courses(list(reversed(courses))).fingerprint()
+    assert table.fingerprint() != CourseTable.from_courses(courses[:2]).fingerprint()
+
+def test_filter_by_excluded_mask_and_credits(courses, table):
+    from schedule_maker.core.models import build_excluded_mask
+    schedules = [schedule_of(courses[0], courses[1]), schedule_of(courses[1], courses[2]), schedule_of(courses[2])]
+    store = ResultStore.from_schedules(schedules, table)
+
+    assert store.filter(build_excluded_mask(['월'], []), 0, 18).tolist() == [1, 2]
+    assert store.filter(0, 5, 5).tolist() == [0, 1]
+    assert store.filter(build_excluded_mask([], [('수', '14:00', '15:00')]), 0, 18).tolist() == [0]
+
+    subset = store.take([2, 0])
+    assert subset.credits.tolist() == [3, 5]
+    assert [[c.course_id for c in s.courses] for s in subset.to_schedules(table)] == [['103'], ['101', '102']]
@@ -0,0 +1,191 @@
+import pytest
+from schedule_maker.services.course_service import CourseService
+from schedule_maker.services.schedule_service import ScheduleService
+from schedule_maker.core.models import Schedule
+from schedule_maker.core.config import CourseFilter, ScheduleConfig
+from schedule_maker.core.course_query import CourseQuery
+from schedule_maker.ui.viewmodels.managers.course_list_manager import CourseListManager
+
+# --- Fixtures ---
+
+@pytest.fixture
+def csv_path(tmp_path, write_csv):
+    path = tmp_path / "courses.csv"
+    write_csv(path, [
+        "1학년,자료구조,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1) 수 09:00~10:15 (S1),,",
+        "1학년,자료구조,3,3,,이교수,1002,10,40,화 09:00~10:15 (S2) 목 09:00~10:15 (S2),,",
+        "2학년,운영체제,3,3,,박교수,1003,10,40,금 13:00~15:45 (S3),,",
+    ])
+    return path
+
+# --- Tests ---
+
+def test_reload_reports_changes_and_keeps_unchanged(csv_path, write_csv):
+    service = CourseService()
+    service.load_courses(str(csv_path))
+    table = service.get_course_table()
+
+    # 신청인원만 바뀐 행은 변경 없음, 1002 시간 변경, 1003 폐강
+    write_csv(csv_path, [
+        "1학년,자료구조,3,3,,김교수,1001,35,40,월 09:00~10:15 (S1) 수 09:00~10:15 (S1),,",
+        "1학년,자료구조,3,3,,이교수,1002,10,40,화 10:30~11:45 (S2) 목 10:30~11:45 (S2),,",
+    ])
+    diff = service.reload_courses(str(csv_path))
+
+    assert diff.unchanged == 1
+    assert [c.course_id for c in diff.modified] == ['1002']
+    assert diff.removed == ['1003']
+    assert service.get_course_table() is table  # 같은 카탈로그를 제자리 갱신
+    assert service.get_course_count() == 2
+    assert service.get_course_by_id('1003') is None
+
+def test_read_changes_leaves_catalog_until_applied(csv_path, write_csv):
+    service = CourseService()
+    service.load_courses(str(csv_path))
+    version = service.get_course_table().version
+
+    # 비교만 하면 카탈로그는 그대로 (생성 중에도 백그라운드에서 읽을 수 있음)
+    write_csv(csv_path, [
+        "1학년,자료구조,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1) 수 09:00~10:15 (S1),,",
+    ])
+    diff = service.read_changes(str(csv_path))
+    assert sorted(diff.removed) == ['1002', '1003']
+    assert service.get_course_table().version == version
+    assert service.get_course_by_id('1003') is not None
+
+    service.apply_changes(diff)
+    assert service.get_course_by_id('1003') is None
+    assert service.get_course_count() == 1
+
+def test_invalidate_only_touched_results(csv_path):
+    course_service = CourseService()
+    courses = course_service.load_courses(str(csv_path))
+    schedule_service = ScheduleService()
+    schedule = Schedule()
+    schedule.add_course(courses[0].to_course())
+    schedule_service._schedules = [schedule]
+
+    assert schedule_service.invalidate_courses({'1003'}) is False
+    assert schedule_service.get_schedule_count() == 1
+
+    assert schedule_service.invalidate_courses({'1001'}) is True
+    assert schedule_service.get_schedule_count() == 0
+
+@pytest.mark.parametrize("course_filter", [
+    CourseFilter(name="자료구조"),
+    CourseFilter(name="자료 구조"),
+    CourseFilter(name="자료구조", professor="이"),
+    CourseFilter(professor="교수"),
+    CourseFilter(course_id="1003"),
+    CourseFilter(course_id="9999"),
+    CourseFilter(name="없는강의"),
+])
+def test_resolve_filter_matches_linear_scan(csv_path, course_filter):
+    service = CourseService()
+    courses = service.load_courses(str(csv_path))
+    expected = [c.course_id for c in courses if course_filter.matches(c)]
+    assert [c.course_id for c in service.resolve_filter(course_filter)] == expected
+
+def test_resolve_filter_is_cached_per_catalog_version(csv_path, write_csv):
+    service = CourseService()
+    service.load_courses(str(csv_path))
+    course_filter = CourseFilter(name="운영체제")
+
+    rows = service.resolve_filter_rows(course_filter)
+    assert service.resolve_filter_rows(CourseFilter(name="운영체제")) is rows
+
+    write_csv(csv_path, [
+        "1학년,자료구조,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1) 수 09:00~10:15 (S1),,",
+    ])
+    service.reload_courses(str(csv_path))
+    assert service.resolve_filter(course_filter) == []
+
+def test_resolve_filter_cache_is_dropped_on_full_load(csv_path, tmp_path, write_csv):
+    service = CourseService()
+    service.load_courses(str(csv_path))
+    assert service.resolve_filter_rows(CourseFilter(name="운영체제")).tolist() == [2]
+
+    # 새 카탈로그도 버전 1부터 시작하므로 카탈로그 자체로 구분해야 함
+    reversed_path = tmp_path / "reversed.csv"
+    write_csv(reversed_path, csv_path.read_text(encoding='utf-8-sig').splitlines()[:0:-1])
+    service.load_courses(str(reversed_path))
+    assert service.resolve_filter_rows(CourseFilter(name="운영체제")).tolist() == [0]
+
+def test_query_courses_reads_pass_fail_column(tmp_path, write_csv):
+    path = tmp_path / "courses.csv"
+    write_csv(path, [
+        "1학년,자료구조,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1),,",
+        "1학년,세미나,1,1,Y,이교수,1002,10,40,화 09:00~09:50 (S2),,",
+    ])
+    service = CourseService()
+    service.load_courses(str(path))
+
+    result = service.query_courses(CourseQuery(pass_fail=True), with_facets=True)
+    assert [service.get_course_table().course_ids[row] for row in result.rows] == ['1002']
+    assert result.facets['pass_fail'] == {True: 1, False: 1}
+
+class StubConfigService:
+    def __init__(self, config):
+        self.config = config
+
+    def get_config(self):
+        return self.config
+
+    def update_required_filters(self, filters):
+        self.config.required_filters = filters
+
+def test_alternative_sections_skip_conflicts(tmp_path, write_csv):
+    path = tmp_path / "courses.csv"
+    write_csv(path, [
+        "1학년,자료구조,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1),,",
+        "1학년,자료구조,3,3,,이교수,1002,10,40,화 09:00~10:15 (S2),,",
+        "1학년,자료구조,3,3,,박교수,1003,10,40,수 09:00~10:15 (S3),,",
+        "1학년,자료구조,3,3,,최교수,1004,10,40,목 09:00~10:15 (S4),,",
+        "2학년,운영체제,3,3,,정교수,2001,10,40,화 09:00~10:15 (S5),,",
+        "2학년,컴파일러,3,3,,한교수,3001,10,40,수 09:00~10:15 (S6),,",
+        "2학년,컴파일러,3,3,,한교수,3002,10,40,목 09:00~10:15 (S7),,",
+    ])
+    service = CourseService()
+    service.load_courses(str(path))
+
+    target = CourseFilter(name='자료구조', course_id='1001')
+    config = ScheduleConfig(12, 18, [
+        target,
+        CourseFilter(course_id='2001'),   # 화요일 고정
+        CourseFilter(name='컴파일러'),    # 수/목 중 하나
+    ], [], ['월'], [])
+
+    # 월: 제외 요일, 화: 고정 분반과 충돌 → 수/목만 가능 (컴파일러는 남은 요일로)
+    alternatives = service.find_alternative_sections('자료구조', config, ignore=target)
+    assert [c.course_id for c in alternatives] == ['1003', '1004']
+
+    manager = CourseListManager(StubConfigService(config), service)
+    assert manager.rotate_course_slot('required', 0)
+    assert (target.course_id, target.professor) == ('1003', '박교수')
+    assert manager.rotate_course_slot('required', 0)
+    assert target.course_id == '1004'
+    assert manager.rotate_course_slot('required', 0)
+    assert target.course_id == '1003'
+
+    # 다른 분반이 모두 막히면 변경하지 않음
+    config.excluded_days = ['월', '목']
+    assert not manager.rotate_course_slot('required', 0)
+    assert target.course_id == '1003'
+
+def test_rotate_name_only_filter_uses_partial_matches(tmp_path, write_csv):
+    path = tmp_path / "courses.csv"
+    write_csv(path, [
+        "1학년,자료구조및실습,3,3,,김교수,1001,10,40,월 09:00~10:15 (S1),,",
+        "1학년,자료구조및실습,3,3,,이교수,1002,10,40,화 09:00~10:15 (S2),,",
+        "1학년,운영체제,3,3,,박교수,2001,10,40,화 09:00~10:15 (S3),,",
+    ])
+    service = CourseService()
+    service.load_courses(str(path))
+
+    # 강의명 일부만 적은 필터도 매칭되는 강의의 분반 안에서 순환 (화요일 분반은 운영체제와 충돌)
+    target = CourseFilter(name='자료구조')
+    config = ScheduleConfig(12, 18, [target, CourseFilter(course_id='2001')], [], [], [])
+    manager = CourseListManager(StubConfigService(config), service)
+    assert manager.rotate_course_slot('required', 0)
+    assert (target.course_id, target.name) == ('1001', '자료구조및실습')
+    assert not manager.rotate_course_slot('required', 0)
@@ -0,0 +1,80 @@
+import random
+import pytest
+from schedule_maker.services.course_service import CourseService
+from schedule_maker.services.feasibility import FeasibilityChecker, find_assignment, minimal_conflict
+from schedule_maker.services.scheduler import ScheduleGenerator
+from schedule_maker.core.config import CourseFilter, ScheduleConfig
+
+DAYS = ['월', '화', '수', '목', '금']
+
+@pytest.fixture
+def load_service(tmp_path, write_csv):
+    """sections: (강좌번호, 강의명, 강의시간) 목록으로 강의 서비스 구성"""
+    def load(sections):
+        path = write_csv(tmp_path / "courses.csv", [f"1학년,{name},3,3,,교수{cid},{cid},10,40,{time},," for cid, name, time in sections])
+        service = CourseService()
+        service.load_courses(str(path))
+        return service
+    return load
+
+def config_of(names, excluded_days=(), excluded_times=()):
+    return ScheduleConfig(12, 18, [CourseFilter(name=name) for name in names], [],
+                          list(excluded_days), list(excluded_times))
+
+# --- Tests ---
+
+def test_find_assignment_backtracks():
+    # A는 두 선택지, B는 A의 첫 선택지와만 겹침
+    domains = [[(0, 0b01), (0, 0b10)], [(1, 0b01)]]
+    assert find_assignment(domains) == [(0, 0b10), (1, 0b01)]
+    assert find_assignment([[(0, 0b01)], [(1, 0b01)]]) is None
+    # 같은 강의명은 함께 고를 수 없음
+    assert find_assignment([[(0, 0b01)], [(0, 0b10)]]) is None
+
+def test_minimal_conflict_drops_irrelevant_elements():
+    domains = [
+        [(0, 0b0001), (0, 0b0010)],   # A: 두 시간 중 하나
+        [(1, 0b0001)],                # B: 첫 시간 고정
+        [(2, 0b1000)],                # C: 무관
+    ]
+    # 두 번째 시간 제외 → A는 첫 시간만 남아 B와 충돌, 네 번째 시간 제외는 무관
+    assert minimal_conflict(domains, [0b0010, 0b0100]) == ([0, 1], [0])
+    assert minimal_conflict(domains, [0b0100]) is None
+
+def test_checker_reports_conflicts(load_service):
+    service = load_service([
+        ('1001', '자료구조', '월 09:00~10:15 (S1)'),
+        ('1002', '자료구조', '화 09:00~10:15 (S1)'),
+        ('2001', '운영체제', '화 09:00~10:15 (S2)'),
+    ])
+    checker = FeasibilityChecker(service)
+
+    assert checker.check(config_of(['자료구조', '운영체제'])).feasible
+    # 월요일 제외 → 자료구조는 화요일 분반만 남고 운영체제와 충돌
+    result = checker.check(config_of(['자료구조', '운영체제'], excluded_days=['월']))
+    assert not result.feasible
+    assert "시간 충돌" in result.message
+    assert result.conflict.describe() == "자료구조, 운영체제 + 제외 요일: 월"
+    # 모든 분반이 제외되면 생성기처럼 제외 조건 없이 판단
+    assert checker.check(config_of(['운영체제'], excluded_days=['화'])).feasible
+
+    result = checker.check(config_of(['컴파일러']))
+    assert result.as_status() == (False, "필수 강의를 찾을 수 없습니다: 컴파일러")
+
+def test_checker_matches_generator_on_random_configs(load_service):
+    rng = random.Random(7)
+    names = [f"과목{i}" for i in range(6)]
+    sections = []
+    for name in names:
+        for _ in range(rng.randint(1, 3)):
+            day = rng.choice(DAYS)
+            hour = rng.choice([9, 10, 13])
+            sections.append((str(1000 + len(sections)), name, f"{day} {hour:02d}:00~{hour + 1:02d}:15 (S1)"))
+    service = load_service(sections)
+    checker = FeasibilityChecker(service)
+
+    for _ in range(40):
+        config = config_of(rng.sample(names, rng.randint(2, 5)), excluded_days=rng.sample(DAYS, rng.randint(0, 2)))
+        generator = ScheduleGenerator(service.get_all_courses(), config, resolve_filter=service.resolve_filter)
+        expected = bool(generator._generate_required_combinations(generator.required_course_groups))
+        assert checker.check(config).feasible == expected
@@ -0,0 +1,67 @@
+import pytest
+from schedule_maker.services.ingest import create_run_dir, ingest_pages, parse_page
+from schedule_maker.services.parser import parse_csv
+
+pytest.importorskip('lxml')
+
+HEADER = ["학년", "교과목명", "학점", "시간", "N/P과목", "담당교수", "강좌번호", "신청인원", "제한인원", "강의시간", "비고", "강의계획서"]
+
+def page_html(rows):
+    head = "".join(f"<th>{h}</th>" for h in HEADER)
+    body = "".join("<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>" for row in rows)
+    # 레이아웃용 작은 표가 함께 있어도 가장 큰 표를 사용
+    return f"<html><body><table><tr><td>메뉴</td></tr></table><table><tr>{head}</tr>{body}</table></body></html>"
+
+ROW_A = ["1학년", "자료구조", "3", "3", "", "김교수", "1001", "10", "40", "월 09:00~10:15 (S1)", "", ""]
+ROW_B = ["2학년", "운영체제", "3", "3", "", "박교수", "1003", "5", "40", "금 13:00~15:45 (S3)", "", ""]
+ROW_C = ["전학년", "채플", "0.5", "1", "P", "이교수", "2001", "0", "300", "수 12:00~12:50 (채플관)", "", ""]
+
+# --- Fixtures ---
+
+@pytest.fixture
+def page_dir(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    (pages / "page_001.html").write_text(page_html([ROW_A, ROW_B]), encoding='utf-8')
+    (pages / "page_002.html").write_text(page_html([ROW_B, ROW_C]), encoding='utf-8')  # ROW_B 중복
+    (pages / "page_010.html").write_text("<html><body>세션 만료</body></html>", encoding='utf-8')
+    return pages
+
+# --- Tests ---
+
+def test_parse_page_normalizes_cells(page_dir):
+    columns, rows = parse_page(str(page_dir / "page_001.html"))
+    assert columns == HEADER
+    assert rows[0] == tuple(ROW_A)  # 정수 변환된 숫자/결측 셀은 원래 문자열로 복원
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_dedupes_and_skips_bad_pages(page_dir, tmp_path, workers):
+    output = tmp_path / "catalog.csv"
+    result = ingest_pages(str(page_dir), str(output), max_workers=workers)
+
+    assert result.pages == 3
+    assert result.rows == 3
+    assert result.duplicates == 1
+    assert [p.endswith("page_010.html") for p in result.failed_pages] == [True]
+
+    # 기존 파서로 그대로 읽을 수 있음 (페이지 순서 유지)
+    courses = parse_csv(str(output))
+    assert [c.course_id for c in courses] == ['1001', '1003', '2001']
+
+def test_run_dirs_keep_previous_pages_out(tmp_path):
+    root = tmp_path / "pages"
+    # 이전 실행: 130페이지까지 저장
+    previous = create_run_dir(str(root))
+    for page in (1, 2, 130):
+        (root / previous / f"page_{page:03d}.html").write_text(page_html([ROW_B, ROW_C]), encoding='utf-8')
+
+    # 이번 실행: 비어 있는 새 디렉토리에 2페이지만 저장
+    current = create_run_dir(str(root))
+    assert current != previous and not list((root / current).iterdir())
+    (root / current / "page_001.html").write_text(page_html([ROW_A, ROW_B]), encoding='utf-8')
+    (root / current / "page_002.html").write_text(page_html([ROW_B, ROW_A]), encoding='utf-8')
+
+    output = tmp_path / "catalog.csv"
+    result = ingest_pages(current, str(output), max_workers=1)
+    assert (result.pages, result.duplicates) == (2, 2)
+    assert [c.course_id for c in parse_csv(str(output))] == ['1001', '1003']
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import pandas as pd
+from schedule_maker.services.parser import parse_time_column, parse_time_string
+from schedule_maker.core.models import calculate_time_mask, range_mask
+
+# --- Tests ---
+
+def test_range_mask():
+    assert range_mask(2, 5) == 0b11100
+    assert range_mask(5, 5) == 0
+
+def test_parse_time_column_dedupes_patterns():
+    column = pd.Series([
+        "월 09:00~10:50 (S1221)",
+        "화 13:30~14:45 (S1919)  목 13:30~14:45 (S1919)",
+        "월 09:00~10:50 (S1221)",
+        None,
+        "시간 미정",
+    ])
+
+    codes, patterns, masks = parse_time_column(column)
+
+    # 같은 문자열은 같은 패턴 코드 (결측/파싱 불가는 -1)
+    assert codes[0] == codes[2]
+    assert codes[3] == -1
+    assert codes[4] == -1
+
+    # 행 단위 파싱 결과와 동일
+    for row, code in ((0, codes[0]), (1, codes[1])):
+        expected = tuple(parse_time_string(column[row]))
+        assert patterns[code] == expected
+        assert [s.room for s in patterns[code]] == [s.room for s in expected]
+        assert masks[code] == calculate_time_mask(expected)
+
+def test_parse_time_column_shares_slot_objects():
+    column = pd.Series(["수 09:00~10:50 (S1221)"] * 3)
+    codes, patterns, _ = parse_time_column(column)
+
+    assert len(set(codes)) == 1
+    assert len(patterns) == 1
+
+def test_pandas_is_imported_only_when_parsing():
+    # 앱 시작 시 서비스 모듈을 가져와도 pandas는 아직 로드되지 않아야 함 (CSV 로드 스레드에서 로드)
+    code = ("import sys, schedule_maker.controllers.app_controller; "
+            "print('pandas' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,100 @@
+import os
+import pytest
+from schedule_maker.services.course_service import CourseService
+from schedule_maker.services.schedule_service import ScheduleService
+from schedule_maker.services.result_cache import ResultCache
+from schedule_maker.services.visualizer import HtmlVisualizer
+from schedule_maker.services import schedule_service as schedule_module
+from schedule_maker.core.config import ScheduleConfig, CourseFilter
+from schedule_maker.core.result_store import ResultStore
+
+# --- Fixtures ---
+
+@pytest.fixture
+def course_service(tmp_path, write_csv):
+    rows = [
+        "1학년,자료구조,3,3,,교수A,1001,10,40,월 09:00~10:15 (S1),,",
+        "1학년,자료구조,3,3,,교수B,1002,10,40,화 09:00~10:15 (S1),,",
+        "1학년,운영체제,3,3,,교수C,2001,10,40,수 09:00~10:15 (S2),,",
+        "1학년,컴파일러,3,3,,교수D,3001,10,40,목 09:00~10:15 (S3),,",
+    ]
+    path = write_csv(tmp_path / "courses.csv", rows)
+    service = CourseService()
+    service.load_courses(str(path))
+    return service
+
+@pytest.fixture
+def config():
+    return ScheduleConfig(3, 9, [CourseFilter(name='자료구조')], [CourseFilter(name='운영체제')], [], [])
+
+def generate(course_service, config, cache_dir):
+    service = ScheduleService(course_service=course_service, result_cache=ResultCache(str(cache_dir)))
+    return service, service.generate_schedules(course_service.get_all_courses(), config)
+
+def ids_of(schedules):
+    return [sorted(c.course_id for c in s.courses) for s in schedules]
+
+# --- Tests ---
+
+def test_cache_hit_after_restart_skips_generator(course_service, config, tmp_path, monkeypatch):
+    _, first = generate(course_service, config, tmp_path / "cache")
+    assert first
+
+    # 새 서비스(재시작)에서는 생성기를 만들지 않고 저장된 결과 사용
+    def fail(*args, **kwargs):
+        raise AssertionError("생성기가 호출되면 안 됩니다")
+    monkeypatch.setattr(schedule_module, 'ScheduleGenerator', fail)
+    service, second = generate(course_service, config, tmp_path / "cache")
+    assert ids_of(second) == ids_of(first)
+
+    # 결과 화면 HTML도 저장 후 재사용
+    out = tmp_path / "out.html"
+    service.export_to_html(str(out), open_browser=False)
+    assert "자료구조" in out.read_text(encoding='utf-8')
+    restarted, _ = generate(course_service, config, tmp_path / "cache")
+    copied = tmp_path / "copied.html"
+    restarted.export_to_html(str(copied), open_browser=False)
+    assert copied.read_text(encoding='utf-8') == out.read_text(encoding='utf-8')
+
+def test_config_change_misses_cache(course_service, config, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    table = course_service.get_course_table()
+    key = cache.make_key(config, table)
+    generate(course_service, config, tmp_path / "cache")
+    assert cache.load(key, table) is not None
+
+    changed = config.clone()
+    changed.excluded_days = ['월']
+    assert cache.make_key(changed, table) != key
+    assert cache.load(cache.make_key(changed, table), table) is None
+
+def test_lru_eviction_by_size(course_service, config, tmp_path):
+    table = course_service.get_course_table()
+    service, _ = generate(course_service, config, tmp_path / "cache")
+    store_size = os.path.getsize(os.path.join(str(tmp_path / "cache"), os.listdir(str(tmp_path / "cache"))[0]))
+
+    # 항목 두 개만 들어가는 크기
+    cache = ResultCache(str(tmp_path / "small"), max_bytes=store_size * 2)
+    results = ResultStore.from_schedules(service.get_schedules(), table)
+    for key in ('a', 'b'):
+        cache.store(key, results, table)
+    os.utime(cache._path('a', 'json'), (1, 1))
+    os.utime(cache._path('b', 'json'), (2, 2))
+    assert cache.load('a', table) is not None  # 'a' 사용 → 가장 최근
+    cache.store('c', results, table)
+
+    assert cache.load('b', table) is None
+    assert cache.load('a', table) is not None
+    assert cache.load('c', table) is not None
+
+def test_html_from_older_viewer_is_not_reused(course_service, config, tmp_path, monkeypatch):
+    service, _ = generate(course_service, config, tmp_path / "cache")
+    service.export_to_html(str(tmp_path / "out.html"), open_browser=False)
+    cache = ResultCache(str(tmp_path / "cache"))
+    assert cache.html_path(service._cache_key) is not None
+
+    # 결과 화면 템플릿이 바뀐 빌드에서는 저장된 HTML 대신 새로 렌더링
+    monkeypatch.setattr(HtmlVisualizer, 'VIEWER_VERSION', 'upgraded')
+    assert cache.html_path(service._cache_key) is None
+    service.export_to_html(str(tmp_path / "new.html"), open_browser=False)
+    assert cache.html_path(service._cache_key) is not None
@@ -0,0 +1,100 @@
+import itertools
+import random
+import pytest
+from schedule_maker.core.models import Course, Schedule, TimeSlot
+from schedule_maker.services.result_pages import ResultPages, pin_key
+from schedule_maker.services.schedule_service import ScheduleService
+
+DAYS = ['월', '화', '수', '목', '금']
+
+# --- Fixtures ---
+
+def make_schedule(courses, filled=False):
+    schedule = Schedule()
+    for course in courses:
+        schedule.add_course(course)
+    schedule.has_random_filled = filled
+    return schedule
+
+@pytest.fixture
+def schedules():
+    math = Course('101', 'Math', 3, 'Prof. A', [TimeSlot('월', '09:00', '10:30')])
+    english = Course('102', 'English', 2, 'Prof. B', [TimeSlot('화', '10:00', '11:30')])
+    physics = Course('103', 'Physics', 3, 'Prof. C', [TimeSlot('수', '13:00', '15:00')])
+    return [make_schedule([math, english]), make_schedule([math, physics], True), make_schedule([english])]
+
+def random_schedules(seed, count=300):
+    rng = random.Random(seed)
+    sections = {
+        name: [Course(f"{name}{k}", name, 3, f"교수{k}", [TimeSlot(rng.choice(DAYS), f"{rng.choice([9, 10, 13]):02d}:00", "15:00")])
+               for k in range(3)]
+        for name in ('A', 'B', 'C', 'D')
+    }
+    result = []
+    for _ in range(count):
+        names = rng.sample(sorted(sections), rng.randint(1, 4))
+        result.append(make_schedule([rng.choice(sections[name]) for name in names]))
+    return result
+
+def brute_match(schedules, pins):
+    return [i for i, schedule in enumerate(schedules)
+            if all(any(c.name == name and pin_key(c) == key for c in schedule.courses) for name, key in pins.items())]
+
+# --- Tests ---
+
+def test_page_sends_only_new_sections(schedules):
+    pages = ResultPages(schedules, required_names=['Math'], desired_names=['Art'])
+
+    summary = pages.summary()
+    assert summary['count'] == 3
+    assert summary['all_names'] == ['Art', 'English', 'Math', 'Physics']
+    assert summary['required_names'] == ['Math']
+    assert summary['course_info']['Physics'][0] == 'Physics'
+
+    first = pages.page(0, 1)
+    assert first['section_base'] == 0
+    assert [s[0] for s in first['sections']] == ['Math', 'English', 'Physics']
+    assert first['schedules'] == [[[0, 1], 5, False]]
+
+    rest = pages.page(1, 10, known_sections=3)
+    assert rest['start'] == 1 and rest['sections'] == []
+    assert rest['schedules'] == [[[0, 2], 6, True], [[1], 2, False]]
+
+def test_extend_appends_to_index(schedules):
+    pages = ResultPages(schedules[:1])
+    assert pages.match({'English': '화 10:00'}) == [0]
+
+    assert pages.extend(schedules[1:]) == 3
+    assert pages.match({'English': '화 10:00'}) == [0, 2]
+    assert pages.page(0, 10, known_sections=2)['sections'][0][0] == 'Physics'
+
+def test_queries_match_brute_force():
+    schedules = random_schedules(3)
+    pages = ResultPages(schedules)
+    keys = sorted({(c.name, pin_key(c)) for s in schedules for c in s.courses})
+
+    for size in (0, 1, 2):
+        for combo in itertools.combinations(keys, size):
+            pins = dict(combo)
+            if len(pins) < size:
+                continue
+            expected = brute_match(schedules, pins)
+            assert pages.match(pins) == expected
+
+            for name in 'AB':
+                options = {pin_key(c) for i in expected for c in schedules[i].courses if c.name == name}
+                first = next((pin_key(c) for i in expected for c in schedules[i].courses if c.name == name), None)
+                assert pages.slot_options(name, pins)['available'] == sorted(options)
+                assert pages.first_slot(name, pins) == first
+
+def test_service_reuses_pages_until_results_change(schedules):
+    service = ScheduleService()
+    assert len(service.get_result_pages()) == 0
+
+    service._schedules = schedules
+    pages = service.get_result_pages()
+    assert len(pages) == 3
+    assert service.get_result_pages() is pages
+
+    service._schedules = schedules[:1]
+    assert len(service.get_result_pages()) == 1
@@ -0,0 +1,154 @@
+import pytest
+from schedule_maker.services.course_service import CourseService
+from schedule_maker.services.schedule_service import ScheduleService
+from schedule_maker.services import schedule_service as schedule_module
+from schedule_maker.core.config import ScheduleConfig, CourseFilter, ConfigChange, classify_change
+from schedule_maker.core.constants import SchedulerConfig
+
+# --- Fixtures ---
+
+@pytest.fixture
+def course_service(tmp_path, write_csv):
+    rows = [
+        "1학년,자료구조,3,3,,교수A,1001,10,40,월 09:00~10:15 (S1),,",
+        "1학년,자료구조,3,3,,교수B,1002,10,40,화 09:00~10:15 (S1),,",
+        "1학년,운영체제,3,3,,교수C,2001,10,40,수 09:00~10:15 (S2),,",
+        "1학년,운영체제,3,3,,교수D,2002,10,40,금 09:00~10:15 (S2),,",
+        "1학년,컴파일러,2,2,,교수E,3001,10,40,목 09:00~10:15 (S3),,",
+    ]
+    path = write_csv(tmp_path / "courses.csv", rows)
+    service = CourseService()
+    service.load_courses(str(path))
+    return service
+
+@pytest.fixture
+def config():
+    return ScheduleConfig(3, 9, [CourseFilter(name='자료구조')],
+                          [CourseFilter(name='운영체제'), CourseFilter(name='컴파일러')], [], [])
+
+def ids_of(schedules):
+    return sorted(sorted(c.course_id for c in s.courses) for s in schedules)
+
+def forbid_generator(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("생성기가 호출되면 안 됩니다")
+    monkeypatch.setattr(schedule_module, 'ScheduleGenerator', fail)
+
+def spy_generator(monkeypatch):
+    calls = []
+    original = schedule_module.ScheduleGenerator
+    def spy(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(schedule_module, 'ScheduleGenerator', spy)
+    return calls
+
+# --- Tests ---
+
+def test_classify_change(config):
+    tighter = config.clone()
+    tighter.excluded_days = ['월']
+    tighter.max_credits = 6
+    assert classify_change(config, config.clone()) == ConfigChange.SAME
+    assert classify_change(config, tighter) == ConfigChange.TIGHTENING
+    assert classify_change(tighter, config) == ConfigChange.OTHER
+
+    changed = config.clone()
+    changed.desired_filters = changed.desired_filters[:1]
+    assert classify_change(config, changed) == ConfigChange.OTHER
+
+    # 최소 학점 상향은 이전 결과에 없던 조합이 생길 수 있으므로 다시 탐색
+    higher_min = config.clone()
+    higher_min.min_credits = 6
+    assert classify_change(config, higher_min) == ConfigChange.OTHER
+
+def test_tightening_filters_previous_results(course_service, config, monkeypatch):
+    monkeypatch.setattr(SchedulerConfig, 'INCREMENTAL_MIN_RESULTS', 1)
+    service = ScheduleService(course_service=course_service)
+    first = service.generate_schedules(course_service.get_all_courses(), config)
+
+    tighter = config.clone()
+    tighter.excluded_days = ['금']
+    tighter.max_credits = 6
+    expected = [s for s in first if s.total_credits <= 6 and all(
+        slot.day != '금' for c in s.courses for slot in c.time_slots)]
+    assert expected
+
+    forbid_generator(monkeypatch)
+    result = service.generate_schedules(course_service.get_all_courses(), tighter)
+    assert ids_of(result) == ids_of(expected)
+    # 이전 결과의 Schedule 객체를 그대로 사용
+    assert all(any(s is prev for prev in first) for s in result)
+
+def test_few_survivors_are_topped_up_by_search(course_service, config, monkeypatch):
+    service = ScheduleService(course_service=course_service)
+    first = service.generate_schedules(course_service.get_all_courses(), config)
+    calls = spy_generator(monkeypatch)
+
+    # 이전 결과가 목표 개수 미만이어도 전체 탐색이라는 보장은 없으므로 추가 탐색
+    tighter = config.clone()
+    tighter.excluded_days = ['금']
+    result = service.generate_schedules(course_service.get_all_courses(), tighter)
+    assert len(calls) == 1
+    survivors = [s for s in first if all(slot.day != '금' for c in s.courses for slot in c.time_slots)]
+    assert set(map(tuple, ids_of(survivors))) <= set(map(tuple, ids_of(result)))
+
+def test_loosening_or_empty_survivors_searches_again(course_service, config, monkeypatch):
+    monkeypatch.setattr(SchedulerConfig, 'INCREMENTAL_MIN_RESULTS', 1)
+    service = ScheduleService(course_service=course_service)
+    service.generate_schedules(course_service.get_all_courses(), config)
+    calls = spy_generator(monkeypatch)
+
+    # 자료구조 분반이 모두 제외되면 생성기처럼 제외 조건 없이 다시 탐색
+    tighter = config.clone()
+    tighter.excluded_days = ['월', '화']
+    assert service.generate_schedules(course_service.get_all_courses(), tighter)
+    assert len(calls) == 1
+
+    # 조건 완화는 새로 탐색
+    looser = tighter.clone()
+    looser.excluded_days = []
+    looser.max_credits = 12
+    service.generate_schedules(course_service.get_all_courses(), looser)
+    assert len(calls) == 2
+
+def test_streamed_results_become_result_pages(course_service, config):
+    service = ScheduleService(course_service=course_service)
+    counts = []
+    def on_results(count):
+        counts.append(count)
+        # 생성 중에도 지금까지 찾은 결과를 조회 가능
+        assert len(service.get_result_pages()) == count
+    service.set_result_callback(on_results)
+
+    schedules = service.generate_schedules(course_service.get_all_courses(), config)
+    assert counts and counts[-1] == len(schedules)
+    pages = service.get_result_pages()
+    assert len(pages) == len(schedules)
+    assert pages.summary()['required_names'] == ['자료구조']
+    assert service.get_result_pages() is pages
+
+
+def test_results_share_display_order_with_export(course_service, config, monkeypatch, tmp_path):
+    # 섞는 순서를 고정 (뒤집기)해서 생성 순서와 표시 순서를 구분
+    monkeypatch.setattr(schedule_module.random, 'shuffle', lambda items: items.reverse())
+    exported = {}
+    def fake_generate_html(schedules, output_file, required_names=None, desired_names=None, shuffle=True):
+        exported['schedules'] = list(schedules)
+        exported['shuffle'] = shuffle
+    monkeypatch.setattr(schedule_module, 'generate_html', fake_generate_html)
+
+    service = ScheduleService(course_service=course_service)
+    streamed = []
+    service.set_result_callback(lambda count: streamed.append(service.get_result_pages()))
+    schedules = service.generate_schedules(course_service.get_all_courses(), config)
+
+    # 생성이 끝나면 결과 화면 데이터를 표시 순서로 다시 구성
+    pages = service.get_result_pages()
+    assert streamed and pages is not streamed[-1] and len(pages) > 1
+    assert [pages.schedule(i) for i in range(len(pages))] == \
+        [streamed[-1].schedule(i) for i in reversed(range(len(pages)))]
+
+    # 내보낸 HTML은 다시 섞지 않고 앱 안 결과 화면과 같은 순서
+    service.export_to_html(str(tmp_path / 'out.html'), open_browser=False)
+    assert exported == {'schedules': schedules, 'shuffle': False}
@@ -1,5 +1,5 @@
 import pytest
-from schedule_maker.services.scheduler import ScheduleGenerator
+from schedule_maker.services.scheduler import ScheduleGenerator, GenerationError
 from schedule_maker.core.models import Course, TimeSlot
 from schedule_maker.core.config import ScheduleConfig, CourseFilter
 
@@ -105,3 +105,59 @@ def test_credit_limit_enforcement(mock_courses, basic_config):
     for sched in results:
         assert sched.total_credits <= 5
         assert len(sched.courses) == 1 # Only Math fits
+
+def test_required_conflict_is_explained(mock_courses, basic_config):
+    # Math(101)와 Math (B)(106)는 월요일에 겹침, Physics는 무관, 화요일 제외는 원인이 아님
+    basic_config.required_filters = [
+        CourseFilter(course_id='101'), CourseFilter(name='Physics'), CourseFilter(course_id='106')
+    ]
+    basic_config.excluded_days = ['화']
+    generator = ScheduleGenerator(mock_courses, basic_config)
+
+    with pytest.raises(GenerationError) as excinfo:
+        generator.generate_all_schedules()
+
+    conflict = excinfo.value.conflict
+    assert [f.course_id for f in conflict.filters] == ['101', '106']
+    assert conflict.excluded_days == []
+    assert "충돌 원인" in str(excinfo.value)
+
+def test_warm_start_reuses_still_valid_results(mock_courses, basic_config):
+    basic_config.required_filters = [CourseFilter(course_id='101')]
+    basic_config.desired_filters = [CourseFilter(name='English'), CourseFilter(name='Physics')]
+    basic_config.max_credits = 9
+    first = ScheduleGenerator(mock_courses, basic_config).generate_all_schedules()
+
+    # 수요일 제외(Physics 불가) + 희망 강의 History 추가
+    config = basic_config.clone()
+    config.excluded_days = ['수']
+    config.desired_filters.append(CourseFilter(name='History'))
+    still_valid = [s.get_content_hash() for s in first
+                   if all(c.name != 'Physics' for c in s.courses)]
+    assert still_valid
+
+    generator = ScheduleGenerator(mock_courses, config)
+    generator.warm_start(first)
+    results = generator.generate_all_schedules()
+
+    signatures = [s.get_content_hash() for s in results]
+    # 아직 유효한 이전 조합이 먼저, 중복 없이
+    assert signatures[:len(still_valid)] == still_valid
+    assert len(set(signatures)) == len(signatures)
+    assert all(c.name != 'Physics' for s in results for c in s.courses)
+    # 새로 열린 영역(History 추가)도 탐색
+    assert any('History' in s.course_names for s in results)
+
+def test_result_callback_streams_results_in_order(mock_courses, basic_config, monkeypatch):
+    from schedule_maker.core.constants import SchedulerConfig
+    monkeypatch.setattr(SchedulerConfig, 'RESULT_STREAM_INTERVAL', 3600)
+    monkeypatch.setattr(SchedulerConfig, 'RESULT_STREAM_BATCH', 5)
+    basic_config.desired_filters = [CourseFilter(name=c.name) for c in mock_courses]
+
+    batches = []
+    results = ScheduleGenerator(mock_courses, basic_config).generate_all_schedules(result_callback=batches.append)
+
+    # 첫 결과는 바로, 이후 묶음으로, 종료 시 나머지까지 (순서 유지, 중복 없음)
+    assert len(batches[0]) >= 1
+    assert len(batches) > 2
+    assert [s for batch in batches for s in batch] == results
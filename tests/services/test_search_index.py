@@ -0,0 +1,65 @@
+import pytest
+from schedule_maker.core.models import Course, TimeSlot
+from schedule_maker.core.course_table import CourseTable
+from schedule_maker.core.constants import SearchMode
+from schedule_maker.services.search_index import CourseSearchIndex, substring_distance
+
+def linear_search(table, query, by_name=True, by_professor=True):
+    """기존 선형 부분 문자열 검색 (기준 동작)"""
+    return [
+        row for row, course in zip(table.active_rows.tolist(), table)
+        if (by_name and query in course.name.lower())
+        or (by_professor and query in course.professor.lower())
+    ]
+
+# --- Fixtures ---
+
+@pytest.fixture
+def table():
+    slot = [TimeSlot('월', '09:00', '10:00')]
+    return CourseTable.from_courses([
+        Course('1', '프로그래밍기초', 3, '김민수', slot),
+        Course('2', '고급프로그래밍', 3, '이영희', slot),
+        Course('3', 'AI개론', 3, '김민', slot),
+        Course('4', '영어회화1', 2, 'John Smith', slot),
+        Course('5', '프로그래밍기초', 3, '박프로', slot),
+    ])
+
+# --- Tests ---
+
+@pytest.mark.parametrize("query", ["프", "프로", "프로그래밍", "그래프", "김민", "ai", "smith", "h", "회화1", "없는강의"])
+@pytest.mark.parametrize("by_name,by_professor", [(True, True), (True, False), (False, True)])
+def test_matches_linear_search(table, query, by_name, by_professor):
+    index = CourseSearchIndex(table)
+    rows = index.search_rows(query, by_name, by_professor).tolist()
+    assert rows == linear_search(table, query, by_name, by_professor)
+
+def test_index_follows_catalog_patch(table):
+    index = CourseSearchIndex(table)
+    assert index.search_rows("데이터").tolist() == []
+
+    courses = [table.to_course(row) for row in table.active_rows.tolist()]
+    courses = courses[1:] + [Course('6', '데이터베이스', 3, '최교수', [TimeSlot('화', '09:00', '10:00')])]
+    table.patch(table.diff(courses))
+
+    assert [table.course_ids[r] for r in index.search_rows("데이터")] == ['6']
+    assert [table.course_ids[r] for r in index.search_rows("기초")] == ['5']  # 삭제된 1번 제외
+
+def ids(table, rows):
+    return [table.course_ids[r] for r in rows]
+
+def test_choseong_search(table):
+    index = CourseSearchIndex(table)
+    assert ids(table, index.search_rows("ㅇㅇㅎㅎ", mode=SearchMode.CHOSEONG)) == ['4']
+    assert ids(table, index.search_rows("영ㅇ", mode=SearchMode.CHOSEONG)) == ['4']
+    # 앞에서 일치하는 강의가 먼저 (프로그래밍기초 → 고급프로그래밍)
+    assert ids(table, index.search_rows("ㅍㄹㄱ", True, False, mode=SearchMode.CHOSEONG)) == ['1', '5', '2']
+    # 초성이 없으면 일반 검색과 같음
+    assert ids(table, index.search_rows("기초", mode=SearchMode.CHOSEONG)) == ['1', '5']
+
+def test_fuzzy_search_ranks_by_distance(table):
+    index = CourseSearchIndex(table)
+    assert ids(table, index.search_rows("영어호화", mode=SearchMode.FUZZY)) == ['4']
+    assert ids(table, index.search_rows("프로그레밍", True, False, mode=SearchMode.FUZZY)) == ['1', '2', '5']
+    assert substring_distance("ㅎㅚ", "ㅇㅕㅇㅇㅓㅎㅚㅎㅘ") == 0
+    assert substring_distance("ㅎㅗㅎㅘ", "ㅇㅕㅇㅇㅓㅎㅚㅎㅘ") == 1
@@ -0,0 +1,79 @@
+import base64
+import json
+import numpy as np
+import pytest
+from schedule_maker.core.models import Course, Schedule, TimeSlot
+from schedule_maker.services.visualizer import build_schedule_payload, generate_html
+
+# --- Fixtures ---
+
+@pytest.fixture
+def schedules():
+    math = Course('101', 'Math', 3, 'Prof. A', [TimeSlot('월', '09:00', '10:30')])
+    english = Course('102', 'English', 2, 'Prof. B', [TimeSlot('화', '10:00', '11:30'), TimeSlot('목', '10:00', '11:30')])
+    physics = Course('103', 'Physics', 3, 'Prof. C', [TimeSlot('수', '13:00', '15:00')])
+    result = []
+    for courses, filled in (([math, english], False), ([math, physics], True), ([english], False)):
+        schedule = Schedule()
+        for course in courses:
+            schedule.add_course(course)
+        schedule.has_random_filled = filled
+        result.append(schedule)
+    return result
+
+def decode(payload, key, dtype):
+    return np.frombuffer(base64.b64decode(payload[key]), dtype=dtype).tolist()
+
+# --- Tests ---
+
+def test_payload_stores_each_section_once(schedules):
+    payload = build_schedule_payload(schedules)
+
+    assert [section[0] for section in payload['sections']] == ['Math', 'English', 'Physics']
+    assert payload['sections'][1] == ['English', 2, 'Prof. B', [['화', '10:00', '11:30'], ['목', '10:00', '11:30']]]
+    assert payload['index_type'] == 'u16'
+    assert decode(payload, 'rows', '<u2') == [0, 1, 0, 2, 1]
+    assert decode(payload, 'offsets', '<u4') == [0, 2, 4, 5]
+    assert decode(payload, 'credits', np.uint8) == [5, 6, 2]
+    assert decode(payload, 'filled', np.uint8) == [0, 1, 0]
+
+def test_generated_html_embeds_payload(schedules, tmp_path):
+    output = tmp_path / "result.html"
+    generate_html(schedules, str(output), {'Math'}, {'English'})
+    html = output.read_text(encoding='utf-8')
+
+    assert 'PLACEHOLDER' not in html
+    start = html.index('const schedulePayload = ') + len('const schedulePayload = ')
+    payload = json.JSONDecoder().raw_decode(html[start:])[0]
+    assert len(payload['sections']) == 3
+    assert len(decode(payload, 'credits', np.uint8)) == 3
+
+def test_pin_index_lists_schedules_per_first_slot(schedules):
+    payload = build_schedule_payload(schedules)
+
+    assert payload['id_type'] == 'u16'
+    pins = {name: {key: np.frombuffer(base64.b64decode(ids), dtype='<u2').tolist() for key, ids in slots.items()}
+            for name, slots in payload['pins'].items()}
+    assert pins == {
+        'Math': {'월 09:00': [0, 1]},
+        'English': {'화 10:00': [0, 2]},
+        'Physics': {'수 13:00': [1]},
+    }
+    assert payload['course_info'] == {'Math': 0, 'English': 1, 'Physics': 2}
+
+def test_streamed_payload_matches_dict(schedules, monkeypatch):
+    import io
+    from schedule_maker.services import visualizer
+    # 작은 조각으로 나눠 써도 전체 인코딩과 같아야 함
+    monkeypatch.setattr(visualizer, 'B64_CHUNK_BYTES', 3)
+    many = schedules * 50
+    buffer = io.StringIO()
+    visualizer.write_schedule_payload(buffer, many)
+    assert json.loads(buffer.getvalue()) == build_schedule_payload(many)
+
+def test_template_is_split_at_placeholders():
+    from schedule_maker.services.visualizer import HtmlVisualizer
+    parts = HtmlVisualizer.TEMPLATE_PARTS
+    assert len(parts) == 4
+    assert not any('PLACEHOLDER' in part for part in parts)
+    assert parts[0].rstrip().endswith('const schedulePayload =')
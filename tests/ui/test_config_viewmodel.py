@@ -1,6 +1,11 @@
+import threading
+import numpy as np
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from schedule_maker.ui.viewmodels.config_viewmodel import ConfigViewModel
 from schedule_maker.core.config import ScheduleConfig, CourseFilter
+from schedule_maker.core.models import Course, TimeSlot
+from schedule_maker.core.course_table import CourseTable
 
 # --- Mocks ---
 
@@ -40,6 +45,28 @@ class MockConfigService:
     def update_excluded_days(self, days):
         self._config.excluded_days = days
 
+class MockCourseService:
+    """두 강의가 화요일에만 겹치는 카탈로그"""
+    def __init__(self):
+        self.table = CourseTable.from_courses([
+            Course('1001', '자료구조', 3, 'Kim', [TimeSlot('월', '09:00', '10:15')]),
+            Course('1002', '자료구조', 3, 'Lee', [TimeSlot('화', '09:00', '10:15')]),
+            Course('2001', '운영체제', 3, 'Park', [TimeSlot('화', '09:00', '10:15')]),
+        ])
+        self.loaded = True
+
+    def is_loaded(self):
+        return self.loaded
+
+    def get_course_table(self):
+        return self.table
+
+    def resolve_filter_rows(self, course_filter):
+        return np.array([row for row in self.table.active_rows if course_filter.matches(self.table[row])])
+
+    def resolve_filter(self, course_filter):
+        return self.table.views(self.resolve_filter_rows(course_filter))
+
 # --- Tests ---
 
 @pytest.fixture
@@ -105,3 +132,84 @@ def test_dirty_flag_notification(vm):
     
     # Should be dirty now (assuming original was 10-20)
     assert flags[-1] is True
+
+def test_feasibility_is_checked_in_background():
+    config_service = MockConfigService()
+    config_service._config.required_filters = [CourseFilter(name='자료구조'), CourseFilter(name='운영체제')]
+    delivered = []
+    vm = ConfigViewModel(
+        config_service, MockCourseService(),
+        executor=ThreadPoolExecutor(max_workers=1),
+        dispatcher=delivered.append
+    )
+    vm.set_interaction_service(MockInteractionService())
+    received_status = []
+    vm.bind('validation_status', received_status.append)
+
+    vm.set_credits("6", "18")
+    vm.wait_for_validation(timeout=2)
+    delivered.pop()()
+    assert received_status[-1] == (True, "")
+
+    # 월요일 제외 → 자료구조 화요일 분반만 남아 운영체제와 충돌
+    vm.set_excluded_day('월', True)
+    vm.wait_for_validation(timeout=2)
+    delivered.pop()()
+    assert received_status[-1][0] is False
+    assert "시간 충돌" in received_status[-1][1]
+
+def test_feasibility_waits_for_catalog_load():
+    config_service = MockConfigService()
+    config_service._config.required_filters = [CourseFilter(name='자료구조'), CourseFilter(name='운영체제')]
+    config_service._config.excluded_days = ['월']
+    course_service = MockCourseService()
+    course_service.loaded = False
+    vm = ConfigViewModel(config_service, course_service)
+    vm.set_interaction_service(MockInteractionService())
+    received_status = []
+    vm.bind('validation_status', received_status.append)
+
+    # 로드 전: 빈 카탈로그 기준 '필수 강의를 찾을 수 없음' 대신 검사 보류
+    vm.load_data()
+    assert received_status[-1] == (True, "")
+    assert vm.get_validation_status() == (True, "")
+
+    # 로드 후 다시 불러오면 검사
+    course_service.loaded = True
+    vm.load_data()
+    assert received_status[-1][0] is False
+    assert "시간 충돌" in received_status[-1][1]
+
+def test_generate_waits_for_background_check_without_running_it():
+    config_service = MockConfigService()
+    config_service._config.required_filters = [CourseFilter(name='자료구조'), CourseFilter(name='운영체제')]
+    delivered = []
+    vm = ConfigViewModel(
+        config_service, MockCourseService(),
+        executor=ThreadPoolExecutor(max_workers=1),
+        dispatcher=delivered.append
+    )
+    vm.set_interaction_service(MockInteractionService())
+    vm.set_credits("6", "18")
+    vm.wait_for_validation(timeout=2)
+    delivered.pop()()
+
+    # 검사를 실행한 스레드 기록
+    threads = []
+    check = vm.feasibility_checker.check
+    def spy(config):
+        threads.append(threading.current_thread())
+        return check(config)
+    vm.feasibility_checker.check = spy
+
+    # 편집 직후 생성 요청: UI 스레드에서 검사하지 않고 백그라운드 결과를 기다림
+    vm.set_excluded_day('월', True)
+    statuses = []
+    vm.request_validation_status(statuses.append)
+    assert vm.validation_pending and statuses == []
+
+    vm.wait_for_validation(timeout=2)
+    delivered.pop()()
+    assert statuses[-1][0] is False and "시간 충돌" in statuses[-1][1]
+    assert vm.get_validation_status() == statuses[-1]
+    assert threading.main_thread() not in threads
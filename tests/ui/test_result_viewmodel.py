@@ -0,0 +1,133 @@
+import pytest
+from schedule_maker.core.models import Course, Schedule, TimeSlot
+from schedule_maker.services.result_pages import ResultPages
+from schedule_maker.ui.viewmodels.result_viewmodel import ResultViewModel
+
+# --- Mocks ---
+
+class MockInteractionService:
+    def __init__(self):
+        self.errors = []
+        self.infos = []
+
+    def show_error(self, title, message):
+        self.errors.append((title, message))
+
+    def show_info(self, title, message):
+        self.infos.append((title, message))
+
+class MockScheduleService:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_result_pages(self):
+        return self.pages
+
+def make_schedule(*courses):
+    schedule = Schedule()
+    for course in courses:
+        schedule.add_course(course)
+    return schedule
+
+# --- Fixtures ---
+
+MATH_MON = Course('101', 'Math', 3, 'Prof. A', [TimeSlot('월', '09:00', '10:30')])
+MATH_TUE = Course('102', 'Math', 3, 'Prof. B', [TimeSlot('화', '09:00', '10:30')])
+ENG_MON = Course('201', 'English', 2, 'Prof. C', [TimeSlot('월', '13:00', '14:30')])
+ENG_WED = Course('202', 'English', 2, 'Prof. D', [TimeSlot('수', '13:00', '14:30')])
+ART = Course('301', 'Art', 2, 'Prof. E', [TimeSlot('목', '15:00', '17:00')])
+
+@pytest.fixture
+def schedules():
+    return [
+        make_schedule(MATH_MON, ENG_MON),
+        make_schedule(MATH_TUE, ENG_MON),
+        make_schedule(MATH_MON, ENG_WED, ART),
+        make_schedule(MATH_TUE),
+    ]
+
+@pytest.fixture
+def vm(schedules):
+    service = MockScheduleService(ResultPages(schedules, required_names=['Math'], desired_names=['History']))
+    vm = ResultViewModel(service)
+    vm.set_interaction_service(MockInteractionService())
+    vm.views = []
+    vm.bind('view', vm.views.append)
+    vm.refresh()
+    return vm
+
+# --- Tests ---
+
+def test_navigation_wraps_around(vm):
+    assert (vm.view.index, vm.view.position, vm.view.total) == (0, 1, 4)
+    assert sorted((b.name, b.day) for b in vm.view.blocks) == [('English', '월'), ('Math', '월')]
+
+    vm.prev_schedule()
+    assert vm.view.index == 3
+    vm.next_schedule()
+    vm.next_schedule()
+    assert vm.view.index == 1
+
+def test_pin_filters_and_rotates(vm):
+    # 현재 조합의 시간대로 고정 → 조건 안에서만 순환
+    vm.select_course('Math')
+    assert vm.pins == {'Math': '월 09:00'}
+    assert (vm.view.index, vm.view.position, vm.view.total, vm.view.pinned_count) == (0, 1, 2, 1)
+    vm.next_schedule()
+    assert vm.view.index == 2
+    vm.next_schedule()
+    assert vm.view.index == 0
+
+    # 고정된 강의를 다시 클릭하면 다음 시간대로 이동
+    vm.select_course('Math')
+    assert vm.pins == {'Math': '화 09:00'}
+    assert vm.view.index == 1
+
+    # 현재 조합에 없는 강의는 조건 안의 첫 시간대로 고정
+    vm.select_course('Art')
+    assert vm._interaction_service.errors[-1][0] == "유일한 시간대입니다."
+    assert vm.pins == {'Math': '화 09:00'}
+
+    vm.unpin('Math')
+    assert vm.pins == {} and vm.view.total == 4
+
+def test_rotation_blocked_by_other_pins(vm):
+    vm.next_schedule()
+    vm.next_schedule()  # Math 월 + English 수 + Art
+    vm.select_course('English')
+    vm.select_course('Art')
+    assert vm.view.total == 1
+    vm.select_course('English')
+    assert vm._interaction_service.errors[-1][0] == "이동 불가 (시간 중복)"
+    assert vm.pins['English'] == '수 13:00'
+
+    # 고정 모두 해제해도 보던 조합 유지
+    vm.clear_pins()
+    assert (vm.view.index, vm.view.total) == (2, 4)
+
+def test_course_list_order(vm):
+    vm.next_schedule()
+    vm.next_schedule()
+    vm.select_course('English')
+    entries = [(e.name, e.required, e.active, e.pinned, e.slot) for e in vm.view.courses]
+    assert entries == [
+        ('Math', True, True, False, '월 09:00'),
+        ('English', False, True, True, '수 13:00'),
+        ('Art', False, True, False, '목 15:00'),
+        ('History', False, False, False, None),
+    ]
+    assert vm.view.courses[-1].credits == '-'
+
+def test_appended_results_keep_position_and_pins(vm, schedules):
+    vm.select_course('Math')
+    vm.next_schedule()
+    assert vm.view.index == 2
+
+    vm.schedule_service.pages.extend([make_schedule(MATH_MON, ART)])
+    vm.refresh()
+    assert (vm.view.index, vm.view.position, vm.view.total) == (2, 2, 3)
+
+    # 새 결과는 처음부터
+    vm.schedule_service.pages = ResultPages(schedules[:1])
+    vm.refresh()
+    assert vm.pins == {} and (vm.view.index, vm.view.total) == (0, 1)
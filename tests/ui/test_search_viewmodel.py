@@ -0,0 +1,160 @@
+import threading
+import numpy as np
+import pytest
+from schedule_maker.core.models import Course, TimeSlot
+from schedule_maker.core.course_table import CourseTable
+from schedule_maker.core.course_query import CourseQueryEngine
+from schedule_maker.ui.viewmodels.search_viewmodel import SearchViewModel
+from schedule_maker.core.exceptions import SearchCancelled
+
+# --- Mocks ---
+
+NAMES = ["자료구", "느린", "빠른", "이전", "현재"]
+
+class MockCourseService:
+    """검색어와 같은 이름의 강의 행을 돌려주는 서비스 (block_on 검색어는 release될 때까지 대기)"""
+    def __init__(self, block_on=None):
+        self.table = CourseTable.from_courses([
+            Course(str(i), name, 3, "Prof", []) for i, name in enumerate(NAMES)
+        ])
+        self.queries = []
+        self.block_on = block_on
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.cancelled = []
+
+    def get_course_table(self):
+        return self.table
+
+    def search_rows(self, query='', search_by_name=True, search_by_professor=True, mode=None, cancel_check=None):
+        self.queries.append(query)
+        if query == self.block_on:
+            self.started.set()
+            self.release.wait(2)
+            if cancel_check and cancel_check():
+                self.cancelled.append(query)
+                raise SearchCancelled()
+        if not query:
+            return self.table.active_rows
+        return np.array([self.table.row_of(str(NAMES.index(query)))])
+
+    def query_courses(self, query, with_facets=False):
+        return CourseQueryEngine(self.table).query(query, with_facets)
+
+def make_vm(service, debounce_ms=0):
+    vm = SearchViewModel(service, dispatcher=lambda fn: fn(), debounce_ms=debounce_ms)
+    delivered = []
+    vm.bind('results', lambda rows: delivered.append([row[1] for row in rows]))
+    return vm, delivered
+
+# --- Tests ---
+
+def test_debounce_runs_only_last_query():
+    service = MockCourseService()
+    vm, delivered = make_vm(service, debounce_ms=50)
+
+    for text in ["자", "자료", "자료구"]:
+        vm.query = text
+        vm.search_async()
+    vm.wait_for_search(timeout=2)
+
+    assert service.queries == ["자료구"]
+    assert delivered == [["자료구"]]
+    assert [c.name for c in vm.results] == ["자료구"]
+
+def test_newer_query_cancels_running_search():
+    service = MockCourseService(block_on="느린")
+    vm, delivered = make_vm(service)
+
+    vm.query = "느린"
+    vm.search_async(debounce=False)
+    assert service.started.wait(2)
+
+    # 첫 검색이 진행 중일 때 새 검색 요청
+    vm.query = "빠른"
+    vm.search_async(debounce=False)
+    service.release.set()
+    vm.wait_for_search(timeout=2)
+
+    assert service.cancelled == ["느린"]
+    assert delivered == [["빠른"]]
+
+def test_sync_search_invalidates_pending_async():
+    service = MockCourseService(block_on="이전")
+    vm, delivered = make_vm(service)
+
+    vm.query = "이전"
+    vm.search_async(debounce=False)
+    assert service.started.wait(2)
+
+    vm.query = "현재"
+    vm.perform_search()
+    service.release.set()
+    vm.wait_for_search(timeout=2)
+
+    assert delivered == [["현재"]]
+
+def test_sort_cycles_through_rank_order():
+    service = MockCourseService()
+    service.table = CourseTable.from_courses([
+        Course('3', 'B', 2, 'Kim', [TimeSlot('화', '09:00', '10:00')]),
+        Course('1', 'A', 3, 'Lee', [TimeSlot('월', '09:00', '10:00')]),
+        Course('2', 'A', 1, 'Park', []),
+    ])
+    vm, delivered = make_vm(service)
+    vm.perform_search()
+    ids = lambda: [c.course_id for c in vm.results]
+
+    vm.toggle_sort('Name')      # 오름차순 (같은 이름은 기존 순서 유지)
+    assert ids() == ['1', '2', '3']
+    vm.toggle_sort('Name')      # 내림차순
+    assert ids() == ['3', '1', '2']
+    vm.toggle_sort('Name')      # 원래 순서
+    assert ids() == ['3', '1', '2']
+
+    vm.toggle_sort('Credits')
+    assert ids() == ['2', '3', '1']
+    vm.toggle_sort('Time')      # 시간 없는 강의가 먼저, 이후 첫 강의시간 문자열 순
+    assert ids() == ['2', '1', '3']
+    assert delivered[-1] == ['A', 'A', 'B']
+
+def test_facet_filter_narrows_results_and_reports_counts():
+    service = MockCourseService()
+    service.table = CourseTable.from_courses([
+        Course('1', 'A', 3, 'Kim', [TimeSlot('화', '09:00', '10:00')]),
+        Course('2', 'B', 2, 'Lee', [TimeSlot('월', '09:00', '10:00')]),
+        Course('3', 'C', 3, 'Park', [TimeSlot('목', '09:00', '10:00')]),
+    ])
+    vm, delivered = make_vm(service)
+    facets = []
+    vm.bind('facets', facets.append)
+
+    vm.set_facet_filter('only_days', {'화', '목'})
+    vm.perform_search()
+    assert delivered[-1] == ['A', 'C']
+    assert facets[-1]['credits'] == {3: 2}
+    assert facets[-1]['days']['월'] == 3   # 월을 추가 선택했을 때의 결과 수
+    assert facets[-1]['days']['화'] == 2
+
+    vm.set_facet_filter('only_days', None)
+    vm.perform_search()
+    assert delivered[-1] == ['A', 'B', 'C']
+
+def test_debounce_reuses_one_thread_and_shuts_down():
+    service = MockCourseService()
+    vm, delivered = make_vm(service, debounce_ms=30)
+
+    before = threading.active_count()
+    for text in ["이", "이전", "현", "현재"]:
+        vm.query = text
+        vm.search_async()
+    # 입력마다 타이머 스레드를 만들지 않음 (대기 스레드 + 검색 실행기)
+    assert threading.active_count() <= before + 2
+    vm.wait_for_search(timeout=2)
+    assert service.queries == ["현재"]
+
+    vm.shutdown()
+    vm.query = "종료 후"
+    vm.search_async()
+    vm.wait_for_search(timeout=2)
+    assert delivered == [["현재"]]